@@ -1,8 +1,10 @@
 import logging
 
+import numpy as np
 import scipy.sparse as sp
 
 from pySDC.core.Errors import UnlockError
+from pySDC.core.Level import NodeStorage
 from pySDC.helpers.pysdc_helper import FrozenClass
 from pySDC.core.Lagrange import LagrangeApproximation
 
@@ -11,6 +13,7 @@ from pySDC.core.Lagrange import LagrangeApproximation
 class _Pars(FrozenClass):
     def __init__(self, pars):
         self.finter = False
+        self.fused = False  # transfer all nodes at once for datatypes based on numpy arrays
         for k, v in pars.items():
             setattr(self, k, v)
 
@@ -102,6 +105,9 @@ class base_transfer(object):
         if not F.status.unlocked:
             raise UnlockError('fine level is still locked, cannot use data from there')
 
+        if self.params.fused and self.restrict_fused():
+            return None
+
         # restrict fine values in space
         tmp_u = []
         for m in range(1, SF.coll.num_nodes + 1):
@@ -109,6 +115,8 @@ class base_transfer(object):
 
         # restrict collocation values
         G.u[0] = self.space_transfer.restrict(F.u[0])
+        G.status.u0_origin = None
+        G.status.uend_stale = True
         for n in range(1, SG.coll.num_nodes + 1):
             G.u[n] = self.Rcoll[n - 1, 0] * tmp_u[0]
             for m in range(1, SF.coll.num_nodes):
@@ -184,18 +192,21 @@ class base_transfer(object):
         # only of the level is unlocked at least by prediction or restriction
         if not G.status.unlocked:
             raise UnlockError('coarse level is still locked, cannot use data from there')
+        F.status.uend_stale = True
 
         # build coarse correction
+        if self.params.fused and self.prolong_values_fused(F.u, G.u, G.uold):
+            pass
+        else:
+            # interpolate values in space first
+            tmp_u = []
+            for m in range(1, SG.coll.num_nodes + 1):
+                tmp_u.append(self.space_transfer.prolong(G.u[m] - G.uold[m]))
 
-        # interpolate values in space first
-        tmp_u = []
-        for m in range(1, SG.coll.num_nodes + 1):
-            tmp_u.append(self.space_transfer.prolong(G.u[m] - G.uold[m]))
-
-        # interpolate values in collocation
-        for n in range(1, SF.coll.num_nodes + 1):
-            for m in range(SG.coll.num_nodes):
-                F.u[n] += self.Pcoll[n - 1, m] * tmp_u[m]
+            # interpolate values in collocation
+            for n in range(1, SF.coll.num_nodes + 1):
+                for m in range(SG.coll.num_nodes):
+                    F.u[n] += self.Pcoll[n - 1, m] * tmp_u[m]
 
         # re-evaluate f on fine level
         for m in range(1, SF.coll.num_nodes + 1):
@@ -221,6 +232,15 @@ class base_transfer(object):
         # only of the level is unlocked at least by prediction or restriction
         if not G.status.unlocked:
             raise UnlockError('coarse level is still locked, cannot use data from there')
+        F.status.uend_stale = True
+
+        if (
+            self.params.fused
+            and self.fused_available(F.f, G.f, G.fold)
+            and self.prolong_values_fused(F.u, G.u, G.uold)
+            and self.prolong_values_fused(F.f, G.f, G.fold)
+        ):
+            return None
 
         # build coarse correction
 
@@ -238,3 +258,162 @@ class base_transfer(object):
                 F.f[n] += self.Pcoll[n - 1, m] * tmp_f[m]
 
         return None
+
+    @staticmethod
+    def fused_available(*args):
+        """
+        Check if values at the nodes can be transferred with the fused kernels, which requires datatypes based on numpy
+        arrays
+
+        Args:
+            *args (list): values at the nodes, including the left boundary
+
+        Returns:
+            bool: True if all values are set and are numpy arrays
+        """
+        return all(all(isinstance(values[m], np.ndarray) for m in range(1, len(values))) for values in args)
+
+    @staticmethod
+    def get_stacked(values, start=0):
+        """
+        Get the values at the nodes as a single array of shape (M, *shape). Values held in contiguous storage of the
+        level are not copied.
+
+        Args:
+            values (list): values at the nodes
+            start (int): index of the first node
+
+        Returns:
+            numpy.ndarray: the stacked values
+        """
+        if isinstance(values, NodeStorage) and values.contiguous and values.allocated:
+            if all(values.valid(m) for m in range(start, len(values))):
+                return values.stack()[start:]
+        return np.array([np.asarray(values[m]) for m in range(start, len(values))])
+
+    @staticmethod
+    def set_stacked(values, stack, template, start=0):
+        """
+        Write stacked values to the nodes
+
+        Args:
+            values (list): values at the nodes
+            stack (numpy.ndarray): the new values of shape (M, *shape)
+            template (dtype_u or dtype_f): data object whose type and attributes, e.g. the communicator, are used
+            start (int): index of the first node
+
+        Returns:
+            None
+        """
+        # contiguous storage copies the values into its own memory, otherwise we need independent objects
+        copy = not (isinstance(values, NodeStorage) and values.contiguous)
+        nodes = stack.view(type(template))
+        nodes.__dict__.update(getattr(template, '__dict__', {}))
+        for m in range(len(stack)):
+            values[start + m] = nodes[m].copy() if copy else nodes[m]
+
+    def collocation_matmul(self, mat, stack):
+        """
+        Apply a collocation transfer matrix to stacked values via a single dense matrix-matrix product
+
+        Args:
+            mat (numpy.ndarray): transfer matrix of shape (M_target, M_source)
+            stack (numpy.ndarray): values of shape (M_source, *shape)
+
+        Returns:
+            numpy.ndarray: values of shape (M_target, *shape)
+        """
+        return (mat @ stack.reshape(stack.shape[0], -1)).reshape((mat.shape[0],) + stack.shape[1:])
+
+    def restrict_fused(self):
+        """
+        Space-time restriction for datatypes based on numpy arrays, which restricts the values at all nodes in space
+        with one product of the sparse restriction matrix with the stacked values and in collocation with one dense
+        matrix-matrix product. The result is the same as with `restrict` up to rounding errors.
+
+        Returns:
+            bool: True if the fused restriction was done, False if the datatypes or the space transfer do not support it
+        """
+
+        # get data for easier access
+        F = self.fine
+        G = self.coarse
+
+        PG = G.prob
+
+        SF = F.sweep
+        SG = G.sweep
+
+        if not self.fused_available(F.u):
+            return False
+
+        # restrict fine values in space and collocation
+        tmp_u = self.space_transfer.restrict_stacked(self.get_stacked(F.u, 1))
+        if tmp_u is None:
+            return False
+        G.u[0] = self.space_transfer.restrict(F.u[0])
+        G.status.u0_origin = None
+        G.status.uend_stale = True
+        self.set_stacked(G.u, self.collocation_matmul(self.Rcoll, tmp_u), template=G.u[0], start=1)
+
+        # re-evaluate f on coarse level
+        G.f[0] = PG.eval_f(G.u[0], G.time)
+        for m in range(1, SG.coll.num_nodes + 1):
+            G.f[m] = PG.eval_f(G.u[m], G.time + G.dt * SG.coll.nodes[m - 1])
+
+        # build coarse and fine level tau correction parts
+        tauG = SG.integrate_stacked()
+        tauG = self.get_stacked(SG.integrate()) if tauG is None else tauG
+        tauF = SF.integrate_stacked()
+        tauF = self.get_stacked(SF.integrate()) if tauF is None else tauF
+
+        # restrict fine level tau correction part in space and collocation and build tau correction
+        tau = self.collocation_matmul(self.Rcoll, self.space_transfer.restrict_stacked(tauF)) - tauG
+
+        if F.tau[0] is not None:
+            # restrict possible tau correction from fine in space and collocation
+            tau += self.collocation_matmul(self.Rcoll, self.space_transfer.restrict_stacked(self.get_stacked(F.tau)))
+
+        self.set_stacked(G.tau, tau, template=G.u[0])
+
+        # save u and rhs evaluations for interpolation
+        for m in range(1, SG.coll.num_nodes + 1):
+            G.uold[m] = PG.dtype_u(G.u[m])
+            G.fold[m] = PG.dtype_f(G.f[m])
+
+        # works as a predictor
+        G.status.unlocked = True
+
+        return True
+
+    def prolong_values_fused(self, fine, coarse, coarse_old):
+        """
+        Add the coarse correction to the fine values at all nodes with one product of the sparse prolongation matrix
+        with the stacked values and one dense matrix-matrix product for the interpolation in collocation
+
+        Args:
+            fine (list): values at the fine nodes, which are updated
+            coarse (list): values at the coarse nodes
+            coarse_old (list): values at the coarse nodes after restriction
+
+        Returns:
+            bool: True if the fused prolongation was done, False if the datatypes or the space transfer do not support
+                  it
+        """
+        if not self.fused_available(fine, coarse, coarse_old):
+            return False
+
+        # interpolate values in space first
+        tmp = self.space_transfer.prolong_stacked(self.get_stacked(coarse, 1) - self.get_stacked(coarse_old, 1))
+        if tmp is None:
+            return False
+
+        # interpolate values in collocation
+        correction = self.collocation_matmul(self.Pcoll, tmp)
+        if isinstance(fine, NodeStorage) and fine.contiguous and fine.allocated:
+            fine.stack()[1:] += correction
+        else:
+            for n in range(1, len(fine)):
+                fine[n] = fine[n] + correction[n - 1]
+
+        return True
@@ -5,6 +5,37 @@ from pySDC.core.Nodes import NodesGenerator
 from pySDC.core.Errors import CollocationError
 from pySDC.core.Lagrange import LagrangeApproximation
 
+# arrays that only depend on a few parameters, shared by all objects in the process
+_cache = {}
+
+
+def get_cached(key, compute):
+    """
+    Get arrays from the process-wide cache, computing them on first use. Since the arrays are shared, they are made
+    read-only. Copy them before modifying.
+
+    Args:
+        key (tuple): Parameters that determine the arrays entirely
+        compute (callable): Function without arguments returning an array or a tuple containing arrays
+
+    Returns:
+        The cached value
+    """
+    if key not in _cache.keys():
+        value = compute()
+        for me in value if isinstance(value, tuple) else (value,):
+            if isinstance(me, np.ndarray):
+                me.setflags(write=False)
+        _cache[key] = value
+    return _cache[key]
+
+
+def clear_cache():
+    """
+    Remove all entries from the process-wide cache
+    """
+    _cache.clear()
+
 
 class CollBase(object):
     """
@@ -103,11 +134,36 @@ class CollBase(object):
         self.left_is_node = self.quad_type in ['LOBATTO', 'RADAU-LEFT']
         self.right_is_node = self.quad_type in ['LOBATTO', 'RADAU-RIGHT']
 
+        if self.cache_key is None:
+            matrices = self.__compute_matrices()
+        else:
+            matrices = get_cached(('collocation',) + self.cache_key, self.__compute_matrices)
+        self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m = matrices
+
+    @property
+    def cache_key(self):
+        """
+        Parameters that determine the nodes and matrices entirely, such that they can be shared with other collocation
+        objects, or None if they cannot be shared. Derived classes are not cached since they may compute the nodes
+        differently.
+        """
+        if type(self) is not CollBase or np.ndim(self.tleft) > 0 or np.ndim(self.tright) > 0:
+            return None
+        return (self.num_nodes, float(self.tleft), float(self.tright), self.node_type, self.quad_type)
+
+    def __compute_matrices(self):
+        """
+        Compute the nodes and matrices
+
+        Returns:
+            tuple: nodes, weights, Q matrix, S matrix and distances between the nodes
+        """
         self.nodes = self._getNodes
-        self.weights = self._getWeights(tleft, tright)
+        self.weights = self._getWeights(self.tleft, self.tright)
         self.Qmat = self._gen_Qmatrix
         self.Smat = self._gen_Smatrix
         self.delta_m = self._gen_deltas
+        return self.nodes, self.weights, self.Qmat, self.Smat, self.delta_m
 
     @staticmethod
     def evaluate(weights, data):
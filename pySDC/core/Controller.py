@@ -4,9 +4,14 @@ import sys
 import numpy as np
 
 from pySDC.core.BaseTransfer import base_transfer
+from pySDC.core.Errors import ControllerError
+from pySDC.helpers.checkpoint import Checkpoint
 from pySDC.helpers.pysdc_helper import FrozenClass
+from pySDC.helpers.stats_helper import ColumnarStats
+from pySDC.helpers.stats_sink import read_stats
 from pySDC.implementations.convergence_controller_classes.check_convergence import CheckConvergence
 from pySDC.implementations.hooks.default_hook import DefaultHooks
+from pySDC.implementations.hooks.log_timeline import LogTimeline
 
 
 # short helper class to add params as attributes
@@ -20,6 +25,14 @@ class _Pars(FrozenClass):
         self.dump_setup = True
         self.fname = 'run_pid' + str(os.getpid()) + '.log'
         self.use_iteration_estimator = False
+        self.stats_path = None
+        self.stats_chunk_size = 1000
+        self.checkpoint_path = None
+        self.checkpoint_interval = 1
+        self.zero_copy_comm = False
+        self.persistent_comm = False
+        self.execution_backend = 'serial'
+        self.trace_path = None
 
         for k, v in params.items():
             setattr(self, k, v)
@@ -46,6 +59,8 @@ class controller(object):
         hook_classes = [DefaultHooks]
         user_hooks = controller_params.get('hook_class', [])
         hook_classes += user_hooks if type(user_hooks) == list else [user_hooks]
+        if controller_params.get('trace_path', None) is not None:
+            hook_classes += [LogTimeline]
         [self.add_hook(hook) for hook in hook_classes]
         controller_params['hook_class'] = controller_params.get('hook_class', hook_classes)
 
@@ -54,6 +69,10 @@ class controller(object):
 
         self.params = _Pars(controller_params)
 
+        for hook in self.hooks:
+            self.setup_stats_streaming(hook)
+            self.setup_timeline(hook)
+
         self.__setup_custom_logger(self.params.logger_level, self.params.log_to_file, self.params.fname)
         self.logger = logging.getLogger('controller')
 
@@ -120,6 +139,179 @@ class controller(object):
         """
         if hook not in [type(me) for me in self.hooks]:
             self.__hooks += [hook()]
+            if hasattr(self, 'params'):
+                self.setup_stats_streaming(self.__hooks[-1])
+                self.setup_timeline(self.__hooks[-1])
+
+    @property
+    def file_prefix(self):
+        """
+        Prefix for files written during the run, which distinguishes controllers writing to the same directory
+        """
+        return ''
+
+    def setup_stats_streaming(self, hook):
+        """
+        Let a hook write its stats to disk during the run if the `stats_path` parameter is set.
+
+        Args:
+            hook (pySDC.Hook): The hook
+
+        Returns:
+            None
+        """
+        if self.params.stats_path is not None:
+            hook.stream_stats(
+                path=self.params.stats_path,
+                prefix=f'{self.file_prefix}{type(hook).__name__}_',
+                chunk_size=self.params.stats_chunk_size,
+            )
+
+    def setup_timeline(self, hook):
+        """
+        Let a timeline hook write its timeline to disk at the end of the run if the `trace_path` parameter is set.
+
+        Args:
+            hook (pySDC.Hook): The hook
+
+        Returns:
+            None
+        """
+        if self.params.trace_path is not None and isinstance(hook, LogTimeline):
+            hook.trace_to(path=self.params.trace_path, prefix=self.file_prefix)
+
+    def write_stats(self):
+        """
+        Write the stats of finished blocks to disk if they are streamed. Call this only between blocks, such that no
+        entries that are written to disk are modified afterwards.
+
+        Returns:
+            None
+        """
+        for hook in self.hooks:
+            hook.write_stats()
+
+    @property
+    def checkpoint(self):
+        """
+        Getter for the checkpoint, which is created on first use
+        """
+        if getattr(self, '_checkpoint', None) is None:
+            self._checkpoint = Checkpoint(path=self.params.checkpoint_path, prefix=self.file_prefix)
+        return self._checkpoint
+
+    @staticmethod
+    def get_step_state(S):
+        """
+        Get the state of a step that is not reset when restarting a block, i.e. the status variables of the step and
+        the levels, which include the variables added by the convergence controllers, and the step sizes.
+
+        Args:
+            S (pySDC.Step.step): The step
+
+        Returns:
+            dict: The state of the step
+        """
+        return {
+            'status': dict(vars(S.status)),
+            'levels': [{'dt': L.params.dt, 'status': dict(vars(L.status))} for L in S.levels],
+        }
+
+    @staticmethod
+    def set_step_state(S, state):
+        """
+        Restore the state of a step obtained from `get_step_state`
+
+        Args:
+            S (pySDC.Step.step): The step
+            state (dict): The state of the step
+
+        Returns:
+            None
+        """
+        S.status.__dict__.update(state['status'])
+        for L, level_state in zip(S.levels, state['levels']):
+            L.params.dt = level_state['dt']
+            L.status.__dict__.update(level_state['status'])
+
+    def write_checkpoint(self, block, solution, steps, force=False, **kwargs):
+        """
+        Write a checkpoint every `checkpoint_interval` blocks if the `checkpoint_path` parameter is set. Call this after
+        restarting a block, such that the checkpoint contains everything that is needed to start the next block.
+
+        Args:
+            block (int): Number of blocks that have been computed
+            solution: Initial conditions of the next block
+            steps (list): Steps whose state is stored
+            force (bool): Write the checkpoint regardless of the interval
+            **kwargs: Variables of the run loop that are needed to resume
+
+        Returns:
+            None
+        """
+        if self.params.checkpoint_path is None or (block % self.params.checkpoint_interval != 0 and not force):
+            return None
+
+        state = {
+            **kwargs,
+            'block': block,
+            'steps': [self.get_step_state(S) for S in steps],
+            'convergence_controllers': [
+                (type(C).__name__, {k: v for k, v in vars(C).items() if k not in ['params', 'logger']})
+                for C in self.convergence_controllers
+            ],
+        }
+        self.checkpoint.write(solution, state)
+
+    def read_checkpoint(self, steps):
+        """
+        Read the last checkpoint. Restart the block with the returned initial conditions and then restore the state of
+        the steps and convergence controllers with `restore_checkpoint`.
+
+        Args:
+            steps (list): Steps of the controller
+
+        Returns:
+            The initial conditions of the next block
+            dict: The remaining state, i.e. the variables of the run loop
+        """
+        if not self.checkpoint.exists():
+            raise ControllerError(f'No checkpoint found in \"{self.params.checkpoint_path}\"')
+
+        solution, state = self.checkpoint.read()
+
+        if len(state['steps']) != len(steps):
+            raise ControllerError('Number of steps does not match the checkpoint')
+        if [name for name, _ in state['convergence_controllers']] != [
+            type(C).__name__ for C in self.convergence_controllers
+        ]:
+            raise ControllerError('Convergence controllers do not match the ones of the checkpoint')
+
+        # copy the solution to the datatype of the problem
+        if isinstance(solution, np.ndarray):
+            P = steps[0].levels[0].prob
+            u0 = P.dtype_u(P.init)
+            u0[...] = solution
+            solution = u0
+
+        return solution, state
+
+    def restore_checkpoint(self, steps, state):
+        """
+        Restore the state of the steps and of the convergence controllers from a checkpoint. The controller needs to be
+        set up in the same way as the one that has written the checkpoint.
+
+        Args:
+            steps (list): Steps of the controller
+            state (dict): State obtained from `read_checkpoint`
+
+        Returns:
+            None
+        """
+        for C, (_, C_state) in zip(self.convergence_controllers, state['convergence_controllers']):
+            C.__dict__.update(C_state)
+        for S, step_state in zip(steps, state['steps']):
+            self.set_step_state(S, step_state)
 
     def welcome_message(self):
         out = (
@@ -330,12 +522,19 @@ class controller(object):
 
     def return_stats(self):
         """
-        Return the merged stats from all hooks
+        Return the merged stats from all hooks. If the stats are streamed to disk, they are read lazily.
 
         Returns:
             dict: Merged stats from all hooks
         """
-        stats = {}
+        if self.params.stats_path is not None:
+            for hook in self.hooks:
+                hook.write_stats(force=True)
+            return read_stats(
+                self.params.stats_path, prefixes=[f'{self.file_prefix}{type(hook).__name__}_' for hook in self.hooks]
+            )
+
+        stats = ColumnarStats()
         for hook in self.hooks:
-            stats = {**stats, **hook.return_stats()}
+            stats.update(hook.return_stats())
         return stats
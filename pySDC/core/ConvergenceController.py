@@ -1,4 +1,8 @@
 import logging
+import zlib
+
+import numpy as np
+
 from pySDC.helpers.pysdc_helper import FrozenClass
 
 
@@ -27,12 +31,84 @@ class Status(FrozenClass):
         self._freeze()
 
 
+class TypedMessage(object):
+    """
+    Buffers for a message with a fixed layout of named fields, which is sent between ranks as raw bytes instead of as a
+    pickled object. Sending and receiving reuses the buffers, so the only cost is copying the values in and out.
+
+    Attributes:
+        name (str): Name of the message
+        tag (int): MPI tag of the message
+        send_buffer (numpy.ndarray): Structured array with one entry holding the values to send
+        recv_buffer (numpy.ndarray): Structured array with one entry holding the values received last
+        request: Request handle of the last non-blocking send or None
+    """
+
+    def __init__(self, name, fields, tag):
+        """
+        Initialization routine
+
+        Args:
+            name (str): Name of the message
+            fields (dict): Data type of every field, or a tuple of data type and shape for arrays
+            tag (int): MPI tag of the message
+        """
+        dtype = np.dtype([(key, *me) if isinstance(me, tuple) else (key, me) for key, me in fields.items()])
+        self.name = name
+        self.tag = tag
+        self.send_buffer = np.zeros(1, dtype=dtype)
+        self.recv_buffer = np.zeros(1, dtype=dtype)
+        self.request = None
+
+    @property
+    def fields(self):
+        return self.send_buffer.dtype.names
+
+    def pack(self, **values):
+        """
+        Write values to the send buffer after waiting for the previous send to finish. Fields that are not given keep
+        their previous values.
+
+        Returns:
+            numpy.ndarray: The raw bytes of the send buffer
+        """
+        if self.request is not None:
+            self.request.Wait()
+            self.request = None
+
+        for key, value in values.items():
+            self.send_buffer[0][key] = value
+        return self.send_buffer.view(np.uint8)
+
+    def unpack(self):
+        """
+        Get the values from the receive buffer in the order of the fields. Scalars are converted to Python types and
+        arrays are copied.
+
+        Returns:
+            The value if the message has a single field, otherwise a tuple of the values
+        """
+        values = tuple(
+            me.copy() if isinstance(me, np.ndarray) else me.item()
+            for me in (self.recv_buffer[0][key] for key in self.fields)
+        )
+        return values[0] if len(values) == 1 else values
+
+    def __getstate__(self):
+        # requests cannot be copied
+        return {**self.__dict__, 'request': None}
+
+
 class ConvergenceController(object):
     """
     Base abstract class for convergence controller, which is plugged into the controller to determine the iteration
     count and time step size.
     """
 
+    # tags of typed messages are derived from the name of the class and the message within this range
+    MESSAGE_TAG_OFFSET = 10000
+    MESSAGE_TAG_RANGE = 10000
+
     def __init__(self, controller, params, description, **kwargs):
         """
         Initialization routine
@@ -42,6 +118,7 @@ class ConvergenceController(object):
             params (dict): The params passed for this specific convergence controller
             description (dict): The description object used to instantiate the controller
         """
+        self.messages = {}
         self.params = Pars(self.setup(controller, params, description))
         params_ok, msg = self.check_parameters(controller, params, description)
         assert params_ok, msg
@@ -346,6 +423,77 @@ class ConvergenceController(object):
 
         return data
 
+    def add_message(self, name, **fields):
+        """
+        Declare a message with a fixed layout for `send_buffer` and `recv_buffer`, which move the values in typed
+        buffers rather than pickling Python objects. Put all values that are exchanged at the same time into one message
+        to send them at once. Since the tag is derived from the names of the class and the message, every rank needs to
+        declare the same messages.
+
+        For instance, `self.add_message('restart', restart=bool, dt=(float, (3,)))` declares a message with a flag and
+        an array of three floats.
+
+        Args:
+            name (str): Name of the message
+            **fields: Data type of every field, or a tuple of data type and shape for arrays
+
+        Returns:
+            None
+        """
+        tag = self.MESSAGE_TAG_OFFSET + zlib.crc32(f'{type(self).__name__}.{name}'.encode()) % self.MESSAGE_TAG_RANGE
+        self.messages[name] = TypedMessage(name, fields, tag)
+
+    def send_buffer(self, comm, dest, name, blocking=False, **values):
+        """
+        Send a message declared with `add_message` to a different rank. The buffer of the message is reused, so this
+        waits for the previous non-blocking send of the same message to finish.
+
+        Args:
+            comm (mpi4py.MPI.Intracomm): Communicator
+            dest (int): The target rank
+            name (str): Name of the message
+            blocking (bool): Whether the communication is blocking or not
+            **values: Values of the fields, fields that are not given keep the values of the previous send
+
+        Returns:
+            request handle of the communication or None if blocking
+        """
+        message = self.messages[name]
+
+        self.logger.debug(f'Step {comm.rank} initiates send of {name} to step {dest}')
+
+        buffer = message.pack(**values)
+        if blocking:
+            comm.Send(buffer, dest=dest, tag=message.tag)
+        else:
+            message.request = comm.Isend(buffer, dest=dest, tag=message.tag)
+
+        self.logger.debug(f'Step {comm.rank} leaves send of {name} to step {dest}')
+
+        return message.request
+
+    def recv_buffer(self, comm, source, name):
+        """
+        Receive a message declared with `add_message`
+
+        Args:
+            comm (mpi4py.MPI.Intracomm): Communicator
+            source (int): Where to look for receiving
+            name (str): Name of the message
+
+        Returns:
+            The value if the message has a single field, otherwise a tuple of the values in the order of the fields
+        """
+        message = self.messages[name]
+
+        self.logger.debug(f'Step {comm.rank} initiates receive of {name} from step {source}')
+
+        comm.Recv(message.recv_buffer.view(np.uint8), source=source, tag=message.tag)
+
+        self.logger.debug(f'Step {comm.rank} leaves receive of {name} from step {source}')
+
+        return message.unpack()
+
     def reset_variable(self, controller, name, MPI=False, place=None, where=None, init=None):
         """
         Utility function for resetting variables. This function will call the `add_variable` function with all the same
@@ -1,6 +1,9 @@
 import logging
 from collections import namedtuple
 
+from pySDC.helpers.stats_helper import ColumnarStats
+from pySDC.helpers.stats_sink import StatsSink
+
 
 # noinspection PyUnusedLocal,PyShadowingBuiltins,PyShadowingNames
 class hooks(object):
@@ -14,10 +17,13 @@ class hooks(object):
     Attributes:
         logger: logger instance for output
         __num_restarts (int): number of restarts of the current step
-        __stats (dict): dictionary for gathering the statistics of a run
+        __stats (ColumnarStats): dictionary for gathering the statistics of a run
+        __sink (StatsSink): optional sink for writing the statistics to disk during the run
         __entry (namedtuple): statistics entry containing all information to identify the value
     """
 
+    __sink = None
+
     def __init__(self):
         """
         Initialization routine
@@ -27,7 +33,8 @@ class hooks(object):
         self.logger = logging.getLogger('hooks')
 
         # create statistics and entry elements
-        self.__stats = {}
+        self.__stats = ColumnarStats()
+        self.__sink = None
         self.__entry = namedtuple('Entry', ['process', 'time', 'level', 'iter', 'sweep', 'type', 'num_restarts'])
 
     def add_to_stats(self, process, time, level, iter, sweep, type, value):
@@ -83,18 +90,47 @@ class hooks(object):
 
     def return_stats(self):
         """
-        Getter for the stats
+        Getter for the stats. If the stats are streamed to disk, the remaining entries are written and the stats are
+        read lazily from disk.
 
         Returns:
             dict: stats
         """
+        if self.__sink is not None:
+            self.write_stats(force=True)
+            return self.__sink.read()
         return self.__stats
 
     def reset_stats(self):
         """
         Function to reset the stats for multiple runs
         """
-        self.__stats = {}
+        self.__stats = ColumnarStats()
+        if self.__sink is not None:
+            self.__sink.reset()
+
+    def stream_stats(self, path, prefix='', chunk_size=1000):
+        """
+        Write the stats to disk in chunks during the run instead of keeping them in memory until the end.
+
+        Args:
+            path (str): Directory to write the stats to
+            prefix (str): Prefix for the file names, needs to be unique among all hooks writing to the same directory
+            chunk_size (int): Number of entries to keep in memory before writing them to disk
+        """
+        self.__sink = StatsSink(path=path, prefix=prefix, chunk_size=chunk_size)
+
+    def write_stats(self, force=False):
+        """
+        Move the stats from memory to disk if they are streamed and there are enough entries for a chunk. This must
+        only be called when no entries will be modified anymore, e.g. between blocks.
+
+        Args:
+            force (bool): Write the stats regardless of the number of entries
+        """
+        if self.__sink is not None and (force or len(self.__stats) >= self.__sink.chunk_size):
+            self.__sink.write(self.__stats)
+            self.__stats = ColumnarStats()
 
     def pre_setup(self, step, level_number):
         """
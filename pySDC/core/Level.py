@@ -1,5 +1,14 @@
+import copy
+import itertools
+import logging
+
+import numpy as np
+
 from pySDC.helpers.pysdc_helper import FrozenClass
 
+# versions of the end points of all levels, which are unique such that they also identify the level
+_uend_versions = itertools.count(1)
+
 
 # short helper class to add params as attributes
 class _Pars(FrozenClass):
@@ -9,6 +18,7 @@ class _Pars(FrozenClass):
         self.restol = -1.0
         self.nsweeps = 1
         self.residual_type = 'full_abs'
+        self.contiguous_storage = False
         for k, v in params.items():
             setattr(self, k, v)
         # freeze class, no further attributes allowed from this point
@@ -32,9 +42,283 @@ class _Status(FrozenClass):
         self.time = None
         self.dt_new = None
         self.sweep = None
+        # version of the end point of the previous step that u[0] was received from, None if it was set otherwise
+        self.u0_origin = None
+        # the values at the nodes changed since the end point was computed
+        self.uend_stale = True
         # freeze class, no further attributes allowed from this point
         self._freeze()
 
+    def __setattr__(self, key, value):
+        # sweepers indicate new values at the nodes by setting `updated`, which means that the end point is outdated
+        if key == 'updated' and value:
+            super().__setattr__('uend_stale', True)
+        super().__setattr__(key, value)
+
+
+class NodeStorage(object):
+    """
+    List-like container for the values at the collocation nodes, backed by contiguous memory
+
+    Instead of one separate data object per node, the first value assigned to the storage is used as a template to
+    allocate one array of shape (size, *shape) per component of the datatype (e.g. a single array for `mesh` and one
+    array each for `impl` and `expl` of `imex_mesh`). The entries of the container are views into these arrays, so
+    assigning to a node copies the values instead of replacing the object, and resetting the storage only marks the
+    nodes as empty without freeing any memory. Empty nodes are returned as None, like in a plain list.
+
+    Datatypes which are not based on numpy arrays cannot be stacked, for those the storage behaves like a plain list.
+
+    The arrays and the flags marking the nodes that hold values can be placed in memory shared between processes by
+    passing an allocator such as `SharedArrays.allocate`. Storages in shared memory are pickled by reference, so
+    copies in other processes operate on the same values.
+
+    Attributes:
+        logger: custom logger for storage-related logging
+        allocator: function returning a zero-initialized array and a picklable reference to it for shape and dtype, or
+                   None to allocate regular numpy arrays
+    """
+
+    def __init__(self, size, allocator=None):
+        """
+        Initialization routine
+
+        Args:
+            size (int): number of nodes to store
+            allocator: function allocating the arrays, see above
+        """
+        self.logger = logging.getLogger('level')
+        self.allocator = allocator
+
+        self.__size = size
+        self.__refs = {}
+        self.__valid = self.__new_array((size,), bool, 'valid')
+        self.__stacks = None
+        self.__template = None
+        self.__views = None
+        self.__data = None
+        self.__contiguous = True
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        for m in range(self.__size):
+            yield self[m]
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)})'
+
+    @property
+    def contiguous(self):
+        """
+        Returns:
+            bool: True if the storage is in contiguous mode, which means that the values are copied into contiguous
+                  arrays once they are allocated, False if the storage fell back to a plain list because the datatype
+                  cannot be stacked
+        """
+        return self.__contiguous
+
+    @property
+    def allocated(self):
+        """
+        Returns:
+            bool: True if the contiguous arrays have been allocated already
+        """
+        return self.__stacks is not None
+
+    @property
+    def components(self):
+        """
+        Returns:
+            list: names of the stacked components, which is `[None]` for datatypes that are arrays themselves and empty
+                  as long as the arrays are not allocated
+        """
+        return list(self.__stacks.keys()) if self.allocated else []
+
+    def stack(self, component=None):
+        """
+        Get the contiguous array holding all nodes, including the ones which are currently empty
+
+        Args:
+            component (str): name of the component for composite datatypes (e.g. 'impl' or 'expl')
+
+        Returns:
+            numpy.ndarray: array of shape (size, *shape), changing it changes the values at the nodes
+        """
+        if not self.allocated:
+            return None
+        return self.__stacks[component].view(np.ndarray)
+
+    def valid(self, m):
+        """
+        Check if a node currently holds a value
+
+        Args:
+            m (int): index of the node
+
+        Returns:
+            bool: True if node m has a value
+        """
+        return bool(self.__valid[m]) if self.__data is None else self.__data[m] is not None
+
+    def reset(self):
+        """
+        Mark all nodes as empty, but keep the memory for reuse
+        """
+        self.__valid[...] = False
+        if self.__data is not None:
+            self.__data = [None] * self.__size
+
+    def __getitem__(self, m):
+        if isinstance(m, slice):
+            return [self[i] for i in range(*m.indices(self.__size))]
+        if self.__data is not None:
+            return self.__data[m]
+        return self.__views[m] if self.__valid[m] else None
+
+    def __setitem__(self, m, value):
+        if isinstance(m, slice):
+            indices = range(*m.indices(self.__size))
+            values = list(value)
+            if len(values) != len(indices):
+                raise ValueError(f'cannot assign {len(values)} values to {len(indices)} nodes')
+            for i, v in zip(indices, values):
+                self[i] = v
+            return None
+
+        if m < -self.__size or m >= self.__size:
+            raise IndexError(f'node index {m} out of range for {self.__size} nodes')
+        m = m % self.__size
+
+        if value is None:
+            if self.__data is None:
+                self.__valid[m] = False
+            else:
+                self.__data[m] = None
+            return None
+
+        if self.__data is None and not self.allocated:
+            self.allocate(value)
+
+        if self.__data is not None:
+            self.__data[m] = value
+            return None
+
+        view = self.__views[m]
+        if value is not view:
+            if None in self.__stacks:
+                view[...] = value
+            else:
+                for component in self.__stacks.keys():
+                    getattr(view, component)[...] = getattr(value, component)
+        self.__valid[m] = True
+
+    def allocate(self, value):
+        """
+        Allocate the contiguous arrays with a template, which happens automatically when assigning the first value
+
+        Args:
+            value: data object (dtype_u or dtype_f) determining shape, type and components of the storage
+        """
+        if self.allocated or not self.contiguous:
+            return None
+
+        if isinstance(value, np.ndarray):
+            self.__stacks = {None: self.__stack_like(value, None)}
+        else:
+            components = [key for key, me in getattr(value, '__dict__', {}).items() if isinstance(me, np.ndarray)]
+            if not components:
+                self.logger.warning(
+                    f'Cannot store datatype {type(value).__name__} contiguously, falling back to a list of objects'
+                )
+                self.__data = [None] * self.__size
+                self.__contiguous = False
+                return None
+
+            self.__stacks = {key: self.__stack_like(getattr(value, key), key) for key in components}
+            # keep a shallow copy without the arrays to generate views for composite datatypes
+            self.__template = copy.copy(value)
+            for key in components:
+                setattr(self.__template, key, None)
+
+        self.__generate_views()
+
+    def __new_array(self, shape, dtype, key):
+        """
+        Allocate a zero-initialized array with the allocator if there is one
+
+        Args:
+            shape (tuple): shape of the array
+            dtype (numpy.dtype): data type of the array
+            key: name under which the reference to the array is stored
+
+        Returns:
+            numpy.ndarray: the array
+        """
+        if self.allocator is None:
+            return np.zeros(shape, dtype=dtype)
+        array, self.__refs[key] = self.allocator(shape, dtype)
+        return array
+
+    def __stack_like(self, value, component):
+        """
+        Allocate a stacked array which behaves like value, i.e. has the same type, dtype and attributes
+
+        Args:
+            value (numpy.ndarray): template array
+            component (str): name of the component the array is used for
+
+        Returns:
+            numpy.ndarray: array of shape (size, *value.shape)
+        """
+        stack = self.__new_array((self.__size,) + value.shape, value.dtype, component).view(type(value))
+        stack.__dict__.update(getattr(value, '__dict__', {}))
+        return stack
+
+    def __generate_views(self):
+        """
+        Generate the objects at the nodes as views into the stacked arrays
+        """
+        if None in self.__stacks:
+            self.__views = [self.__stacks[None][m] for m in range(self.__size)]
+        else:
+            self.__views = []
+            for m in range(self.__size):
+                me = copy.copy(self.__template)
+                for key, stack in self.__stacks.items():
+                    setattr(me, key, stack[m])
+                self.__views.append(me)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the views would be pickled as separate copies, so we only keep the stacks and their attributes
+        state['_NodeStorage__views'] = None
+        # arrays in shared memory are replaced by references to them and the allocator stays with the original
+        state['allocator'] = None
+        if 'valid' in self.__refs.keys():
+            state['_NodeStorage__valid'] = self.__refs['valid']
+        if self.__stacks is not None:
+            state['_NodeStorage__stacks'] = {
+                key: (self.__refs.get(key, stack.view(np.ndarray)), type(stack), getattr(stack, '__dict__', {}).copy())
+                for key, stack in self.__stacks.items()
+            }
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # references to shared memory are recognized by their `attach` method, such that the shared memory module,
+        # which requires Python 3.8, is only imported when it is used
+        if hasattr(self.__valid, 'attach'):
+            self.__valid = self.__valid.attach()
+        if self.__stacks is not None:
+            stacks = {}
+            for key, (array, cls, attrs) in self.__stacks.items():
+                array = array.attach() if hasattr(array, 'attach') else array
+                stacks[key] = array.view(cls)
+                stacks[key].__dict__.update(attrs)
+            self.__stacks = stacks
+            self.__generate_views()
+
 
 class level(FrozenClass):
     """
@@ -47,12 +331,15 @@ class level(FrozenClass):
         params (__Pars): parameter object containing the custom parameters passed by the user
         status (__Status): status object
         level_index (int): custom string naming this level
-        uend: dof values at the right end point of the interval
+        uend: dof values at the right end point of the interval, every assignment increases `uend_version`
         u (list of dtype_u): dof values at the nodes
         uold (list of dtype_u): copy of dof values for saving data during restriction)
         f (list of dtype_f): RHS values at the nodes
         fold (list of dtype_f): copy of RHS values for saving data during restriction
         tau (list of dtype_u): FAS correction, allocated via step class if necessary
+
+    If `contiguous_storage` is set in the level parameters, u, uold, f, fold and tau are `NodeStorage` objects instead
+    of lists, which keep the values at all nodes in one array per quantity and are reused across time steps.
     """
 
     def __init__(self, problem_class, problem_params, sweeper_class, sweeper_params, level_params, level_index):
@@ -80,13 +367,14 @@ class level(FrozenClass):
         self.level_index = level_index
 
         # empty data at the nodes, the right end point and tau
-        self.uend = None
-        self.u = [None] * (self.sweep.coll.num_nodes + 1)
-        self.uold = [None] * (self.sweep.coll.num_nodes + 1)
-        self.f = [None] * (self.sweep.coll.num_nodes + 1)
-        self.fold = [None] * (self.sweep.coll.num_nodes + 1)
+        self.__uend = None
+        self.__uend_version = next(_uend_versions)
+        self.u = self.__get_node_storage(self.sweep.coll.num_nodes + 1)
+        self.uold = self.__get_node_storage(self.sweep.coll.num_nodes + 1)
+        self.f = self.__get_node_storage(self.sweep.coll.num_nodes + 1)
+        self.fold = self.__get_node_storage(self.sweep.coll.num_nodes + 1)
 
-        self.tau = [None] * self.sweep.coll.num_nodes
+        self.tau = self.__get_node_storage(self.sweep.coll.num_nodes)
 
         # pass this level to the sweeper for easy access
         self.sweep.level = self
@@ -113,11 +401,32 @@ class level(FrozenClass):
 
         # all data back to None
         self.uend = None
-        self.u = [None] * (self.sweep.coll.num_nodes + 1)
-        self.uold = [None] * (self.sweep.coll.num_nodes + 1)
-        self.f = [None] * (self.sweep.coll.num_nodes + 1)
-        self.fold = [None] * (self.sweep.coll.num_nodes + 1)
-        self.tau = [None] * self.sweep.coll.num_nodes
+        self.status.u0_origin = None
+        self.status.uend_stale = True
+        self.u = self.__get_node_storage(self.sweep.coll.num_nodes + 1, self.u)
+        self.uold = self.__get_node_storage(self.sweep.coll.num_nodes + 1, self.uold)
+        self.f = self.__get_node_storage(self.sweep.coll.num_nodes + 1, self.f)
+        self.fold = self.__get_node_storage(self.sweep.coll.num_nodes + 1, self.fold)
+        self.tau = self.__get_node_storage(self.sweep.coll.num_nodes, self.tau)
+
+    def __get_node_storage(self, size, old=None):
+        """
+        Helper routine to get empty storage for the values at the nodes
+
+        Args:
+            size (int): number of nodes
+            old: previous storage, which is reset and reused if possible
+
+        Returns:
+            list or NodeStorage: the empty storage
+        """
+        if not self.params.contiguous_storage:
+            return [None] * size
+        elif isinstance(old, NodeStorage) and len(old) == size:
+            old.reset()
+            return old
+        else:
+            return NodeStorage(size)
 
     @property
     def sweep(self):
@@ -139,6 +448,40 @@ class level(FrozenClass):
         """
         return self.__prob
 
+    @property
+    def uend(self):
+        """
+        Getter for the values at the right end point
+
+        Returns:
+            dtype_u: the end point
+        """
+        return self.__uend
+
+    @uend.setter
+    def uend(self, value):
+        """
+        Setter for the values at the right end point, which marks the end point as changed by increasing its version.
+        In-place changes like `L.uend += x` call the setter as well, while changes of the values through other
+        references do not.
+
+        Args:
+            value (dtype_u): the new end point
+        """
+        self.__uend = value
+        self.__uend_version = next(_uend_versions)
+
+    @property
+    def uend_version(self):
+        """
+        Getter for the version of the end point, which changes whenever the end point is assigned and is unique
+        across all levels
+
+        Returns:
+            int: the version
+        """
+        return self.__uend_version
+
     @property
     def time(self):
         """
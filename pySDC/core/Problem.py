@@ -8,6 +8,10 @@ Module containing the base Problem class for pySDC
 """
 
 import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
 
 from pySDC.core.Common import RegisterParams
 
@@ -33,6 +37,265 @@ class WorkCounter(object):
         self.niter += 1
 
 
+class FactorizationCache(object):
+    """
+    Least-recently-used cache for factorizations of linear operators such as `I - factor * A`.
+
+    Implicit sweepers solve with the same few values of `factor = dt * QI[m, m]` over and over, so problems can store
+    the factorization for each value and only compute it when a new value shows up. Entries are evicted in
+    least-recently-used order when either the number of entries or their estimated memory footprint exceeds the limits.
+    Since the keys depend on the step size, the cache should be cleared when the step size changes. The cache can be
+    shared between threads, but factorizations that are missing may be computed by more than one thread at once.
+
+    >>> cache = FactorizationCache()
+    >>> lu = cache.get(factor, lambda: splu(Id - factor * A))  # factorizes
+    >>> lu = cache.get(factor, lambda: splu(Id - factor * A))  # reuses the factorization
+
+    Attributes:
+        max_entries (int): Maximal number of factorizations to keep
+        max_memory (int): Maximal estimated memory in bytes of all factorizations combined
+        hits (int): Number of times a factorization was reused
+        misses (int): Number of times a factorization had to be computed
+    """
+
+    def __init__(self, max_entries=16, max_memory=2**30):
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    @property
+    def nbytes(self):
+        """Estimated memory footprint of all stored factorizations in bytes"""
+        return sum(me[1] for me in self.__entries.values())
+
+    @staticmethod
+    def get_nbytes(factorization):
+        """
+        Estimate the memory footprint of a factorization. Works for SuperLU objects, sparse matrices, arrays and
+        tuples or lists of them as well as for solvers in the form of bound methods of these, like `splu(A).solve`, or
+        functions that hold them in their closure, like `lambda b: lu_solve(lu, b)`.
+
+        Args:
+            factorization: The factorization
+
+        Returns:
+            int: Estimated size in bytes
+        """
+        if hasattr(factorization, 'L') and hasattr(factorization, 'U'):
+            return FactorizationCache.get_nbytes(factorization.L) + FactorizationCache.get_nbytes(factorization.U)
+        elif hasattr(factorization, 'indptr'):
+            return factorization.data.nbytes + factorization.indices.nbytes + factorization.indptr.nbytes
+        elif isinstance(factorization, (tuple, list)):
+            return sum(FactorizationCache.get_nbytes(me) for me in factorization)
+        elif hasattr(factorization, '__self__'):
+            return FactorizationCache.get_nbytes(factorization.__self__)
+        elif getattr(factorization, '__closure__', None):
+            # functions in the closure are skipped to avoid following references in circles
+            cells = [cell.cell_contents for cell in factorization.__closure__]
+            return sum(FactorizationCache.get_nbytes(me) for me in cells if not callable(me))
+        nbytes = getattr(factorization, 'nbytes', 0)
+        return nbytes if isinstance(nbytes, (int, np.integer)) else 0
+
+    def get(self, key, factorize):
+        """
+        Get the factorization for a key, computing it if it is not yet stored.
+
+        Args:
+            key (float): Key identifying the factorization, usually the factor in front of the operator
+            factorize (callable): Function without arguments returning the factorization
+
+        Returns:
+            The factorization
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                return self.__entries[key][0]
+            self.misses += 1
+
+        # factorize without holding the lock such that other threads can factorize for other keys at the same time
+        factorization = factorize()
+        nbytes = self.get_nbytes(factorization)
+
+        with self.__lock:
+            if nbytes <= self.max_memory and self.max_entries > 0:
+                self.__entries[key] = (factorization, nbytes)
+                self.__evict()
+        return factorization
+
+    def __evict(self):
+        """
+        Remove the least recently used entries until the cache respects the limits again.
+        """
+        while len(self.__entries) > self.max_entries or self.nbytes > self.max_memory:
+            self.__entries.popitem(last=False)
+
+    def remove(self, key):
+        """
+        Remove the factorization for a key if it is stored, e.g. because it is outdated.
+
+        Args:
+            key (float): Key identifying the factorization
+        """
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all stored factorizations, e.g. because the step size has changed.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def __getstate__(self):
+        # factorizations like SuperLU objects cannot be pickled, so we start over with an empty cache in copies
+        state = self.__dict__.copy()
+        state['_FactorizationCache__entries'] = OrderedDict()
+        del state['_FactorizationCache__lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+
+class NewtonSolver(object):
+    """
+    Newton solver for nonlinear systems `G(u) = 0` with optional reuse of the Jacobian between iterations and solves.
+
+    Problems supply the residual `G` and a function that returns a solver for linear systems with the Jacobian of `G`
+    at a given point, e.g. the `solve` method of a sparse LU factorization. The `update` strategy determines how often
+    the Jacobian is evaluated and factorized:
+
+     - `'full'`: in every iteration, which is the classical Newton method
+     - `'simplified'`: at the initial guess of every solve, after which the Jacobian is frozen during the iterations
+     - `'chord'`: frozen as well, but also kept across solves, i.e. across nodes and sweeps, with the same `key`,
+       which is usually the factor in front of the right hand side since the Jacobian depends on it
+
+    With frozen Jacobians, i.e. in both `'simplified'` and `'chord'` mode, the Jacobian is evaluated anew at the
+    current iterate as soon as the residual shrinks by less than `max_contraction` in one iteration, such that the
+    convergence does not deteriorate too much as the solution moves away from the point of the last evaluation. The
+    number of iterations and of evaluations of the Jacobian are recorded in the work counters `'newton'` and
+    `'jacobian'`. Problems usually expose the strategy as the parameter `newton_update`.
+
+    >>> newton = NewtonSolver(update='chord', work_counters=self.work_counters)
+    >>> u, n, res = newton.solve(G, lambda u: splu(J(u)).solve, u0, tol=1e-9, maxiter=99, key=factor)
+
+    Attributes:
+        update (str): Strategy for updating the Jacobian
+        max_contraction (float): Largest ratio of consecutive residuals that is accepted with a frozen Jacobian
+        jacobians (FactorizationCache): Linear solvers reused between solves in `'chord'` mode
+        work_counters (dict): Work counters of the problem
+    """
+
+    updates = ['full', 'simplified', 'chord']
+    roundoff = 1e2  # residuals up to this multiple of the machine precision relative to the solution count as converged
+
+    def __init__(self, update='full', max_contraction=0.5, work_counters=None, max_entries=16):
+        if update not in self.updates:
+            raise ValueError(f'Unknown Jacobian update {update!r} for Newton, choose from {self.updates}')
+
+        self.update = update
+        self.max_contraction = max_contraction
+        self.jacobians = FactorizationCache(max_entries=max_entries)
+        self.work_counters = {} if work_counters is None else work_counters
+        for name in ['newton', 'jacobian']:
+            if name not in self.work_counters:
+                self.work_counters[name] = WorkCounter()
+
+    def solve(self, residual, get_linear_solver, u0, tol, maxiter, key=None, min_iter=0, xtol=None):
+        """
+        Solve the nonlinear system starting from an initial guess
+
+        Args:
+            residual (callable): Function returning the residual `G(u)`
+            get_linear_solver (callable): Function returning a function that solves `J(u) x = b` for `x`
+            u0: Initial guess, which is not modified
+            tol (float): Tolerance for the maximum norm of the residual
+            maxiter (int): Maximal number of iterations
+            key: Identifier for the Jacobian that is reused across solves in `'chord'` mode
+            min_iter (int): Minimal number of iterations regardless of the residual
+            xtol (float): Also stop once the update is at most `xtol` relative to the solution in the maximum norm or
+                once the residual is at the level of rounding errors and does not decrease with a Jacobian evaluated at
+                the previous iterate, e.g. for ill-conditioned Jacobians of differential algebraic equations
+
+        Returns:
+            Solution
+            int: Number of iterations
+            float: Maximum norm of the final residual, which is nan if the iteration broke down
+        """
+        u = u0
+        solve = None
+        res_old = np.inf
+        res = np.inf
+        small_update = False
+        stagnated = False
+        fresh = False
+
+        for n in range(maxiter + 1):
+            G = residual(u)
+            res = np.linalg.norm(G, np.inf)
+            if xtol is not None and fresh and res >= res_old:
+                stagnated = res <= self.roundoff * np.finfo(float).eps * max(1.0, np.linalg.norm(u, np.inf))
+            if ((res <= tol or small_update or stagnated) and n >= min_iter) or np.isnan(res) or n == maxiter:
+                break
+
+            # remember if the Jacobian is evaluated at the current iterate rather than taken from a previous solve
+            evaluations = self.work_counters['jacobian'].niter
+            if self.update == 'full' or solve is None:
+                solve = self.__get_linear_solver(get_linear_solver, u, key, refresh=self.update != 'chord')
+            elif res > self.max_contraction * res_old:
+                solve = self.__get_linear_solver(get_linear_solver, u, key, refresh=True)
+            fresh = self.work_counters['jacobian'].niter > evaluations
+
+            delta = solve(G)
+            if not np.isfinite(delta).all():
+                res = np.nan
+                break
+
+            u = u - delta
+            res_old = res
+            if xtol is not None:
+                small_update = np.linalg.norm(delta, np.inf) <= xtol * np.linalg.norm(u, np.inf)
+            self.work_counters['newton']()
+
+        return u, n, res
+
+    def __get_linear_solver(self, get_linear_solver, u, key, refresh):
+        """
+        Get a linear solver for the Jacobian, reusing a stored one in `'chord'` mode unless a refresh is requested
+
+        Args:
+            get_linear_solver (callable): Function returning a function that solves `J(u) x = b` for `x`
+            u: Point to evaluate the Jacobian at
+            key: Identifier for the Jacobian
+            refresh (bool): Evaluate the Jacobian at `u` even if one is stored for the key
+
+        Returns:
+            callable: The linear solver
+        """
+
+        def evaluate():
+            self.work_counters['jacobian']()
+            return get_linear_solver(u)
+
+        if self.update != 'chord':
+            return evaluate()
+        if refresh:
+            self.jacobians.remove(key)
+        return self.jacobians.get(key, evaluate)
+
+
 class ptype(RegisterParams):
     """
     Prototype class for problems, just defines the attributes essential to get started.
@@ -50,6 +313,8 @@ class ptype(RegisterParams):
     ----------
     logger: logging.Logger
         custom logger for problem-related logging.
+    factorizations : FactorizationCache
+        Cache for factorizations of linear operators that are reused between solves.
     """
 
     logger = logging.getLogger('problem')
@@ -59,6 +324,7 @@ class ptype(RegisterParams):
     def __init__(self, init):
         self.work_counters = {}  # Dictionary to store WorkCounter objects
         self.init = init  # Initialization parameter to instantiate data types
+        self.factorizations = FactorizationCache()  # Factorizations of linear operators reused between solves
 
     @property
     def u_init(self):
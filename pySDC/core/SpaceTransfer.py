@@ -63,3 +63,29 @@ class space_transfer(object):
             G: the coarse level data (easier to access than via the coarse attribute)
         """
         raise NotImplementedError('ERROR: space_transfer has to implement prolong(self, G)')
+
+    def restrict_stacked(self, F):
+        """
+        Interface to restriction in space of the values at many nodes at once for datatypes based on numpy arrays,
+        which is used by the fused transfer in `base_transfer`.
+
+        Args:
+            F (numpy.ndarray): fine values of shape (M, *shape)
+
+        Returns:
+            numpy.ndarray: coarse values of shape (M, *shape) or None if not available
+        """
+        return None
+
+    def prolong_stacked(self, G):
+        """
+        Interface to prolongation in space of the values at many nodes at once for datatypes based on numpy arrays,
+        which is used by the fused transfer in `base_transfer`.
+
+        Args:
+            G (numpy.ndarray): coarse values of shape (M, *shape)
+
+        Returns:
+            numpy.ndarray: fine values of shape (M, *shape) or None if not available
+        """
+        return None
@@ -269,6 +269,8 @@ class step(FrozenClass):
         # pass u0 to u[0] on the finest level 0
         P = self.levels[0].prob
         self.levels[0].u[0] = P.dtype_u(u0)
+        self.levels[0].status.u0_origin = None
+        self.levels[0].status.uend_stale = True
 
     @property
     def prev(self):
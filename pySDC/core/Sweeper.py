@@ -1,3 +1,4 @@
+import inspect
 import logging
 
 import numpy as np
@@ -5,8 +6,8 @@ import scipy.linalg
 import scipy.optimize as opt
 
 from pySDC.core.Errors import ParameterError
-from pySDC.core.Level import level
-from pySDC.core.Collocation import CollBase
+from pySDC.core.Level import level, NodeStorage
+from pySDC.core.Collocation import CollBase, get_cached
 from pySDC.helpers.pysdc_helper import FrozenClass
 
 
@@ -16,6 +17,8 @@ class _Pars(FrozenClass):
         self.do_coll_update = False
         self.initial_guess = 'spread'
         self.skip_residual_computation = ()  # gain performance at the cost of correct residual output
+        self.batched_integration = False  # integrate all nodes at once for datatypes based on numpy arrays
+        self.inplace_sweeps = False  # reuse buffers in the sweeps for datatypes based on numpy arrays
 
         for k, v in pars.items():
             if k != 'collocation_class':
@@ -79,7 +82,65 @@ class sweeper(object):
 
         self.parallelizable = False
 
+        # persistent scratch arrays for batched operations
+        self.__buffers = {}
+        self.__accepts_out = {}
+
     def get_Qdelta_implicit(self, coll, qd_type):
+        """
+        Get the implicit preconditioner. Preconditioners for the default collocation class are computed once per
+        process and shared among all sweepers, so they are read-only.
+
+        Args:
+            coll (pySDC.Collocation.CollBase): The collocation object
+            qd_type (str): Type of the preconditioner
+
+        Returns:
+            numpy.ndarray: The preconditioner
+        """
+        key = getattr(coll, 'cache_key', None)
+        if key is None:
+            QDmat, parallelizable = self.__compute_Qdelta_implicit(coll, qd_type)
+        else:
+            QDmat, parallelizable = get_cached(
+                ('Qdelta_implicit', qd_type) + key, lambda: self.__compute_Qdelta_implicit(coll, qd_type)
+            )
+        if parallelizable:
+            self.parallelizable = True
+        return QDmat
+
+    def get_Qdelta_explicit(self, coll, qd_type):
+        """
+        Get the explicit preconditioner. Preconditioners for the default collocation class are computed once per
+        process and shared among all sweepers, so they are read-only.
+
+        Args:
+            coll (pySDC.Collocation.CollBase): The collocation object
+            qd_type (str): Type of the preconditioner
+
+        Returns:
+            numpy.ndarray: The preconditioner
+        """
+        key = getattr(coll, 'cache_key', None)
+        if key is None:
+            return self.__compute_Qdelta_explicit(coll, qd_type)
+        return get_cached(('Qdelta_explicit', qd_type) + key, lambda: self.__compute_Qdelta_explicit(coll, qd_type))
+
+    @staticmethod
+    def __compute_Qdelta_implicit(coll, qd_type):
+        """
+        Compute the implicit preconditioner
+
+        Args:
+            coll (pySDC.Collocation.CollBase): The collocation object
+            qd_type (str): Type of the preconditioner
+
+        Returns:
+            numpy.ndarray: The preconditioner
+            bool: Whether the preconditioner is diagonal, such that the nodes can be solved for in parallel
+        """
+        parallelizable = False
+
         def rho(x):
             return max(abs(np.linalg.eigvals(np.eye(m) - np.diag([x[i] for i in range(m)]).dot(coll.Qmat[1:, 1:]))))
 
@@ -104,21 +165,21 @@ class sweeper(object):
         elif qd_type == 'IEpar':
             for m in range(coll.num_nodes + 1):
                 QDmat[m, m] = np.sum(coll.delta_m[0:m])
-            self.parallelizable = True
+            parallelizable = True
         elif qd_type == 'Qpar':
             QDmat = np.diag(np.diag(coll.Qmat))
-            self.parallelizable = True
+            parallelizable = True
         elif qd_type == 'GS':
             QDmat = np.tril(coll.Qmat)
         elif qd_type == 'PIC':
             QDmat = np.zeros(coll.Qmat.shape)
-            self.parallelizable = True
+            parallelizable = True
         elif qd_type == 'MIN':
             m = QDmat.shape[0] - 1
             x0 = 10 * np.ones(m)
             d = opt.minimize(rho, x0, method='Nelder-Mead')
             QDmat[1:, 1:] = np.linalg.inv(np.diag(d.x))
-            self.parallelizable = True
+            parallelizable = True
         elif qd_type == 'MIN_GT':
             m = QDmat.shape[0] - 1
             QDmat[1:, 1:] = np.diag(coll.nodes) / m
@@ -268,7 +329,7 @@ class sweeper(object):
                     'This combination of preconditioner, node type and node number is not ' 'implemented'
                 )
             QDmat[1:, 1:] = np.diag(x)
-            self.parallelizable = True
+            parallelizable = True
         else:
             raise NotImplementedError(f'qd_type implicit "{qd_type}" not implemented')
         # check if we got not more than a lower triangular matrix
@@ -276,15 +337,26 @@ class sweeper(object):
             np.triu(QDmat, k=1), np.zeros(QDmat.shape), err_msg='Lower triangular matrix expected!'
         )
 
-        return QDmat
+        return QDmat, parallelizable
 
-    def get_Qdelta_explicit(self, coll, qd_type):
+    @staticmethod
+    def __compute_Qdelta_explicit(coll, qd_type):
+        """
+        Compute the explicit preconditioner
+
+        Args:
+            coll (pySDC.Collocation.CollBase): The collocation object
+            qd_type (str): Type of the preconditioner
+
+        Returns:
+            numpy.ndarray: The preconditioner
+        """
         QDmat = np.zeros(coll.Qmat.shape)
         if qd_type == 'EE':
-            for m in range(self.coll.num_nodes + 1):
-                QDmat[m, 0:m] = self.coll.delta_m[0:m]
+            for m in range(coll.num_nodes + 1):
+                QDmat[m, 0:m] = coll.delta_m[0:m]
         elif qd_type == 'GS':
-            QDmat = np.tril(self.coll.Qmat, k=-1)
+            QDmat = np.tril(coll.Qmat, k=-1)
         elif qd_type == 'PIC':
             QDmat = np.zeros(coll.Qmat.shape)
         else:
@@ -332,6 +404,185 @@ class sweeper(object):
         L.status.unlocked = True
         L.status.updated = True
 
+    def get_buffer(self, name, shape, dtype):
+        """
+        Get a persistent scratch array of the sweeper, which is only (re-)allocated if shape or dtype change
+
+        Args:
+            name (str): name of the buffer
+            shape (tuple): shape of the buffer
+            dtype (numpy.dtype): dtype of the buffer
+
+        Returns:
+            numpy.ndarray: the buffer, containing whatever was written to it before
+        """
+        buffer = self.__buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self.__buffers[name] = buffer
+        return buffer
+
+    def problem_accepts_out(self, method):
+        """
+        Check if a method of the problem, like `solve_system` or `eval_f`, can write its result to an `out` argument
+
+        Args:
+            method (str): name of the method
+
+        Returns:
+            bool: True if the method has an `out` argument
+        """
+        if method not in self.__accepts_out:
+            func = getattr(self.level.prob, method, None)
+            self.__accepts_out[method] = func is not None and 'out' in inspect.signature(func).parameters
+        return self.__accepts_out[method]
+
+    def update_nodes_inplace(self, known, implicit_part, factor):
+        """
+        Sweep over the nodes using persistent buffers for the right hand sides instead of new data objects. If the
+        level uses contiguous storage and the problem accepts `out` arguments in `solve_system` and `eval_f`, the new
+        values are written directly to the storage, such that the sweep does not allocate new data objects at all.
+
+        Args:
+            known (numpy.ndarray): stacked known values u0 + (Q - Q_delta) F(u^k), which are overwritten here
+            implicit_part (function): adds the contributions of F(u^(k+1)) at node j to the right hand side at node m
+                                      with signature (rhs, m, j, tmp), where tmp is a scratch array of the same shape
+            factor (numpy.ndarray): the prefactors for the implicit solves at the nodes
+
+        Returns:
+            None
+        """
+        L = self.level
+        P = L.prob
+        M = self.coll.num_nodes
+
+        # add tau if associated
+        for m in range(M):
+            if L.tau[m] is not None:
+                known[m] += np.asarray(L.tau[m])
+
+        rhs = self.as_dtype_u_list(self.get_buffer('rhs', (1,) + known.shape[1:], known.dtype))[0]
+        tmp = self.get_buffer('rhs_tmp', known.shape[1:], known.dtype)
+
+        # only write to the values at the nodes directly if they are not shared with other data, e.g. uold
+        contiguous = all(isinstance(me, NodeStorage) and me.contiguous for me in [L.u, L.f])
+        solve_out = contiguous and self.problem_accepts_out('solve_system')
+        eval_out = contiguous and self.problem_accepts_out('eval_f')
+
+        for m in range(M):
+            # build rhs, consisting of the known values from above and new values from previous nodes (at k+1)
+            np.copyto(np.asarray(rhs), known[m])
+            for j in range(1, m + 1):
+                implicit_part(np.asarray(rhs), m + 1, j, tmp)
+
+            # implicit solve with prefactor stemming from the diagonal of Qd
+            t = L.time + L.dt * self.coll.nodes[m]
+            if solve_out:
+                P.solve_system(rhs, factor[m], L.u[m + 1], t, out=L.u[m + 1])
+            else:
+                me = P.solve_system(rhs, factor[m], L.u[m + 1], t)
+                # make sure the new values do not live in the buffer
+                L.u[m + 1] = P.dtype_u(me) if np.shares_memory(me, rhs) else me
+
+            # update function values
+            if eval_out:
+                P.eval_f(L.u[m + 1], t, out=L.f[m + 1])
+            else:
+                L.f[m + 1] = P.eval_f(L.u[m + 1], t)
+
+        # indicate presence of new values at this level
+        L.status.updated = True
+
+        return None
+
+    def get_stacked_nodes(self, values, name, components=None):
+        """
+        Get the values at the nodes 1 to M as a single array of shape (M, *shape). If the values are held in
+        contiguous storage of the level, no copy is needed, otherwise they are copied to a buffer of the sweeper.
+
+        Args:
+            values (list): values at the nodes, including the left boundary
+            name (str): name of the buffer to copy the values to if needed
+            components (tuple of str): components of composite datatypes to be summed up, e.g. ('impl', 'expl')
+
+        Returns:
+            numpy.ndarray: the stacked values or None if the datatype is not based on numpy arrays
+        """
+        M = self.coll.num_nodes
+
+        if any(values[m] is None for m in range(1, M + 1)):
+            return None
+
+        stacks = []
+        for component in [None] if components is None else components:
+            if isinstance(values, NodeStorage) and values.contiguous and component in values.components:
+                stacks.append(values.stack(component)[1:])
+                continue
+
+            arrays = [values[m] if component is None else getattr(values[m], component, None) for m in range(1, M + 1)]
+            if not all(isinstance(me, np.ndarray) for me in arrays):
+                return None
+            stack = self.get_buffer(f'{name}_{component}', (M,) + arrays[0].shape, arrays[0].dtype)
+            for m in range(M):
+                stack[m] = arrays[m]
+            stacks.append(stack)
+
+        if len(stacks) == 1:
+            return stacks[0]
+
+        me = self.get_buffer(f'{name}_sum', stacks[0].shape, np.result_type(*stacks))
+        np.add(stacks[0], stacks[1], out=me)
+        for stack in stacks[2:]:
+            me += stack
+        return me
+
+    def batched_matmul(self, mats, stacks, name):
+        """
+        Compute sum_i mats[i] @ stacks[i] with contraction over the node axis, i.e. the batched version of the double
+        loops over the nodes in the integration.
+
+        Args:
+            mats (list of numpy.ndarray): matrices of shape (M, M)
+            stacks (list of numpy.ndarray): stacked values of shape (M, *shape)
+            name (str): name of the buffer to write the result to
+
+        Returns:
+            numpy.ndarray: the result of shape (M, *shape)
+        """
+        M = mats[0].shape[0]
+        me = self.get_buffer(name, (M,) + stacks[0].shape[1:], np.result_type(*mats, *stacks))
+        np.matmul(mats[0], stacks[0].reshape(stacks[0].shape[0], -1), out=me.reshape(M, -1))
+        for mat, stack in zip(mats[1:], stacks[1:]):
+            tmp = self.get_buffer(f'{name}_tmp', me.shape, me.dtype)
+            np.matmul(mat, stack.reshape(stack.shape[0], -1), out=tmp.reshape(M, -1))
+            me += tmp
+        return me
+
+    def as_dtype_u_list(self, stack):
+        """
+        Convert stacked values to a list of dtype_u objects, which are views into the stacked array
+
+        Args:
+            stack (numpy.ndarray): values of shape (M, *shape)
+
+        Returns:
+            list of dtype_u: the values at the nodes
+        """
+        L = self.level
+        me = stack.view(L.prob.dtype_u)
+        me.__dict__.update(getattr(L.u[0], '__dict__', {}))
+        return [me[m] for m in range(len(me))]
+
+    def integrate_stacked(self):
+        """
+        Interface to batched right-hand side integration for datatypes based on numpy arrays, which is used instead of
+        `integrate` when `batched_integration` is set in the sweeper parameters.
+
+        Returns:
+            numpy.ndarray: the integrals at all nodes as array of shape (M, *shape) or None if not available
+        """
+        return None
+
     def compute_residual(self, stage=None):
         """
         Computation of the residual using the collocation matrix Q
@@ -355,15 +606,17 @@ class sweeper(object):
         # compute the residual for each node
 
         # build QF(u)
-        res_norm = []
-        res = self.integrate()
-        for m in range(self.coll.num_nodes):
-            res[m] += L.u[0] - L.u[m + 1]
-            # add tau if associated
-            if L.tau[m] is not None:
-                res[m] += L.tau[m]
-            # use abs function from data type here
-            res_norm.append(abs(res[m]))
+        res_norm = self.__compute_residual_norms_batched() if self.params.batched_integration else None
+        if res_norm is None:
+            res_norm = []
+            res = self.integrate()
+            for m in range(self.coll.num_nodes):
+                res[m] += L.u[0] - L.u[m + 1]
+                # add tau if associated
+                if L.tau[m] is not None:
+                    res[m] += L.tau[m]
+                # use abs function from data type here
+                res_norm.append(abs(res[m]))
 
         # find maximal residual over the nodes
         if L.params.residual_type == 'full_abs':
@@ -385,6 +638,31 @@ class sweeper(object):
 
         return None
 
+    def __compute_residual_norms_batched(self):
+        """
+        Compute the norms of the residual at all nodes with batched operations on stacked values
+
+        Returns:
+            list: norm of the residual at each node or None if the datatype is not based on numpy arrays
+        """
+        L = self.level
+
+        integral = self.integrate_stacked()
+        u = self.get_stacked_nodes(L.u, 'u')
+        if integral is None or u is None:
+            return None
+
+        # operate on plain arrays, since ufuncs of the datatypes may not respect the `out` argument
+        res = self.get_buffer('residual', integral.shape, np.result_type(integral, u))
+        np.add(integral, np.asarray(L.u[0]), out=res)
+        res -= u
+        for m in range(self.coll.num_nodes):
+            if L.tau[m] is not None:
+                res[m] += np.asarray(L.tau[m])
+
+        # use abs function from data type here
+        return [abs(me) for me in self.as_dtype_u_list(res)]
+
     def compute_end_point(self):
         """
         Abstract interface to end-node computation
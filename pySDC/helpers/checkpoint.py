@@ -0,0 +1,109 @@
+import os
+
+import dill
+import numpy as np
+
+
+class Checkpoint(object):
+    """
+    Store the state of a controller between blocks on disk in order to resume the run later.
+
+    Solutions that are numpy arrays are written to memory-mapped `.npy` files, which are allocated once and then
+    overwritten in place. Two of these files are used alternately, such that the previous checkpoint stays intact
+    while the next one is written. The remaining state is pickled with dill into `<prefix>checkpoint.pkl`, which is
+    replaced only after the solution has been flushed to disk and which tells which of the two solution files is valid.
+    Solutions that are no numpy arrays are pickled together with the rest of the state.
+
+    Attributes:
+        path (str): Directory to write the checkpoint to
+        prefix (str): Prefix of the file names, which needs to be unique for every controller writing to the same
+                      directory, e.g. one per rank
+        slot (int): Index of the solution file that is written next
+    """
+
+    def __init__(self, path, prefix=''):
+        self.path = path
+        self.prefix = prefix
+        self.slot = 0
+        self.__memmaps = [None, None]
+
+    @property
+    def state_file(self):
+        return os.path.join(self.path, f'{self.prefix}checkpoint.pkl')
+
+    def get_solution_file(self, slot):
+        return os.path.join(self.path, f'{self.prefix}checkpoint_{slot}.npy')
+
+    def exists(self):
+        return os.path.isfile(self.state_file)
+
+    def __get_memmap(self, slot, solution):
+        """
+        Get a memory map for the solution file, which is only allocated if it does not match the solution already
+
+        Args:
+            slot (int): Index of the solution file
+            solution (numpy.ndarray): The solution that is supposed to be written
+
+        Returns:
+            numpy.memmap: Memory map of the solution file
+        """
+        memmap = self.__memmaps[slot]
+        if memmap is None or memmap.shape != solution.shape or memmap.dtype != solution.dtype:
+            memmap = np.lib.format.open_memmap(
+                self.get_solution_file(slot), mode='w+', dtype=solution.dtype, shape=solution.shape
+            )
+            self.__memmaps[slot] = memmap
+        return memmap
+
+    def write(self, solution, state):
+        """
+        Write a checkpoint
+
+        Args:
+            solution: The solution to restart from
+            state (dict): Everything else that is needed to resume, needs to be picklable by dill
+
+        Returns:
+            None
+        """
+        os.makedirs(self.path, exist_ok=True)
+
+        if isinstance(solution, np.ndarray):
+            memmap = self.__get_memmap(self.slot, solution)
+            memmap[...] = solution
+            memmap.flush()
+            state = {**state, 'solution_slot': self.slot}
+            self.slot = 1 - self.slot
+        else:
+            state = {**state, 'solution': solution}
+
+        # replace the state atomically, such that there is always a complete checkpoint on disk
+        tmp_file = f'{self.state_file}.tmp'
+        with open(tmp_file, 'wb') as file:
+            dill.dump(state, file)
+        os.replace(tmp_file, self.state_file)
+
+    def read(self):
+        """
+        Read the last checkpoint
+
+        Returns:
+            The solution, which is a read-only memory map if it has been stored as a numpy array
+            dict: The rest of the state
+        """
+        with open(self.state_file, 'rb') as file:
+            state = dill.load(file)
+
+        if 'solution_slot' in state.keys():
+            slot = state.pop('solution_slot')
+            solution = np.load(self.get_solution_file(slot), mmap_mode='r')
+            # do not overwrite the solution we resume from when writing the next checkpoint
+            self.slot = 1 - slot
+        else:
+            solution = state.pop('solution')
+        return solution, state
+
+    def __getstate__(self):
+        # memory maps are not copied
+        return {**self.__dict__, '_Checkpoint__memmaps': [None, None]}
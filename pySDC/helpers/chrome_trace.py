@@ -0,0 +1,124 @@
+import json
+import os
+import time
+
+
+class ChromeTrace(object):
+    """
+    Collect events for a timeline in the Chrome trace event format, which can be viewed in Perfetto
+    (https://ui.perfetto.dev) or `chrome://tracing`.
+
+    Events are "complete" events with a start time and a duration in microseconds, which are placed on a track given by
+    a process id and a thread id. Timestamps are taken from `time.perf_counter` and shifted to wall clock time once when
+    creating the trace, such that traces written by different processes can be merged with `merge_traces`.
+
+    Attributes:
+        events (list): The events that have been recorded
+    """
+
+    def __init__(self):
+        self.events = []
+        self.__offset = time.time() - time.perf_counter()
+        self.__names = {}
+
+    @staticmethod
+    def now():
+        """
+        Get the current time to be passed as start of an event
+
+        Returns:
+            float: Time in seconds
+        """
+        return time.perf_counter()
+
+    def add_event(self, name, category, start, pid, tid, args=None):
+        """
+        Add an event that started at `start` and ends now
+
+        Args:
+            name (str): Name of the event
+            category (str): Category of the event, which can be used for filtering in the viewer
+            start (float): Start of the event as returned by `now`
+            pid (int): Process id of the track
+            tid (int): Thread id of the track
+            args (dict): Additional information shown when selecting the event
+
+        Returns:
+            None
+        """
+        end = time.perf_counter()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start + self.__offset) * 1e6,
+            'dur': (end - start) * 1e6,
+            'pid': pid,
+            'tid': tid,
+        }
+        if args is not None:
+            event['args'] = args
+        self.events.append(event)
+
+    def name_track(self, pid, tid, process_name, thread_name):
+        """
+        Give names to a track, which are shown in the viewer instead of the ids. Names are only added once.
+
+        Args:
+            pid (int): Process id of the track
+            tid (int): Thread id of the track
+            process_name (str): Name of the process
+            thread_name (str): Name of the thread
+
+        Returns:
+            None
+        """
+        for key, name, value, _tid in [
+            ((pid,), 'process_name', process_name, 0),
+            ((pid, tid), 'thread_name', thread_name, tid),
+        ]:
+            if self.__names.get(key) != value:
+                self.__names[key] = value
+                self.events.append({'name': name, 'ph': 'M', 'pid': pid, 'tid': _tid, 'args': {'name': value}})
+
+    def reset(self):
+        """
+        Remove all events
+        """
+        self.events = []
+        self.__names = {}
+
+    def write(self, path):
+        """
+        Write the events to a JSON file
+
+        Args:
+            path (str): Name of the file
+
+        Returns:
+            None
+        """
+        directory = os.path.dirname(path)
+        if directory != '':
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, file)
+
+
+def merge_traces(paths, path):
+    """
+    Merge traces written by different processes, e.g. all MPI ranks, into a single file
+
+    Args:
+        paths (list): Names of the files to merge
+        path (str): Name of the merged file
+
+    Returns:
+        None
+    """
+    events = []
+    for me in paths:
+        with open(me, 'r') as file:
+            events += json.load(file)['traceEvents']
+    with open(path, 'w') as file:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
@@ -0,0 +1,157 @@
+import numpy as np
+from scipy.sparse.linalg import LinearOperator, splu
+
+from pySDC.core.Problem import FactorizationCache
+
+
+class GeometricMultigrid(object):
+    """
+    Geometric multigrid for the linear systems `(I - factor * A) u = rhs` of the implicit solves of problems with a
+    spatial discretization matrix `A`, which can be used as a solver or as a preconditioner for Krylov methods.
+
+    The hierarchy is given by a list of problems from fine to coarse, which discretize the same operator on coarser
+    grids, and the space transfer class that is used for the transfer between the levels in the level hierarchy of
+    pySDC as well, i.e. usually `mesh_to_mesh`. The levels are smoothed with damped Jacobi and the system on the
+    coarsest level is solved with a sparse LU decomposition. With `cycle='V'`, one correction is computed on each
+    coarser level per cycle, whereas `cycle='W'` computes two. The operators of the levels and the LU decomposition
+    depend on the factor and are cached for reuse across solves.
+
+    >>> multigrid = GeometricMultigrid([fine_prob, coarse_prob, coarsest_prob], mesh_to_mesh, {'periodic': True})
+    >>> u, niter = multigrid.solve(rhs, factor, u0, tol=1e-10, maxiter=20)
+
+    Attributes:
+        problems (list): The problems on the levels from fine to coarse
+        transfers (list): Space transfer objects between consecutive levels
+        cycle (str): Type of the cycle, either "V" or "W"
+        smoothing_steps (int): Number of pre- and post-smoothing steps
+        omega (float): Damping parameter of the Jacobi smoother
+        operators (FactorizationCache): Level operators, their diagonals and the coarse solver for the factors
+    """
+
+    cycles = {'V': 1, 'W': 2}
+
+    def __init__(self, problems, transfer_class, transfer_params=None, cycle='V', smoothing_steps=2, omega=None):
+        if cycle not in self.cycles.keys():
+            raise ValueError(f'Unknown multigrid cycle {cycle!r}, choose from {list(self.cycles.keys())}')
+        if len(problems) < 2:
+            raise ValueError('Multigrid needs at least two levels')
+
+        self.problems = problems
+        self.transfers = [
+            transfer_class(fine_prob=problems[i], coarse_prob=problems[i + 1], params=transfer_params or {})
+            for i in range(len(problems) - 1)
+        ]
+        self.cycle = cycle
+        self.smoothing_steps = smoothing_steps
+        # damping that minimizes the smoothing factor for the Laplacian in the respective dimension
+        ndim = len(np.shape(problems[0].u_init))
+        self.omega = 2 * ndim / (2 * ndim + 1) if omega is None else omega
+        self.operators = FactorizationCache()
+
+    def __get_operators(self, factor):
+        """
+        Set up the operators `I - factor * A` on all levels along with their diagonals and the coarse solver
+
+        Args:
+            factor (float): The factor in front of `A`
+
+        Returns:
+            list: Level operators
+            list: Diagonals of the level operators
+            callable: Solver for the system on the coarsest level
+        """
+
+        def setup():
+            operators = []
+            diagonals = []
+            for P in self.problems[:-1]:
+                A = P.A
+                operators.append(LinearOperator(A.shape, matvec=lambda x, A=A: x - factor * A.dot(x), dtype=A.dtype))
+                diagonals.append(1.0 - factor * A.diagonal())
+            P = self.problems[-1]
+            coarse_solver = splu((P.Id - factor * P.A).tocsc()).solve
+            return operators, diagonals, coarse_solver
+
+        return self.operators.get(factor, setup)
+
+    def __cycle(self, level, rhs, u, operators, diagonals, coarse_solver):
+        """
+        Perform one cycle on a level
+
+        Args:
+            level (int): Index of the level
+            rhs (numpy.ndarray): Flattened right hand side
+            u (numpy.ndarray): Flattened initial guess, which is modified
+            operators (list): Level operators
+            diagonals (list): Diagonals of the level operators
+            coarse_solver (callable): Solver for the system on the coarsest level
+
+        Returns:
+            numpy.ndarray: The improved solution
+        """
+        if level == len(self.problems) - 1:
+            return coarse_solver(rhs)
+
+        M, inv_diagonal = operators[level], self.omega / diagonals[level]
+        for _ in range(self.smoothing_steps):
+            u += inv_diagonal * (rhs - M.matvec(u))
+
+        transfer = self.transfers[level]
+        rhs_coarse = transfer.Rspace.dot(rhs - M.matvec(u))
+        e_coarse = np.zeros_like(rhs_coarse)
+        for _ in range(self.cycles[self.cycle] if level < len(self.problems) - 2 else 1):
+            e_coarse = self.__cycle(level + 1, rhs_coarse, e_coarse, operators, diagonals, coarse_solver)
+        u += transfer.Pspace.dot(e_coarse)
+
+        for _ in range(self.smoothing_steps):
+            u += inv_diagonal * (rhs - M.matvec(u))
+        return u
+
+    def solve(self, rhs, factor, u0, tol, maxiter, callback=None):
+        """
+        Solve `(I - factor * A) u = rhs` by multigrid cycles until the residual is reduced below the tolerance
+        relative to the right hand side
+
+        Args:
+            rhs (numpy.ndarray): Right hand side with the shape of the grid
+            factor (float): The factor in front of `A`
+            u0 (numpy.ndarray): Initial guess with the shape of the grid
+            tol (float): Relative tolerance for the residual in the 2-norm
+            maxiter (int): Maximal number of cycles
+            callback (callable): Function that is called after every cycle
+
+        Returns:
+            numpy.ndarray: Flattened solution
+            int: Number of cycles
+        """
+        operators, diagonals, coarse_solver = self.__get_operators(factor)
+        rhs = np.asarray(rhs).flatten()
+        u = np.array(u0, dtype=rhs.dtype).flatten()
+        norm_rhs = np.linalg.norm(rhs)
+
+        niter = 0
+        while niter < maxiter and np.linalg.norm(rhs - operators[0].matvec(u)) > tol * norm_rhs:
+            u = self.__cycle(0, rhs, u, operators, diagonals, coarse_solver)
+            niter += 1
+            if callback is not None:
+                callback(u)
+        return u, niter
+
+    def get_preconditioner(self, factor):
+        """
+        Get a preconditioner for `I - factor * A` that performs one cycle with zero initial guess. It is symmetric for
+        symmetric `A`, such that it can be used with CG as well.
+
+        Args:
+            factor (float): The factor in front of `A`
+
+        Returns:
+            scipy.sparse.linalg.LinearOperator: The preconditioner
+        """
+        operators, diagonals, coarse_solver = self.__get_operators(factor)
+
+        def apply(rhs):
+            rhs = np.asarray(rhs).flatten()
+            return self.__cycle(0, rhs, np.zeros_like(rhs), operators, diagonals, coarse_solver)
+
+        return LinearOperator(operators[0].shape, matvec=apply, dtype=operators[0].dtype)
@@ -1,4 +1,6 @@
 import numpy as np
+from numba import jit
+from scipy.sparse.linalg import LinearOperator
 from scipy.special import factorial
 
 
@@ -130,3 +132,184 @@ def get_finite_difference_matrix(
     A /= dx**derivative
 
     return A
+
+
+def get_finite_difference_symbol(
+    derivative, order, stencil_type=None, steps=None, dx=None, size=None, dim=None, bc=None
+):
+    """
+    Get the eigenvalues of the FD matrix from `get_finite_difference_matrix` in the basis that diagonalizes it, which
+    is the discrete Fourier basis for periodic boundary conditions and the basis of the discrete sine transform of
+    type I for Dirichlet-zero boundary conditions. The latter requires a symmetric stencil with three points at most.
+
+    The eigenvalues are arranged such that they can be applied to the coefficients computed by
+    `scipy.fft.rfftn(u)` in the periodic case or `scipy.fft.dstn(u, type=1)` in the Dirichlet-zero case.
+
+    Args:
+        derivative (int): Order of the derivative
+        order (int): Order of accuracy
+        stencil_type (str): Type of the stencil
+        steps (list): Provide specific steps, overrides `stencil_type`
+        dx (float): Mesh width
+        size (int): Number of degrees of freedom per dimension
+        dim (int): Number of dimensions
+        bc (str): Boundary conditions
+
+    Returns:
+        numpy.ndarray: The eigenvalues
+    """
+    coeff, steps = get_finite_difference_stencil(
+        derivative=derivative, order=order, stencil_type=stencil_type, steps=steps
+    )
+
+    if bc == 'periodic':
+        k = np.arange(size)
+        symbol_1d = np.exp(2j * np.pi * np.outer(k, steps) / size) @ coeff
+        if np.allclose(symbol_1d.imag, 0):
+            symbol_1d = symbol_1d.real
+        symbols = [symbol_1d] * (dim - 1) + [symbol_1d[: size // 2 + 1]]
+    elif bc == 'dirichlet-zero':
+        stencil = dict(zip(steps, coeff))
+        if max(abs(steps)) > 1 or not np.isclose(stencil.get(-1, 0.0), stencil.get(1, 0.0)):
+            raise NotImplementedError(
+                'Dirichlet-zero boundary conditions require symmetric stencils with three points at most'
+            )
+        k = np.arange(1, size + 1)
+        symbols = [stencil.get(0, 0.0) + 2 * stencil.get(1, 0.0) * np.cos(np.pi * k / (size + 1))] * dim
+    else:
+        raise NotImplementedError(f'Boundary conditions {bc} not implemented.')
+
+    symbol = np.zeros([len(me) for me in symbols], dtype=np.result_type(*symbols))
+    for i, me in enumerate(symbols):
+        shape = [1] * dim
+        shape[i] = -1
+        symbol = symbol + me.reshape(shape)
+
+    return symbol / dx**derivative
+
+
+@jit(nopython=True, nogil=True)
+def apply_stencil(u, out, weights, steps, dim, periodic):
+    """
+    Apply a finite difference stencil along the last `dim` axes of three dimensional data in a single pass
+
+    Args:
+        u (numpy.ndarray): Data to apply the stencil to
+        out (numpy.ndarray): Array to store the result in
+        weights (numpy.ndarray): Weights of the stencil
+        steps (numpy.ndarray): Offsets of the stencil
+        dim (int): Number of axes to apply the stencil along
+        periodic (bool): Use periodic boundary conditions instead of Dirichlet-zero
+
+    Returns:
+        None
+    """
+    n0, n1, n2 = u.shape
+    for i in range(n0):
+        for j in range(n1):
+            # every loop over the last axis is contiguous and without branches, such that it can be vectorized
+            row, u_row = out[i, j], u[i, j]
+            row[:] = 0.0
+            for m in range(len(steps)):
+                s, w = steps[m], weights[m]
+
+                # last axis: the interior first and then the points where the stencil wraps around
+                for k in range(max(0, -s), min(n2, n2 - s)):
+                    row[k] += w * u_row[k + s]
+                if periodic:
+                    for k in range(0, max(0, -s)):
+                        row[k] += w * u_row[k + s + n2]
+                    for k in range(min(n2, n2 - s), n2):
+                        row[k] += w * u_row[k + s - n2]
+
+                # other axes: add the shifted rows
+                for axis in range(1, dim):
+                    jj, ii = (j + s, i) if axis == 1 else (j, i + s)
+                    if periodic:
+                        jj, ii = jj % n1, ii % n0
+                    elif jj < 0 or jj >= n1 or ii < 0 or ii >= n0:
+                        continue
+                    shifted = u[ii, jj]
+                    for k in range(n2):
+                        row[k] += w * shifted[k]
+
+
+class FiniteDifferenceOperator(LinearOperator):
+    """
+    Matrix-free version of the FD matrix from `get_finite_difference_matrix` for periodic and Dirichlet-zero boundary
+    conditions. The stencil is applied in a single compiled pass over the grid, which avoids assembling the matrix as
+    well as flattening and reshaping the data.
+
+    Use `apply` to act on data with the shape of the grid and the `LinearOperator` interface, i.e. `matvec` or
+    `dot`, to act on flattened data, e.g. in the Krylov solvers of scipy.
+
+    Attributes:
+        nvars (tuple): Shape of the grid
+        weights (numpy.ndarray): Weights of the stencil including the scaling with the mesh width
+        steps (numpy.ndarray): Offsets of the stencil
+        bc (str): Boundary conditions
+    """
+
+    def __init__(
+        self, derivative, order, stencil_type=None, steps=None, dx=None, size=None, dim=None, bc=None, scale=1.0
+    ):
+        """
+        Args:
+            derivative (int): Order of the derivative
+            order (int): Order of accuracy
+            stencil_type (str): Type of the stencil
+            steps (list): Provide specific steps, overrides `stencil_type`
+            dx (float): Mesh width
+            size (int): Number of degrees of freedom per dimension
+            dim (int): Number of dimensions
+            bc (str): Boundary conditions
+            scale (float): Factor in front of the operator, e.g. a diffusion coefficient
+        """
+        if bc not in ['periodic', 'dirichlet-zero']:
+            raise NotImplementedError(f'Boundary conditions {bc} not implemented.')
+        if order > 2 and bc != 'periodic':
+            raise NotImplementedError('Higher order allowed only for periodic boundary conditions')
+
+        coeff, steps = get_finite_difference_stencil(
+            derivative=derivative, order=order, stencil_type=stencil_type, steps=steps
+        )
+        self.nvars = (size,) * dim
+        self.weights = coeff * scale / dx**derivative
+        self.steps = np.asarray(steps, dtype=int)
+        self.bc = bc
+
+        super().__init__(dtype=np.dtype('float64'), shape=(size**dim, size**dim))
+
+    def apply(self, u, out=None):
+        """
+        Apply the operator to data with the shape of the grid
+
+        Args:
+            u (numpy.ndarray): Data to apply the operator to
+            out (numpy.ndarray): Array to store the result in instead of creating a new one, must not be `u`
+
+        Returns:
+            numpy.ndarray: The result
+        """
+        # the kernel works on three dimensional data and applies the stencil along the last `dim` axes
+        shape = (1,) * (3 - len(self.nvars)) + self.nvars
+        out = np.empty(np.shape(u), dtype=self.dtype) if out is None else out
+        res = np.asarray(out).reshape(shape)
+        apply_stencil(
+            np.asarray(u).reshape(shape), res, self.weights, self.steps, len(self.nvars), self.bc == 'periodic'
+        )
+        if not np.shares_memory(res, out):
+            out[...] = res.reshape(np.shape(out))
+        return out
+
+    def diagonal(self):
+        """
+        Get the diagonal of the operator, which is constant for the stencil
+
+        Returns:
+            numpy.ndarray: The diagonal
+        """
+        return np.full(self.shape[0], len(self.nvars) * np.sum(self.weights[self.steps == 0]))
+
+    def _matvec(self, x):
+        return self.apply(x).reshape(x.shape)
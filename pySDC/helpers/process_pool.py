@@ -0,0 +1,250 @@
+import multiprocessing
+import weakref
+
+import dill
+
+from pySDC.core.Controller import controller
+from pySDC.core.Errors import ControllerError
+from pySDC.core.Level import NodeStorage
+from pySDC.core.Problem import WorkCounter
+
+
+def pop_work_counts(S):
+    """
+    Get the work done on the levels of a step since the last call and reset the work counters
+
+    Args:
+        S (pySDC.Step.step): The step
+
+    Returns:
+        list: Dictionaries with the increments of the work counters for every level
+    """
+    counts = []
+    for L in S.levels:
+        counts.append({key: me.niter for key, me in L.prob.work_counters.items() if me.niter != 0})
+        for key in counts[-1].keys():
+            L.prob.work_counters[key].niter = 0
+    return counts
+
+
+def run_worker(conn, data):
+    """
+    Main loop of a worker process, which executes commands on its copy of a step until it is told to stop
+
+    Args:
+        conn (multiprocessing.connection.Connection): Connection to the controller
+        data (bytes): The step pickled with dill
+
+    Returns:
+        None
+    """
+    S = dill.loads(data)
+    pop_work_counts(S)
+
+    while True:
+        command, args, state = conn.recv()
+        if command == 'stop':
+            break
+
+        try:
+            controller.set_step_state(S, state)
+            if command == 'sweep':
+                level, stage = args
+                S.levels[level].sweep.update_nodes()
+                S.levels[level].sweep.compute_residual(stage=stage)
+            elif command == 'transfer':
+                source, target = args
+                S.transfer(source=S.levels[source], target=S.levels[target])
+            else:
+                raise ControllerError(f'Unknown command {command!r} for worker process')
+            conn.send(('ok', controller.get_step_state(S), pop_work_counts(S)))
+        except Exception as e:
+            try:
+                conn.send(('error', e, None))
+            except Exception:
+                # the exception itself cannot be pickled
+                conn.send(('error', ControllerError(f'{type(e).__name__} in worker process: {e}'), None))
+
+    conn.close()
+
+
+class StepProcessPool(object):
+    """
+    Execute sweeps and transfers of the steps in a block in parallel, with one worker process per step.
+
+    The values at the collocation nodes of all levels are moved to `NodeStorage` objects in shared memory, such that the
+    controller and the workers operate on the same data and only the status of the step needs to be sent along with
+    the commands. Everything else, i.e. communication, convergence control and hooks, stays with the controller, which
+    keeps the statistics complete. The work counters of the problems in the workers are added to the ones of the
+    controller after every command.
+
+    Since the storage is allocated once, the number of collocation nodes must not change during the run. Also, changes
+    to the parameters of sweepers or problems made by the controller after setting up the pool are not passed on to the
+    workers.
+
+    Attributes:
+        steps (list): The steps that are executed by the workers
+    """
+
+    def __init__(self, steps):
+        """
+        Initialization routine, which moves the values of the steps to shared memory and starts the workers
+
+        Args:
+            steps (list): The steps that are executed by the workers
+        """
+        self.steps = list(steps)
+        # the shared memory module is only available from Python 3.8
+        from pySDC.helpers.shared_memory import SharedArrays
+
+        self.__shared = SharedArrays()
+        self.__connections = []
+        self.__processes = []
+        self.__finalizer = weakref.finalize(
+            self, StepProcessPool.shutdown, self.__connections, self.__processes, self.__shared
+        )
+
+        for S in self.steps:
+            self.share_step(S)
+
+        context = multiprocessing.get_context()
+        for S in self.steps:
+            # the workers only need their own step
+            prev, next = S.prev, S.next
+            S.prev, S.next = None, None
+            try:
+                data = dill.dumps(S)
+            finally:
+                S.prev, S.next = prev, next
+
+            conn, child_conn = context.Pipe()
+            process = context.Process(target=run_worker, args=(child_conn, data), daemon=True)
+            process.start()
+            child_conn.close()
+
+            self.__connections.append(conn)
+            self.__processes.append(process)
+
+    def share_step(self, S):
+        """
+        Replace the storage for the values at the nodes on all levels of a step by storage in shared memory, keeping
+        the values that are currently stored
+
+        Args:
+            S (pySDC.Step.step): The step
+
+        Returns:
+            None
+        """
+        for L in S.levels:
+            L.params.contiguous_storage = True
+            num_nodes = L.sweep.coll.num_nodes
+            template_u = L.prob.dtype_u(L.prob.init)
+            template_f = L.prob.dtype_f(L.prob.init)
+
+            for name, size, template in [
+                ('u', num_nodes + 1, template_u),
+                ('uold', num_nodes + 1, template_u),
+                ('f', num_nodes + 1, template_f),
+                ('fold', num_nodes + 1, template_f),
+                ('tau', num_nodes, template_u),
+            ]:
+                storage = NodeStorage(size, allocator=self.__shared.allocate)
+                storage.allocate(template)
+                if not storage.contiguous:
+                    raise ControllerError(
+                        f'Datatype {type(template).__name__} cannot be stored in shared memory, use the serial backend'
+                    )
+                storage[:] = getattr(L, name)
+                setattr(L, name, storage)
+
+    def sweep(self, steps, level, stage):
+        """
+        Update the nodes and compute the residual on one level of the steps in parallel
+
+        Args:
+            steps (list): The steps to sweep
+            level (int): Index of the level
+            stage (str): Stage of the controller, passed on to the residual computation
+
+        Returns:
+            None
+        """
+        self.__run(steps, 'sweep', (level, stage))
+
+    def transfer(self, steps, source, target):
+        """
+        Transfer between two levels of the steps in parallel
+
+        Args:
+            steps (list): The steps to transfer on
+            source (int): Index of the level the values come from
+            target (int): Index of the level that receives the values
+
+        Returns:
+            None
+        """
+        self.__run(steps, 'transfer', (source, target))
+
+    def __run(self, steps, command, args):
+        """
+        Send a command to the workers of the steps and wait until all of them are done
+
+        Args:
+            steps (list): The steps to execute the command on
+            command (str): Name of the command
+            args (tuple): Arguments of the command
+
+        Returns:
+            None
+        """
+        workers = [next(i for i, me in enumerate(self.steps) if me is S) for S in steps]
+        for S, i in zip(steps, workers):
+            self.__connections[i].send((command, args, controller.get_step_state(S)))
+
+        # collect the results of all workers before raising errors to keep the connections in sync
+        errors = []
+        for S, i in zip(steps, workers):
+            result, value, counts = self.__connections[i].recv()
+            if result == 'ok':
+                controller.set_step_state(S, value)
+                for L, level_counts in zip(S.levels, counts):
+                    for key, niter in level_counts.items():
+                        L.prob.work_counters.setdefault(key, WorkCounter()).niter += niter
+            else:
+                errors.append(value)
+
+        if len(errors) > 0:
+            raise errors[0]
+
+    def close(self):
+        """
+        Stop the workers and release the shared memory. The values at the nodes stay valid until they are replaced.
+        """
+        self.__finalizer()
+
+    @staticmethod
+    def shutdown(connections, processes, shared):
+        """
+        Stop worker processes and release shared memory
+
+        Args:
+            connections (list): Connections to the workers
+            processes (list): The worker processes
+            shared (SharedArrays): The shared memory
+
+        Returns:
+            None
+        """
+        for conn in connections:
+            try:
+                conn.send(('stop', None, None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in connections:
+            conn.close()
+        shared.close()
@@ -0,0 +1,88 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+
+class _SharedMemory(SharedMemory):
+    """
+    Shared memory block that can be garbage collected while numpy arrays still refer to it, in which case the memory
+    is unmapped once the arrays are gone
+    """
+
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, BufferError):
+            pass
+
+
+class SharedArrayRef(object):
+    """
+    Picklable reference to a numpy array in shared memory, which can be attached to in other processes
+
+    Attributes:
+        name (str): Name of the shared memory block
+        shape (tuple): Shape of the array
+        dtype (numpy.dtype): Data type of the array
+    """
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self.__shm = None
+
+    def attach(self):
+        """
+        Get the array from the shared memory block. The block is kept open as long as this reference exists.
+
+        Returns:
+            numpy.ndarray: The array
+        """
+        if self.__shm is None:
+            self.__shm = _SharedMemory(name=self.name)
+        return np.ndarray(self.shape, dtype=self.dtype, buffer=self.__shm.buf)
+
+    def __getstate__(self):
+        return {'name': self.name, 'shape': self.shape, 'dtype': self.dtype, '_SharedArrayRef__shm': None}
+
+
+class SharedArrays(object):
+    """
+    Allocate numpy arrays in shared memory. The memory is released when calling `close`, which needs to be done by the
+    process that allocated the arrays.
+    """
+
+    def __init__(self):
+        self.__blocks = []
+
+    def __len__(self):
+        return len(self.__blocks)
+
+    def allocate(self, shape, dtype):
+        """
+        Allocate an array in shared memory, which can be passed as allocator to `NodeStorage`
+
+        Args:
+            shape (tuple): Shape of the array
+            dtype (numpy.dtype): Data type of the array
+
+        Returns:
+            numpy.ndarray: The array, initialized with zeros
+            SharedArrayRef: Reference to the array that can be sent to other processes
+        """
+        dtype = np.dtype(dtype)
+        shm = _SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        self.__blocks.append(shm)
+
+        array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        array[...] = 0
+        return array, SharedArrayRef(shm.name, shape, dtype)
+
+    def close(self):
+        """
+        Release all shared memory. Arrays that are still in use stay valid until they are deleted.
+        """
+        for shm in self.__blocks:
+            shm.unlink()
+        self.__blocks = []
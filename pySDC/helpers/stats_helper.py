@@ -1,6 +1,289 @@
+import array
+import numbers
+import operator
+
 import numpy as np
 
 
+class ColumnarStats(dict):
+    """
+    Dictionary of statistics that additionally stores the fields of the keys in append-only typed columns, with the
+    types encoded as integers. This allows to filter and sort large numbers of entries in vectorized fashion instead of
+    looping over all keys. Otherwise, it behaves like the dictionary of statistics with namedtuple keys.
+
+    Entries are never removed from the columns, but flagged as deleted, such that rows keep the order of insertion.
+    If keys do not have numerical fields, the store is flagged as irregular and queries fall back to looping.
+
+    Attributes:
+        fields (list): Numerical fields of the keys that are stored in columns
+    """
+
+    fields = ['process', 'time', 'level', 'iter', 'sweep', 'num_restarts']
+    __get_fields = operator.attrgetter(*fields)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.__reset_columns()
+        self.update(*args, **kwargs)
+
+    def __reset_columns(self):
+        self.__data = array.array('d')  # numerical fields of all rows, stored row by row
+        self.__codes = array.array('q')  # type of each row encoded as integer
+        self.__type_codes = {}  # code for each type
+        self.__keys = []  # key for each row
+        self.__values = []  # value for each row
+        self.__rows = {}  # row for each key
+        self.__alive = bytearray()  # flags marking rows of keys that have not been deleted
+        self.__regular = True
+        self.__cache = None
+
+    def __append(self, key, value):
+        """
+        Add a row to the columns for a new key
+        """
+        row = len(self.__keys)
+        try:
+            self.__data.extend(self.__get_fields(key))
+            code = self.__type_codes.setdefault(key.type, len(self.__type_codes))
+        except (AttributeError, TypeError):
+            # the key does not look like the usual entries, so we mark the row as irregular
+            del self.__data[row * len(self.fields) :]
+            self.__data.extend([np.nan] * len(self.fields))
+            code = -1
+            self.__regular = False
+
+        self.__codes.append(code)
+        self.__keys.append(key)
+        self.__values.append(value)
+        self.__rows[key] = row
+        self.__alive.append(1)
+
+    def __remove(self, key):
+        """
+        Flag the row of a key as deleted
+        """
+        row = self.__rows.pop(key)
+        self.__alive[row] = 0
+        self.__values[row] = None
+        self.__cache = None
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self.__values[self.__rows[key]] = value
+        else:
+            self.__append(key, value)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.__remove(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            value = super().pop(key)
+            self.__remove(key)
+            return value
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self.__remove(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        if len(args) == 1 and not kwargs and not self.__keys and type(args[0]) is type(self):
+            # copy the columns directly if we start from scratch
+            return self.__extend(args[0], np.flatnonzero(args[0].__get_columns()['alive']))
+
+        for other in args + (kwargs,):
+            for key, value in other.items() if hasattr(other, 'items') else other:
+                self[key] = value
+
+    def __extend(self, other, rows, values=None):
+        """
+        Copy selected rows from another store into this empty store without looking at the keys individually
+
+        Args:
+            other (ColumnarStats): The store to copy from
+            rows (numpy.ndarray): Indices of the rows to copy
+            values (list): Values to store for the rows instead of the ones stored in the other store
+        """
+        columns = other.__get_columns()
+        keys = [other.__keys[row] for row in rows]
+        values = [other.__values[row] for row in rows] if values is None else values
+        super().update(zip(keys, values))
+
+        self.__data.frombytes(columns['data'][rows].tobytes())
+        self.__codes.frombytes(columns['codes'][rows].tobytes())
+        self.__type_codes = other.__type_codes.copy()
+        self.__keys = keys
+        self.__values = values
+        self.__rows = dict(zip(keys, range(len(keys))))
+        self.__alive = bytearray(b'\x01' * len(keys))
+        self.__regular = other.__regular
+        self.__cache = None
+
+    def clear(self):
+        super().clear()
+        self.__reset_columns()
+
+    def copy(self):
+        return type(self)(self)
+
+    def __reduce__(self):
+        # the columns are rebuilt when unpickling
+        return type(self), (), None, None, iter(self.items())
+
+    def __get_columns(self):
+        """
+        Get the columns as numpy arrays, which are cached until the stats are modified
+
+        Returns:
+            dict: Columns of the numerical fields and of the type codes as well as the flags of rows that have not been
+                  deleted and the numerical fields of all rows as two dimensional array
+        """
+        # the cache is invalidated when removing entries or when new entries have been appended
+        if self.__cache is None or len(self.__cache['codes']) != len(self.__keys):
+            data = np.frombuffer(self.__data, dtype=float).reshape((-1, len(self.fields))).copy()
+            self.__cache = {key: data[:, i] for i, key in enumerate(self.fields)}
+            self.__cache['data'] = data
+            self.__cache['codes'] = np.frombuffer(self.__codes, dtype=np.int64).copy()
+            self.__cache['alive'] = np.frombuffer(bytes(self.__alive), dtype=np.uint8).astype(bool)
+        return self.__cache
+
+    def _get_values(self, rows):
+        """
+        Get the values stored in some rows
+
+        Args:
+            rows (numpy.ndarray): The rows
+
+        Returns:
+            list: The values
+        """
+        values = self.__values
+        return [values[row] for row in rows]
+
+    def get_rows(self, type=None, **kwargs):
+        """
+        Get the rows of all entries that match the filter using vectorized comparisons.
+
+        Args:
+            type (str): Type of the entries or None to select all types
+            kwargs: Values of the numerical fields of the keys or None to select all values
+
+        Returns:
+            numpy.ndarray: Rows of the matching entries in order of insertion or None if they cannot be filtered by column
+        """
+        if not self.__regular or any(not (me is None or isinstance(me, numbers.Real)) for me in kwargs.values()):
+            return None
+
+        columns = self.__get_columns()
+        mask = columns['alive'].copy()
+        if type is not None:
+            mask &= columns['codes'] == self.__type_codes.get(type, -1)
+        for field, value in kwargs.items():
+            if value is not None:
+                mask &= columns[field] == value
+
+        return np.flatnonzero(mask)
+
+    def select(self, type=None, **kwargs):
+        """
+        Get a store with all entries that match the filter.
+
+        Args:
+            type (str): Type of the entries or None to select all types
+            kwargs: Values of the numerical fields of the keys or None to select all values
+
+        Returns:
+            ColumnarStats: Matching entries in order of insertion or None if they cannot be filtered by column
+        """
+        rows = self.get_rows(type=type, **kwargs)
+        if rows is None:
+            return None
+
+        result = ColumnarStats()
+        result.__extend(self, rows, values=self._get_values(rows))
+        return result
+
+    def sorted_items(self, sortby, rows=None):
+        """
+        Get the entries sorted by one of the numerical fields. Sorting is stable, such that entries with the same value
+        remain in order of insertion.
+
+        Args:
+            sortby (str): The field to sort by
+            rows (numpy.ndarray): Rows of the entries to sort, e.g. from `get_rows`, or None for all entries
+
+        Returns:
+            list: Tuples of the sortby field and the value or None if the entries cannot be sorted by column
+        """
+        if not self.__regular or sortby not in self.fields:
+            return None
+
+        columns = self.__get_columns()
+        rows = np.flatnonzero(columns['alive']) if rows is None else rows
+        rows = rows[np.argsort(columns[sortby][rows], kind='stable')]
+
+        keys = self.__keys
+        getter = operator.attrgetter(sortby)
+        return [(getter(keys[row]), value) for row, value in zip(rows, self._get_values(rows))]
+
+    def remove_recomputed(self):
+        """
+        Remove entries that have been superseded after restarts in vectorized fashion. See `filter_recomputed`.
+
+        Returns:
+            ColumnarStats: The stats without recomputed entries or None if the entries cannot be filtered by column
+        """
+        if not self.__regular:
+            return None
+
+        columns = self.__get_columns()
+        alive, time, num_restarts = columns['alive'], columns['time'], columns['num_restarts']
+        recomputed = alive & (columns['codes'] == self.__type_codes.get('_recomputed', -1))
+
+        # delete values that have been recorded and superseded by similar, but not identical keys
+        max_restarts = {}
+        for t, n in zip(time[recomputed], num_restarts[recomputed]):
+            max_restarts[t] = max(max_restarts.get(t, n), n)
+        times, inverse = np.unique(time, return_inverse=True)
+        threshold = np.array([max_restarts.get(t, 0) for t in times])
+        remove = alive & (num_restarts < threshold[inverse])
+
+        # delete values that were recorded at times that shouldn't be recorded because we performed a different step
+        # after the restart
+        rows = np.flatnonzero(recomputed & ~remove)
+        other_restarted_times = [time[row] for row, value in zip(rows, self._get_values(rows)) if value]
+        remove |= alive & np.isin(time, other_restarted_times)
+
+        for row in np.flatnonzero(remove):
+            del self[self.__keys[row]]
+        return self
+
+    def get_types(self):
+        """
+        Get the types of all entries in order of their first occurrence
+
+        Returns:
+            list: The types or None if the entries do not have regular types
+        """
+        if not self.__regular:
+            return None
+
+        columns = self.__get_columns()
+        codes = columns['codes'][columns['alive']]
+        unique_codes, first_rows = np.unique(codes, return_index=True)
+        types = {code: _type for _type, code in self.__type_codes.items()}
+        return [types[code] for code in unique_codes[np.argsort(first_rows)]]
+
+
 def filter_stats(stats, process=None, time=None, level=None, iter=None, type=None, recomputed=None, num_restarts=None):
     """
     Helper function to extract data from the dictrionary of statistics
@@ -17,9 +300,17 @@ def filter_stats(stats, process=None, time=None, level=None, iter=None, type=Non
     Returns:
         dict: dictionary containing only the entries corresponding to the filter
     """
+    if recomputed is not None:
+        stats = filter_recomputed(stats.copy())
+
+    if isinstance(stats, ColumnarStats):
+        result = stats.select(process=process, time=time, level=level, iter=iter, type=type, num_restarts=num_restarts)
+        if result is not None:
+            return result
+
     result = {}
 
-    for k, v in stats.items() if recomputed is None else filter_recomputed(stats.copy()).items():
+    for k, v in stats.items():
         # get data if key matches the filter (if specified)
         if (
             (k.time == time or time is None)
@@ -47,6 +338,11 @@ def sort_stats(stats, sortby, comm=None):
         list: list of tuples containing the sortby item and the value
     """
 
+    # use the columns for sorting if possible, which is stable just like sorting the list below
+    sorted_data = stats.sorted_items(sortby) if isinstance(stats, ColumnarStats) and comm is None else None
+    if sorted_data is not None:
+        return sorted_data
+
     result = []
     for k, v in stats.items():
         # convert string to attribute and append key + value to result as tuple
@@ -74,17 +370,26 @@ def filter_recomputed(stats):
         dict: The filtered stats dict
     """
 
+    if isinstance(stats, ColumnarStats):
+        result = stats.remove_recomputed()
+        if result is not None:
+            return result
+
+    # group the keys by time once instead of searching all keys for every restarted time
+    keys_at_time = {}
+    for me in stats.keys():
+        keys_at_time.setdefault(me.time, []).append(me)
+
     # delete values that have been recorded and superseded by similar, but not identical keys
     times_restarted = np.unique([me.time for me in stats.keys() if me.num_restarts > 0])
     for t in times_restarted:
-        restarts = max([me.num_restarts for me in filter_stats(stats, type='_recomputed', time=t).keys()])
-        for i in range(restarts):
-            [stats.pop(me) for me in filter_stats(stats, time=t, num_restarts=i).keys()]
+        restarts = max([me.num_restarts for me in keys_at_time[t] if me.type == '_recomputed'])
+        [stats.pop(me) for me in keys_at_time[t] if me.num_restarts < restarts]
 
     # delete values that were recorded at times that shouldn't be recorded because we performed a different step after the restart
     other_restarted_steps = [me for me in filter_stats(stats, type='_recomputed') if stats[me]]
     for step in other_restarted_steps:
-        [stats.pop(me) for me in filter_stats(stats, time=step.time).keys()]
+        [stats.pop(me) for me in keys_at_time[step.time] if me in stats]
 
     return stats
 
@@ -101,6 +406,10 @@ def get_list_of_types(stats):
 
     """
 
+    type_list = stats.get_types() if isinstance(stats, ColumnarStats) else None
+    if type_list is not None:
+        return type_list
+
     type_list = []
     for k, _ in stats.items():
         if k.type not in type_list:
@@ -120,6 +429,18 @@ def get_sorted(stats, sortby='time', comm=None, **kwargs):
     Returns:
         list: list of tuples containing the sortby item and the value
     """
+    # filter and sort by column without assembling the filtered dictionary if possible
+    filters = {key: value for key, value in kwargs.items() if key != 'recomputed'}
+    if (
+        isinstance(stats, ColumnarStats)
+        and comm is None
+        and kwargs.get('recomputed', None) is None
+        and set(filters.keys()).issubset(['process', 'time', 'level', 'iter', 'type', 'num_restarts'])
+    ):
+        rows = stats.get_rows(**filters)
+        sorted_data = None if rows is None else stats.sorted_items(sortby, rows=rows)
+        if sorted_data is not None:
+            return sorted_data
 
     return sort_stats(
         filter_stats(stats, **kwargs),
@@ -0,0 +1,246 @@
+import glob
+import os
+import pickle
+from collections import namedtuple
+
+import numpy as np
+
+from pySDC.helpers.stats_helper import ColumnarStats
+
+# location of a value in an append log on disk
+Location = namedtuple('Location', ['file', 'offset', 'size'])
+
+# keys are stored as tuples on disk and turned into namedtuples with the same fields when reading
+_entry_types = {}
+
+
+def get_entry_type(fields):
+    """
+    Get a namedtuple type for keys with the given fields, which is created once and then reused
+
+    Args:
+        fields (tuple): Names of the fields
+
+    Returns:
+        type: The namedtuple type
+    """
+    if fields not in _entry_types.keys():
+        _entry_types[fields] = namedtuple('Entry', fields)
+    return _entry_types[fields]
+
+
+class StatsSink(object):
+    """
+    Write statistics to disk in chunks during the run instead of keeping them in memory.
+
+    The values are pickled one after another into an append log `<prefix>values.log` and the keys of every chunk are
+    written together with the location of their values to an index file `<prefix>index_<chunk>.pkl`. Since the index
+    is written after the values, the files on disk are consistent after every chunk. Use `read_stats` to query the
+    statistics without loading all values.
+
+    Attributes:
+        path (str): Directory to write the statistics to
+        prefix (str): Prefix of the file names, which needs to be unique for every sink writing to the same directory
+        chunk_size (int): Number of entries to gather in memory before writing them to disk
+        num_chunks (int): Number of chunks that have been written
+    """
+
+    def __init__(self, path, prefix='', chunk_size=1000):
+        self.path = path
+        self.prefix = prefix
+        self.chunk_size = chunk_size
+        self.num_chunks = 0
+
+    @property
+    def values_file(self):
+        return os.path.join(self.path, f'{self.prefix}values.log')
+
+    def get_index_file(self, chunk):
+        return os.path.join(self.path, f'{self.prefix}index_{chunk:06d}.pkl')
+
+    def write(self, stats):
+        """
+        Append a chunk of statistics to the files on disk
+
+        Args:
+            stats (dict): Statistics with namedtuple keys
+
+        Returns:
+            None
+        """
+        if len(stats) == 0:
+            return None
+
+        os.makedirs(self.path, exist_ok=True)
+
+        keys = list(stats.keys())
+        offsets = np.zeros(len(keys), dtype=np.int64)
+        sizes = np.zeros(len(keys), dtype=np.int64)
+
+        with open(self.values_file, 'ab') as file:
+            offset = file.tell()
+            for i, key in enumerate(keys):
+                data = pickle.dumps(stats[key], protocol=pickle.HIGHEST_PROTOCOL)
+                file.write(data)
+                offsets[i] = offset
+                sizes[i] = len(data)
+                offset += len(data)
+
+        index = {
+            'fields': type(keys[0])._fields,
+            'keys': [tuple(key) for key in keys],
+            'offsets': offsets,
+            'sizes': sizes,
+        }
+        with open(self.get_index_file(self.num_chunks), 'wb') as file:
+            pickle.dump(index, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.num_chunks += 1
+
+    def reset(self):
+        """
+        Remove all files written by this sink, e.g. when starting a new run
+
+        Returns:
+            None
+        """
+        for name in glob.glob(os.path.join(glob.escape(self.path), f'{glob.escape(self.prefix)}index_*.pkl')) + [
+            self.values_file
+        ]:
+            if os.path.isfile(name):
+                os.remove(name)
+        self.num_chunks = 0
+
+    def read(self):
+        """
+        Get the statistics written by this sink
+
+        Returns:
+            LazyStats: The statistics
+        """
+        return read_stats(self.path, prefixes=[self.prefix])
+
+
+class StatsReader(object):
+    """
+    Read single values from the append logs written by `StatsSink`
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.__files = {}
+
+    def load(self, value):
+        """
+        Load a value from disk if it is a location and return it unchanged otherwise
+
+        Args:
+            value: Location of the value on disk or the value itself
+
+        Returns:
+            The value
+        """
+        if not isinstance(value, Location):
+            return value
+
+        if value.file not in self.__files.keys():
+            self.__files[value.file] = open(os.path.join(self.path, value.file), 'rb')
+        file = self.__files[value.file]
+        file.seek(value.offset)
+        return pickle.loads(file.read(value.size))
+
+    def close(self):
+        for file in self.__files.values():
+            file.close()
+        self.__files = {}
+
+    def __del__(self):
+        self.close()
+
+    def __getstate__(self):
+        # open files are not copied
+        return {'path': self.path, '_StatsReader__files': {}}
+
+
+class LazyStats(ColumnarStats):
+    """
+    Statistics written to disk by `StatsSink`. Only the keys and the locations of the values are kept in memory and the
+    values are loaded when they are accessed. Filtering with the functions of the stats helper returns regular
+    `ColumnarStats` with only the matching values loaded.
+    """
+
+    def __init__(self, *args, reader=None, **kwargs):
+        self.reader = reader
+        super().__init__(*args, **kwargs)
+
+    def _load(self, value):
+        return self.reader.load(value) if isinstance(value, Location) else value
+
+    def _get_values(self, rows):
+        return [self._load(me) for me in super()._get_values(rows)]
+
+    def __getitem__(self, key):
+        return self._load(super().__getitem__(key))
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        return self._load(super().pop(key, *default))
+
+    def popitem(self):
+        key, value = super().popitem()
+        return key, self._load(value)
+
+    def values(self):
+        return (self[key] for key in self.keys())
+
+    def items(self):
+        return ((key, self[key]) for key in self.keys())
+
+    def copy(self):
+        result = type(self)(reader=self.reader)
+        result.update(self)
+        return result
+
+    def load(self):
+        """
+        Load all values into memory
+
+        Returns:
+            ColumnarStats: The statistics with all values loaded
+        """
+        return ColumnarStats(self.items())
+
+
+def read_stats(path, prefixes=None):
+    """
+    Read statistics written by `StatsSink` lazily, i.e. only the keys are read and the values are loaded on access.
+    If multiple sinks have written entries with the same key, the last one takes precedence, like when merging the
+    statistics of multiple hooks in memory.
+
+    Args:
+        path (str): Directory the statistics have been written to
+        prefixes (list): Prefixes of the sinks to read in this order or None to read all sinks in alphabetical order
+
+    Returns:
+        LazyStats: The statistics
+    """
+    if prefixes is None:
+        index_files = sorted(glob.glob(os.path.join(glob.escape(path), '*index_*.pkl')))
+    else:
+        index_files = []
+        for prefix in prefixes:
+            index_files += sorted(glob.glob(os.path.join(glob.escape(path), f'{glob.escape(prefix)}index_*.pkl')))
+
+    stats = LazyStats(reader=StatsReader(path))
+    for name in index_files:
+        with open(name, 'rb') as file:
+            index = pickle.load(file)
+
+        values_file = f'{os.path.basename(name).rsplit("index_", 1)[0]}values.log'
+        Entry = get_entry_type(index['fields'])
+        for key, offset, size in zip(index['keys'], index['offsets'], index['sizes']):
+            stats[Entry(*key)] = Location(values_file, int(offset), int(size))
+
+    return stats
@@ -14,6 +14,9 @@ class controller_MPI(controller):
 
     """
 
+    # tag offset for messages sent with persistent requests
+    PERSISTENT_TAG = 2000
+
     def __init__(self, controller_params, description, comm):
         """
         Initialization routine for PFASST controller
@@ -33,6 +36,11 @@ class controller_MPI(controller):
         # pass communicator for future use
         self.comm = comm
 
+        # streamed stats and timelines need to be written to different files on each rank
+        for hook in self.hooks:
+            self.setup_stats_streaming(hook)
+            self.setup_timeline(hook)
+
         num_procs = self.comm.Get_size()
         rank = self.comm.Get_rank()
 
@@ -55,6 +63,15 @@ class controller_MPI(controller):
         self.req_ibcast = None
         self.req_diff = None
 
+        # persistent requests and buffers for sending and receiving the end points on each level
+        if self.params.persistent_comm and self.params.use_iteration_estimator:
+            raise ControllerError('persistent_comm cannot be used together with the iteration estimator')
+        self.send_buffers = [None] * num_levels
+        self.recv_buffers = [None] * num_levels
+        self.persistent_send = [None] * num_levels
+        self.persistent_recv = [None] * num_levels
+        self.persistent_setup = None
+
         if num_procs > 1 and num_levels > 1:
             for L in self.S.levels:
                 if not L.sweep.coll.right_is_node or L.sweep.params.do_coll_update:
@@ -82,10 +99,6 @@ class controller_MPI(controller):
             stats object containing statistics for each step, each level and each iteration
         """
 
-        # reset stats to prevent double entries from old runs
-        for hook in self.hooks:
-            hook.reset_stats()
-
         # find active processes and put into new communicator
         rank = self.comm.Get_rank()
         num_procs = self.comm.Get_size()
@@ -109,7 +122,63 @@ class controller_MPI(controller):
 
         # initialize block of steps with u0
         self.restart_block(num_procs, time, u0, comm=comm_active)
-        uend = u0
+
+        return self.run_blocks(time, Tend, u0, active, comm_active, block=0)
+
+    def resume(self, Tend=None):
+        """
+        Resume a run from the last checkpoints written to the `checkpoint_path` by all ranks, which gives the same
+        results as an uninterrupted run. The controller needs to be set up in the same way as the one that has written
+        the checkpoints. Note that the stats contain only the resumed part of the run.
+
+        Args:
+            Tend: ending time, defaults to the one of the interrupted run
+
+        Returns:
+            end values on the finest level
+            stats object containing statistics for each step, each level and each iteration
+        """
+        uend, state = self.read_checkpoint([self.S])
+        Tend = state['Tend'] if Tend is None else Tend
+        time = state['time']
+        active = time < Tend - 10 * np.finfo(float).eps
+
+        # ranks that are done have stopped writing checkpoints, but the active ones need to agree on the block
+        all_blocks = self.comm.allgather(state['block'] if active else None)
+        if len(set(me for me in all_blocks if me is not None)) > 1:
+            raise ControllerError(f'Checkpoints of the ranks are from different blocks: {all_blocks}')
+
+        all_active = self.comm.allgather(active)
+        comm_active = self.comm if all(all_active) else self.comm.Split(active)
+        self.S.status.slot = comm_active.Get_rank()
+
+        self.restart_block(comm_active.Get_size(), time, uend, comm=comm_active)
+        self.restore_checkpoint([self.S], state)
+
+        return self.run_blocks(time, Tend, uend, active, comm_active, block=state['block'])
+
+    def run_blocks(self, time, Tend, uend, active, comm_active, block):
+        """
+        Run blocks until the ending time is reached. The first block needs to be initialized already.
+
+        Args:
+            time: time of the step on this rank
+            Tend: ending time
+            uend: initial values of the first block
+            active (bool): Whether the step on this rank is active
+            comm_active: communicator of the active ranks
+            block (int): Number of blocks that have been computed already
+
+        Returns:
+            end values on the finest level
+            stats object containing statistics for each step, each level and each iteration
+        """
+        rank = comm_active.Get_rank()
+        num_procs = comm_active.Get_size()
+
+        # reset stats to prevent double entries from old runs
+        for hook in self.hooks:
+            hook.reset_stats()
 
         # call post-setup hook
         for hook in self.hooks:
@@ -163,14 +232,29 @@ class controller_MPI(controller):
             # initialize block of steps with u0
             self.restart_block(num_procs, time, uend, comm=comm_active)
 
+            # the stats of the finished block will not change anymore and can be written to disk if desired
+            self.write_stats()
+
+            # ranks that are done write a final checkpoint, such that resuming does not make them active again
+            block += 1
+            self.write_checkpoint(block, uend, [self.S], force=not active, time=time, Tend=Tend)
+
         # call post-run hook
         for hook in self.hooks:
             hook.post_run(step=self.S, level_number=0)
 
+        self.free_persistent_requests()
         comm_active.Free()
 
         return uend, self.return_stats()
 
+    @property
+    def file_prefix(self):
+        """
+        Prefix for files written during the run, which distinguishes the ranks
+        """
+        return f'rank{self.comm.rank}_' if hasattr(self, 'comm') else ''
+
     def restart_block(self, size, time, u0, comm):
         """
         Helper routine to reset/restart block of (active) steps
@@ -210,6 +294,9 @@ class controller_MPI(controller):
         self.S.status.prev_done = False
         self.S.status.force_done = False
 
+        if self.params.persistent_comm:
+            self.setup_persistent_requests(comm)
+
         for C in [self.convergence_controllers[i] for i in self.convergence_controller_order]:
             C.reset_status_variables(self, comm=comm)
 
@@ -219,6 +306,54 @@ class controller_MPI(controller):
             lvl.status.time = time
             lvl.status.sweep = 1
 
+    def setup_persistent_requests(self, comm):
+        """
+        Set up persistent requests for sending the end point to the next step and receiving the initial conditions
+        from the previous step on every level, which are started again and again instead of posting new messages. The
+        buffers are allocated once and the requests are only recreated when the neighbours in the block change.
+        Persistent messages use the tag `PERSISTENT_TAG + level`, since the tag cannot change between iterations.
+
+        Args:
+            comm: the communicator
+
+        Returns:
+            None
+        """
+        setup = (comm, self.S.prev, self.S.next, self.S.status.first, self.S.status.last)
+        if self.persistent_setup == setup:
+            return None
+
+        self.free_persistent_requests()
+
+        for l, L in enumerate(self.S.levels):
+            if self.send_buffers[l] is None:
+                template = L.prob.dtype_u(L.prob.init)
+                if not isinstance(template, np.ndarray):
+                    raise ControllerError(
+                        f'persistent_comm needs datatypes based on numpy arrays, got {type(template).__name__}'
+                    )
+                self.send_buffers[l] = np.empty_like(template.view(np.ndarray))
+                self.recv_buffers[l] = np.empty_like(template.view(np.ndarray))
+
+            tag = self.PERSISTENT_TAG + l
+            if not self.S.status.last:
+                self.persistent_send[l] = comm.Ssend_init(self.send_buffers[l], dest=self.S.next, tag=tag)
+            if not self.S.status.first:
+                self.persistent_recv[l] = comm.Recv_init(self.recv_buffers[l], source=self.S.prev, tag=tag)
+
+        self.persistent_setup = setup
+
+    def free_persistent_requests(self):
+        """
+        Free the persistent requests, which needs to be done before freeing their communicator
+        """
+        for requests in [self.persistent_send, self.persistent_recv]:
+            for l, req in enumerate(requests):
+                if req is not None:
+                    req.Free()
+                requests[l] = None
+        self.persistent_setup = None
+
     def recv(self, target, source, tag=None, comm=None):
         """
         Receive function
@@ -236,6 +371,21 @@ class controller_MPI(controller):
         # re-evaluate f on left interval boundary
         target.f[0] = target.prob.eval_f(target.u[0], target.time)
 
+    def recv_persistent(self, level):
+        """
+        Receive the initial conditions on a level with the persistent request
+
+        Args:
+            level: the level number
+        """
+        target = self.S.levels[level]
+        req = self.persistent_recv[level]
+        req.Start()
+        req.Wait()
+        target.u[0][...] = self.recv_buffers[level]
+        # re-evaluate f on left interval boundary
+        target.f[0] = target.prob.eval_f(target.u[0], target.time)
+
     def send_full(self, comm=None, blocking=False, level=None, add_to_stats=False):
         """
         Function to perform the send, including bookkeeping and logging
@@ -268,9 +418,15 @@ class controller_MPI(controller):
                     self.S.status.iter,
                 )
             )
-            self.req_send[level] = self.S.levels[level].uend.isend(
-                dest=self.S.next, tag=level * 100 + self.S.status.iter, comm=comm
-            )
+            if self.params.persistent_comm:
+                # the previous send has finished, so the buffer can be overwritten
+                self.send_buffers[level][...] = self.S.levels[level].uend
+                self.req_send[level] = self.persistent_send[level]
+                self.req_send[level].Start()
+            else:
+                self.req_send[level] = self.S.levels[level].uend.isend(
+                    dest=self.S.next, tag=level * 100 + self.S.status.iter, comm=comm
+                )
             if blocking:
                 self.wait_with_interrupt(request=self.req_send[level])
                 if self.S.status.force_done:
@@ -303,7 +459,12 @@ class controller_MPI(controller):
                     self.S.status.iter,
                 )
             )
-            self.recv(target=self.S.levels[level], source=self.S.prev, tag=level * 100 + self.S.status.iter, comm=comm)
+            if self.params.persistent_comm:
+                self.recv_persistent(level=level)
+            else:
+                self.recv(
+                    target=self.S.levels[level], source=self.S.prev, tag=level * 100 + self.S.status.iter, comm=comm
+                )
 
         for hook in self.hooks:
             hook.post_comm(step=self.S, level_number=level, add_to_stats=add_to_stats)
@@ -576,8 +737,47 @@ class controller_MPI(controller):
             self.S.levels[0].sweep.update_nodes()
 
         elif self.params.predict_type == 'fmg':
-            # TODO: implement FMG predictor
-            raise NotImplementedError('FMG predictor is not yet implemented')
+            nlevels = len(self.S.levels)
+
+            # restrict to coarsest level
+            for l in range(1, nlevels):
+                self.S.transfer(source=self.S.levels[l - 1], target=self.S.levels[l])
+
+            # solve on the coarsest level step by step across the block
+            self.coarse_sweeps_serial(comm=comm, solve=True)
+            if self.S.status.force_done:
+                return None
+
+            # go back up the hierarchy, starting a V-cycle from every intermediate level
+            for l in range(nlevels - 2, 0, -1):
+                self.S.transfer(source=self.S.levels[l + 1], target=self.S.levels[l])
+                self.predictor_sweeps(comm=comm, level=l, nsweeps=self.S.levels[l].params.nsweeps)
+                if self.S.status.force_done:
+                    return None
+
+                for j in range(l, nlevels - 1):
+                    self.S.transfer(source=self.S.levels[j], target=self.S.levels[j + 1])
+                    if j + 1 < nlevels - 1:
+                        self.predictor_sweeps(comm=comm, level=j + 1, nsweeps=self.S.levels[j + 1].params.nsweeps)
+                        if self.S.status.force_done:
+                            return None
+
+                self.coarse_sweeps_serial(comm=comm, solve=False)
+                if self.S.status.force_done:
+                    return None
+
+                for j in range(nlevels - 1, l, -1):
+                    self.S.transfer(source=self.S.levels[j], target=self.S.levels[j - 1])
+                    if j - 1 > l:
+                        self.predictor_sweeps(comm=comm, level=j - 1, nsweeps=self.S.levels[j - 1].params.nsweeps)
+                        if self.S.status.force_done:
+                            return None
+
+            # interpolate to the finest level and end this with a fine sweep
+            self.S.transfer(source=self.S.levels[1], target=self.S.levels[0])
+            self.predictor_sweeps(comm=comm, level=0, nsweeps=1)
+            if self.S.status.force_done:
+                return None
 
         else:
             raise ControllerError('Wrong predictor type, got %s' % self.params.predict_type)
@@ -588,6 +788,54 @@ class controller_MPI(controller):
         # update stage
         self.S.status.stage = 'IT_CHECK'
 
+    def coarse_sweeps_serial(self, comm, solve=False):
+        """
+        Sweep on the coarsest level after receiving the end point of the previous step and pass the own end point on
+        to the next one, which is used by the FMG predictor
+
+        Args:
+            comm: the communicator
+            solve (bool): sweep until the residual on the coarsest level is below its `restol` or the maximum number
+                          of iterations of the step is reached instead of sweeping once
+        """
+        level = len(self.S.levels) - 1
+
+        # receive from previous step (if not first)
+        self.recv_full(comm=comm, level=level)
+        if self.S.status.force_done:
+            return None
+
+        L = self.S.levels[level]
+        for _ in range(self.S.params.maxiter if solve else 1):
+            L.sweep.update_nodes()
+            L.sweep.compute_residual(stage='PREDICT')
+            if L.status.residual <= L.params.restol:
+                break
+
+        # send to next step
+        self.send_full(comm=comm, blocking=True, level=level, add_to_stats=True)
+
+    def predictor_sweeps(self, comm, level, nsweeps):
+        """
+        Sweep on one level, receiving new initial conditions before every sweep, which is used by the FMG predictor
+
+        Args:
+            comm: the communicator
+            level (int): index of the level to sweep on
+            nsweeps (int): number of sweeps
+        """
+        for k in range(nsweeps):
+            self.send_full(comm=comm, level=level)
+            if self.S.status.force_done:
+                return None
+
+            self.recv_full(comm=comm, level=level, add_to_stats=(k == nsweeps - 1))
+            if self.S.status.force_done:
+                return None
+
+            self.S.levels[level].sweep.update_nodes()
+            self.S.levels[level].sweep.compute_residual(stage='PREDICT')
+
     def it_check(self, comm, num_procs):
         """
         Key routine to check for convergence/termination
@@ -1,11 +1,12 @@
 import itertools
-import copy as cp
 import numpy as np
 import dill
 
 from pySDC.core.Controller import controller
 from pySDC.core import Step as stepclass
 from pySDC.core.Errors import ControllerError, CommunicationError
+from pySDC.core.Level import NodeStorage
+from pySDC.core.Problem import WorkCounter
 from pySDC.implementations.convergence_controller_classes.basic_restarting import BasicRestarting
 
 
@@ -78,10 +79,38 @@ class controller_nonMPI(controller):
                 'you have specified a predictor type but only a single level.. predictor will be ignored'
             )
 
+        # count the copies and right hand side evaluations that are avoided when receiving unchanged data
+        if self.params.zero_copy_comm:
+            for S in self.MS:
+                for L in S.levels:
+                    L.prob.work_counters['comm_copies_avoided'] = WorkCounter()
+                    L.prob.work_counters['comm_rhs_avoided'] = WorkCounter()
+
         for C in [self.convergence_controllers[i] for i in self.convergence_controller_order]:
             C.reset_buffers_nonMPI(self)
             C.setup_status_variables(self, MS=self.MS)
 
+        # sweeps and transfers of the steps can be executed in parallel by worker processes
+        if self.params.execution_backend == 'serial':
+            self.process_pool = None
+        elif self.params.execution_backend == 'processes':
+            # imported here because the shared memory it relies on is only available from Python 3.8
+            from pySDC.helpers.process_pool import StepProcessPool
+
+            self.process_pool = StepProcessPool(self.MS)
+        else:
+            raise ControllerError(
+                f'Unknown execution backend {self.params.execution_backend!r}, choose \'serial\' or \'processes\''
+            )
+
+    def close(self):
+        """
+        Stop the worker processes of the `processes` execution backend, if there are any. The controller cannot be
+        used afterwards.
+        """
+        if self.process_pool is not None:
+            self.process_pool.close()
+
     def run(self, u0, t0, Tend):
         """
         Main driver for running the serial version of SDC, MSSDC, MLSDC and PFASST (virtual parallelism)
@@ -96,11 +125,8 @@ class controller_nonMPI(controller):
             stats object containing statistics for each step, each level and each iteration
         """
 
-        # some initializations and reset of statistics
-        uend = None
+        # some initializations
         num_procs = len(self.MS)
-        for hook in self.hooks:
-            hook.reset_stats()
 
         # initial ordering of the steps: 0,1,...,Np-1
         slots = list(range(num_procs))
@@ -120,6 +146,55 @@ class controller_nonMPI(controller):
         # initialize block of steps with u0
         self.restart_block(active_slots, time, u0)
 
+        return self.run_blocks(time, Tend, uend=None, block=0)
+
+    def resume(self, Tend=None):
+        """
+        Resume a run from the last checkpoint written to the `checkpoint_path`, which gives the same results as an
+        uninterrupted run. The controller needs to be set up in the same way as the one that has written the checkpoint.
+        Note that the stats contain only the resumed part of the run.
+
+        Args:
+            Tend: ending time, defaults to the one of the interrupted run
+
+        Returns:
+            end values on the finest level
+            stats object containing statistics for each step, each level and each iteration
+        """
+        uend, state = self.read_checkpoint(self.MS)
+        Tend = state['Tend'] if Tend is None else Tend
+        time = state['time']
+
+        active = [time[p] < Tend - 10 * np.finfo(float).eps for p in range(len(self.MS))]
+        active_slots = list(itertools.compress(range(len(self.MS)), active))
+
+        self.restart_block(active_slots, time, uend)
+        self.restore_checkpoint(self.MS, state)
+
+        return self.run_blocks(time, Tend, uend=uend, block=state['block'])
+
+    def run_blocks(self, time, Tend, uend, block):
+        """
+        Run blocks of steps until the ending time is reached. The first block needs to be initialized already.
+
+        Args:
+            time (list): Times of the steps
+            Tend: ending time
+            uend: initial values of the first block
+            block (int): Number of blocks that have been computed already
+
+        Returns:
+            end values on the finest level
+            stats object containing statistics for each step, each level and each iteration
+        """
+        slots = list(range(len(self.MS)))
+        active = [time[p] < Tend - 10 * np.finfo(float).eps for p in slots]
+        active_slots = list(itertools.compress(slots, active))
+
+        # reset of statistics
+        for hook in self.hooks:
+            hook.reset_stats()
+
         for hook in self.hooks:
             hook.post_setup(step=None, level_number=None)
 
@@ -166,6 +241,13 @@ class controller_nonMPI(controller):
             # restart active steps (reset all values and pass uend to u0)
             self.restart_block(active_slots, time, uend)
 
+            # the stats of the finished block will not change anymore and can be written to disk if desired
+            self.write_stats()
+
+            block += 1
+            if any(active):
+                self.write_checkpoint(block, uend, self.MS, time=time, Tend=Tend)
+
         # call post-run hook
         for S in self.MS:
             for hook in self.hooks:
@@ -237,9 +319,13 @@ class controller_nonMPI(controller):
                 source: level which has the new values
                 tag: identifier for this message
             """
-            # sending here means computing uend ("one-sided communication")
-            source.sweep.compute_end_point()
-            source.tag = cp.deepcopy(tag)
+            # sending here means computing uend ("one-sided communication"), which zero-copy communication skips if
+            # the values at the nodes did not change since the last time
+            if not self.params.zero_copy_comm or source.uend is None or source.status.uend_stale:
+                source.sweep.compute_end_point()
+                source.status.uend_stale = False
+            # tags are tuples of integers, which need not be copied
+            source.tag = tag
 
         for hook in self.hooks:
             hook.pre_comm(step=S, level_number=level)
@@ -274,10 +360,15 @@ class controller_nonMPI(controller):
 
             if tag is not None and source.tag != tag:
                 raise CommunicationError('source and target tag are not the same, got %s and %s' % (source.tag, tag))
-            # simply do a deepcopy of the values uend to become the new u0 at the target
-            target.u[0] = target.prob.dtype_u(source.uend)
-            # re-evaluate f on left interval boundary
-            target.f[0] = target.prob.eval_f(target.u[0], target.time)
+
+            if self.params.zero_copy_comm:
+                self.recv_zero_copy(target, source)
+            else:
+                # simply do a deepcopy of the values uend to become the new u0 at the target
+                target.u[0] = target.prob.dtype_u(source.uend)
+                target.status.u0_origin = None
+                # re-evaluate f on left interval boundary
+                target.f[0] = target.prob.eval_f(target.u[0], target.time)
 
         for hook in self.hooks:
             hook.pre_comm(step=S, level_number=level)
@@ -290,6 +381,57 @@ class controller_nonMPI(controller):
         for hook in self.hooks:
             hook.post_comm(step=S, level_number=level, add_to_stats=add_to_stats)
 
+    @staticmethod
+    def is_dirty(target, source):
+        """
+        Check if the initial conditions of the target level need to be updated with the end point of the source level.
+
+        The end point of the source level gets a new version whenever it is assigned, and the target level remembers
+        the version it last received in `status.u0_origin`, which is reset whenever `u[0]` is set otherwise, e.g. when
+        restricting or initializing a step. The initial conditions are up to date if the versions match, in which case
+        the right hand side at the left boundary is still consistent with them as well. Since sending only computes
+        the end point anew if `status.uend_stale` marks that the values at the nodes changed, code that changes the
+        values on a level outside of sweeps and transfers has to set these status variables.
+
+        Args:
+            target (pySDC.Level.level): level which receives the values
+            source (pySDC.Level.level): level which has sent the values
+
+        Returns:
+            bool: True if the initial conditions need to be updated
+        """
+        if target.u[0] is None or target.f[0] is None:
+            return True
+        return target.status.u0_origin != source.uend_version
+
+    def recv_zero_copy(self, target, source):
+        """
+        Receive the end point of the source level as initial conditions of the target level. If the end point did not
+        change since the last time, copying the values and evaluating the right hand side at the left boundary is
+        skipped, which is counted in the work counters `comm_copies_avoided` and `comm_rhs_avoided` of the target
+        problem and can be recorded with the `LogWork` hook. With contiguous storage, the values are copied into the
+        storage directly instead of copying them to a new object first.
+
+        Args:
+            target (pySDC.Level.level): level which receives the values
+            source (pySDC.Level.level): level which has sent the values
+
+        Returns:
+            None
+        """
+        if self.is_dirty(target, source):
+            if isinstance(target.u, NodeStorage) and target.u.contiguous:
+                # the storage copies the values into its own memory
+                target.u[0] = source.uend
+            else:
+                target.u[0] = target.prob.dtype_u(source.uend)
+            target.f[0] = target.prob.eval_f(target.u[0], target.time)
+            target.status.u0_origin = source.uend_version
+            target.status.uend_stale = True
+        else:
+            target.prob.work_counters['comm_copies_avoided']()
+            target.prob.work_counters['comm_rhs_avoided']()
+
     def pfasst(self, local_MS_active):
         """
         Main function including the stages of SDC, MLSDC and PFASST (the "controller")
@@ -458,8 +600,33 @@ class controller_nonMPI(controller):
                 S.levels[0].sweep.update_nodes()
 
         elif self.params.predict_type == 'fmg':
-            # TODO: implement FMG predictor
-            raise NotImplementedError('FMG predictor is not yet implemented')
+            # restrict to coarsest level
+            for l in range(self.nlevels - 1):
+                self.transfer_steps(local_MS_running, source=l, target=l + 1)
+
+            # solve on the coarsest level step by step across the block
+            self.coarse_sweeps_serial(local_MS_running, solve=True)
+
+            # go back up the hierarchy, starting a V-cycle from every intermediate level
+            for l in range(self.nlevels - 2, 0, -1):
+                self.transfer_steps(local_MS_running, source=l + 1, target=l)
+                self.predictor_sweeps(local_MS_running, level=l, nsweeps=self.nsweeps[l])
+
+                for j in range(l, self.nlevels - 1):
+                    self.transfer_steps(local_MS_running, source=j, target=j + 1)
+                    if j + 1 < self.nlevels - 1:
+                        self.predictor_sweeps(local_MS_running, level=j + 1, nsweeps=self.nsweeps[j + 1])
+
+                self.coarse_sweeps_serial(local_MS_running, solve=False)
+
+                for j in range(self.nlevels - 1, l, -1):
+                    self.transfer_steps(local_MS_running, source=j, target=j - 1)
+                    if j - 1 > l:
+                        self.predictor_sweeps(local_MS_running, level=j - 1, nsweeps=self.nsweeps[j - 1])
+
+            # interpolate to the finest level and end this with a fine sweep
+            self.transfer_steps(local_MS_running, source=1, target=0)
+            self.predictor_sweeps(local_MS_running, level=0, nsweeps=1)
 
         else:
             raise ControllerError('Wrong predictor type, got %s' % self.params.predict_type)
@@ -472,6 +639,50 @@ class controller_nonMPI(controller):
             # update stage
             S.status.stage = 'IT_CHECK'
 
+    def coarse_sweeps_serial(self, local_MS_running, solve=False):
+        """
+        Sweep on the coarsest level of the steps one after another, passing the end point of each step on to the next
+        one, which is used by the FMG predictor
+
+        Args:
+            local_MS_running (list): list of currently running steps
+            solve (bool): sweep until the residual on the coarsest level is below its `restol` or the maximum number
+                          of iterations of the step is reached instead of sweeping once
+        """
+        level = self.nlevels - 1
+        for S in local_MS_running:
+            # receive from previous step (if not first)
+            self.recv_full(S, level=level)
+
+            L = S.levels[level]
+            for _ in range(S.params.maxiter if solve else 1):
+                L.sweep.update_nodes()
+                L.sweep.compute_residual(stage='PREDICT')
+                if L.status.residual <= L.params.restol:
+                    break
+
+            # send to succ step
+            self.send_full(S, level=level, add_to_stats=True)
+
+    def predictor_sweeps(self, local_MS_running, level, nsweeps):
+        """
+        Sweep on one level of all steps in parallel, receiving new initial conditions before every sweep, which is used
+        by the FMG predictor
+
+        Args:
+            local_MS_running (list): list of currently running steps
+            level (int): index of the level to sweep on
+            nsweeps (int): number of sweeps
+        """
+        for k in range(nsweeps):
+            for S in local_MS_running:
+                # send updated values forward
+                self.send_full(S, level=level)
+                # receive values
+                self.recv_full(S, level=level, add_to_stats=(k == nsweeps - 1))
+
+            self.sweep_steps(local_MS_running, level=level, stage='PREDICT', use_hooks=False)
+
     def it_check(self, local_MS_running):
         """
         Key routine to check for convergence/termination
@@ -559,14 +770,8 @@ class controller_nonMPI(controller):
                 # receive values
                 self.recv_full(S, level=0, add_to_stats=(k == self.nsweeps[0] - 1))
 
-            for S in local_MS_running:
-                # standard sweep workflow: update nodes, compute residual, log progress
-                for hook in self.hooks:
-                    hook.pre_sweep(step=S, level_number=0)
-                S.levels[0].sweep.update_nodes()
-                S.levels[0].sweep.compute_residual(stage='IT_FINE')
-                for hook in self.hooks:
-                    hook.post_sweep(step=S, level_number=0)
+            # standard sweep workflow: update nodes, compute residual, log progress
+            self.sweep_steps(local_MS_running, level=0, stage='IT_FINE')
 
         for S in local_MS_running:
             # update stage
@@ -580,8 +785,7 @@ class controller_nonMPI(controller):
             local_MS_running (list): list of currently running steps
         """
 
-        for S in local_MS_running:
-            S.transfer(source=S.levels[0], target=S.levels[1])
+        self.transfer_steps(local_MS_running, source=0, target=1)
 
         for l in range(1, self.nlevels - 1):
             # sweep on middle levels (not on finest, not on coarsest, though)
@@ -593,22 +797,59 @@ class controller_nonMPI(controller):
                     # receive values
                     self.recv_full(S, level=l)
 
-                for S in local_MS_running:
-                    for hook in self.hooks:
-                        hook.pre_sweep(step=S, level_number=l)
-                    S.levels[l].sweep.update_nodes()
-                    S.levels[l].sweep.compute_residual(stage='IT_DOWN')
-                    for hook in self.hooks:
-                        hook.post_sweep(step=S, level_number=l)
+                self.sweep_steps(local_MS_running, level=l, stage='IT_DOWN')
 
-            for S in local_MS_running:
-                # transfer further down the hierarchy
-                S.transfer(source=S.levels[l], target=S.levels[l + 1])
+            # transfer further down the hierarchy
+            self.transfer_steps(local_MS_running, source=l, target=l + 1)
 
         for S in local_MS_running:
             # update stage
             S.status.stage = 'IT_COARSE'
 
+    def sweep_steps(self, local_MS_running, level, stage, use_hooks=True):
+        """
+        Sweep on one level of all running steps, including the sweep hooks. With the `processes` execution backend,
+        the sweeps are done in parallel between the hooks of all steps.
+
+        Args:
+            local_MS_running (list): list of currently running steps
+            level (int): index of the level to sweep on
+            stage (str): current stage, passed on to the residual computation
+            use_hooks (bool): call the sweep hooks, which is not done in the predictor
+        """
+        hooks = self.hooks if use_hooks else []
+        if self.process_pool is None:
+            for S in local_MS_running:
+                for hook in hooks:
+                    hook.pre_sweep(step=S, level_number=level)
+                S.levels[level].sweep.update_nodes()
+                S.levels[level].sweep.compute_residual(stage=stage)
+                for hook in hooks:
+                    hook.post_sweep(step=S, level_number=level)
+        else:
+            for S in local_MS_running:
+                for hook in hooks:
+                    hook.pre_sweep(step=S, level_number=level)
+            self.process_pool.sweep(local_MS_running, level, stage)
+            for S in local_MS_running:
+                for hook in hooks:
+                    hook.post_sweep(step=S, level_number=level)
+
+    def transfer_steps(self, local_MS_running, source, target):
+        """
+        Transfer between two levels of all running steps, in parallel with the `processes` execution backend
+
+        Args:
+            local_MS_running (list): list of currently running steps
+            source (int): index of the level the values come from
+            target (int): index of the level receiving the values
+        """
+        if self.process_pool is None:
+            for S in local_MS_running:
+                S.transfer(source=S.levels[source], target=S.levels[target])
+        else:
+            self.process_pool.transfer(local_MS_running, source, target)
+
     def it_coarse(self, local_MS_running):
         """
         Coarse sweep
@@ -647,9 +888,8 @@ class controller_nonMPI(controller):
         """
 
         for l in range(self.nlevels - 1, 0, -1):
-            for S in local_MS_running:
-                # prolong values
-                S.transfer(source=S.levels[l], target=S.levels[l - 1])
+            # prolong values
+            self.transfer_steps(local_MS_running, source=l, target=l - 1)
 
             # on middle levels: do communication and sweep as usual
             if l - 1 > 0:
@@ -660,13 +900,7 @@ class controller_nonMPI(controller):
                         # receive values
                         self.recv_full(S, level=l - 1, add_to_stats=(k == self.nsweeps[l - 1] - 1))
 
-                    for S in local_MS_running:
-                        for hook in self.hooks:
-                            hook.pre_sweep(step=S, level_number=l - 1)
-                        S.levels[l - 1].sweep.update_nodes()
-                        S.levels[l - 1].sweep.compute_residual(stage='IT_UP')
-                        for hook in self.hooks:
-                            hook.post_sweep(step=S, level_number=l - 1)
+                    self.sweep_steps(local_MS_running, level=l - 1, stage='IT_UP')
 
         for S in local_MS_running:
             # update stage
@@ -131,6 +131,7 @@ class AdaptiveCollocation(ConvergenceController):
             # reevaluate rhs
             for i in range(L.sweep.coll.num_nodes + 1):
                 L.f[i] = L.prob.eval_f(L.u[i], L.time)
+            L.status.u0_origin = None
 
         # log the new parameters
         self.log(f'Switching to collocation {self.status.active_coll + 1} of {self.params.num_colls}', S, level=20)
@@ -220,6 +220,7 @@ class BasicRestartingMPI(BasicRestarting):
         """
         super().__init__(controller, params, description)
         self.buffers = Pars({"restart": False, "max_restart_reached": False, 'restart_earlier': False})
+        self.add_message('restart', restart=bool, max_restart_reached=bool)
 
     def determine_restart(self, controller, S, comm, **kwargs):
         """
@@ -251,13 +252,21 @@ on...",
                 )
         elif not S.status.prev_done:
             # receive information about restarts from earlier ranks
-            self.buffers.restart_earlier, self.buffers.max_restart_reached = self.recv(comm, source=S.status.slot - 1)
+            self.buffers.restart_earlier, self.buffers.max_restart_reached = self.recv_buffer(
+                comm, source=S.status.slot - 1, name='restart'
+            )
 
         # decide whether to restart
         S.status.restart = (S.status.restart or self.buffers.restart_earlier) and not self.buffers.max_restart_reached
 
         # send information about restarts forward
         if not S.status.last:
-            self.send(comm, dest=S.status.slot + 1, data=(S.status.restart, self.buffers.max_restart_reached))
+            self.send_buffer(
+                comm,
+                dest=S.status.slot + 1,
+                name='restart',
+                restart=S.status.restart,
+                max_restart_reached=self.buffers.max_restart_reached,
+            )
 
         return None
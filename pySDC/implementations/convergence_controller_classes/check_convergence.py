@@ -12,6 +12,10 @@ class CheckConvergence(ConvergenceController):
      - Maximum number of iterations
     """
 
+    def __init__(self, controller, params, description, **kwargs):
+        super().__init__(controller, params, description, **kwargs)
+        self.add_message('done', done=bool)
+
     def setup(self, controller, params, description, **kwargs):
         """
         Define default parameters here
@@ -117,11 +121,13 @@ class CheckConvergence(ConvergenceController):
         """
         # Either gather information about all status or send forward own
         if controller.params.all_to_done:
-            from mpi4py.MPI import LAND
+            from mpi4py.MPI import IN_PLACE, LAND
 
             for hook in controller.hooks:
                 hook.pre_comm(step=S, level_number=0)
-            S.status.done = comm.allreduce(sendobj=S.status.done, op=LAND)
+            done = np.array([S.status.done])
+            comm.Allreduce(IN_PLACE, done, op=LAND)
+            S.status.done = bool(done[0])
             for hook in controller.hooks:
                 hook.post_comm(step=S, level_number=0, add_to_stats=True)
 
@@ -136,12 +142,12 @@ class CheckConvergence(ConvergenceController):
 
             # recv status
             if not S.status.first and not S.status.prev_done:
-                S.status.prev_done = self.recv(comm, source=S.status.slot - 1)
+                S.status.prev_done = self.recv_buffer(comm, source=S.status.slot - 1, name='done')
                 S.status.done = S.status.done and S.status.prev_done
 
             # send status forward
             if not S.status.last:
-                self.send(comm, dest=S.status.slot + 1, data=S.status.done)
+                controller.req_status = self.send_buffer(comm, dest=S.status.slot + 1, name='done', done=S.status.done)
 
             for hook in controller.hooks:
                 hook.post_comm(step=S, level_number=0, add_to_stats=True)
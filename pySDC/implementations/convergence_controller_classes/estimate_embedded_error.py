@@ -218,6 +218,7 @@ class EstimateEmbeddedErrorLinearizedMPI(EstimateEmbeddedError):
         """
         super().__init__(controller, params, description, **kwargs)
         self.buffers = Pars({'e_em_last': 0.0})
+        self.add_message('e_em', e_em=float)
 
     def post_iteration_processing(self, controller, S, **kwargs):
         """
@@ -238,7 +239,7 @@ class EstimateEmbeddedErrorLinearizedMPI(EstimateEmbeddedError):
                 # get accumulated local errors from previous steps
                 if not S.status.first:
                     if not S.status.prev_done:
-                        self.buffers.e_em_last = self.recv(comm, S.status.slot - 1)
+                        self.buffers.e_em_last = self.recv_buffer(comm, S.status.slot - 1, name='e_em')
                 else:
                     self.buffers.e_em_last = 0.0
 
@@ -250,7 +251,7 @@ class EstimateEmbeddedErrorLinearizedMPI(EstimateEmbeddedError):
 
                 # send the accumulated local errors forward
                 if not S.status.last:
-                    self.send(comm, dest=S.status.slot + 1, data=temp, blocking=True)
+                    self.send_buffer(comm, dest=S.status.slot + 1, name='e_em', blocking=True, e_em=temp)
 
         return None
 
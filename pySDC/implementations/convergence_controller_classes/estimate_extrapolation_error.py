@@ -159,7 +159,8 @@ el multistep mode!",
         if type(f) == imex_mesh:
             self.prev.f[oldest_val] = f.impl + f.expl
         elif type(f) == mesh:
-            self.prev.f[oldest_val] = f
+            # copy, since the values at the nodes might be overwritten in place in the next step
+            self.prev.f[oldest_val] = mesh(f)
         else:
             raise DataError(
                 f"Unable to store f from datatype {type(f)}, extrapolation based error estimate only\
@@ -167,7 +168,7 @@ el multistep mode!",
             )
 
         # store the rest of the values
-        self.prev.u[oldest_val] = S.levels[0].u[-1]
+        self.prev.u[oldest_val] = S.levels[0].prob.dtype_u(S.levels[0].u[-1])
         self.prev.t[oldest_val] = S.time + S.dt
         self.prev.dt[oldest_val] = S.dt
 
@@ -139,5 +139,7 @@ smaller than 0!",
         if S.status.iter == S.params.maxiter:
             for L in S.levels:
                 L.u[:] = L.uold[:]
+                L.status.u0_origin = None
+                L.status.uend_stale = True
 
         return None
@@ -52,6 +52,8 @@ class InterpolateBetweenRestarts(ConvergenceController):
                 for m in range(len(level.u)):
                     level.u[m][:] = self.status.u_inter[i][m][:]
                     level.f[m][:] = self.status.f_inter[i][m][:]
+                level.status.u0_origin = None
+                level.status.uend_stale = True
 
             # reset the status variables
             self.status.perform_interpolation = False
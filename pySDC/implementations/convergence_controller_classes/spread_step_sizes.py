@@ -95,8 +95,10 @@ class SpreadStepSizesBlockwiseNonMPI(SpreadStepSizesBlockwise):
                     f"Overwriting stepsize control to reach Tend: {Tend:.2e}! New step size: {new_steps[i]:.2e}", S
                 )
 
-        # spread the step sizes to all levels
+        # spread the step sizes to all levels and discard factorizations that were computed for the old step size
         for i in range(len(S.levels)):
+            if S.levels[i].params.dt != new_steps[i]:
+                S.levels[i].prob.factorizations.clear()
             S.levels[i].params.dt = new_steps[i]
 
         return None
@@ -121,7 +123,8 @@ class SpreadStepSizesBlockwiseMPI(SpreadStepSizesBlockwise):
         """
 
         # figure out where the block is restarted
-        restarts = comm.allgather(S.status.restart)
+        restarts = np.zeros(comm.size, dtype=bool)
+        comm.Allgather(np.array([S.status.restart]), restarts)
         if True in restarts:
             restart_at = np.where(restarts)[0][0]
         else:
@@ -147,10 +150,14 @@ class SpreadStepSizesBlockwiseMPI(SpreadStepSizesBlockwise):
                     self.log(
                         f"Overwriting stepsize control to reach Tend: {Tend:.2e}! New step size: {new_steps[i]:.2e}", S
                     )
-        new_steps = comm.bcast(new_steps, root=restart_at)
+        new_steps = np.array(new_steps if S.status.slot == restart_at else [0.0] * len(S.levels), dtype=float)
+        comm.Bcast(new_steps, root=restart_at)
+        new_steps = new_steps.tolist()
 
-        # spread the step sizes to all levels
+        # spread the step sizes to all levels and discard factorizations that were computed for the old step size
         for i in range(len(S.levels)):
+            if S.levels[i].params.dt != new_steps[i]:
+                S.levels[i].prob.factorizations.clear()
             S.levels[i].params.dt = new_steps[i]
 
         return None
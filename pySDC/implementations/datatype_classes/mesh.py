@@ -67,6 +67,13 @@ class mesh(np.ndarray):
             return
         self._comm = getattr(obj, '_comm', None)
 
+    def __setstate__(self, state):
+        """
+        Restore the data when unpickling. Communicators cannot be pickled, so unpickled meshes have no communicator.
+        """
+        super().__setstate__(state)
+        self._comm = None
+
     def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
         """
         Overriding default ufunc, cf. https://numpy.org/doc/stable/user/basics.subclassing.html#array-ufunc-for-ufuncs
@@ -0,0 +1,225 @@
+import os
+
+from pySDC.core.Hooks import hooks
+from pySDC.helpers.chrome_trace import ChromeTrace
+
+
+class LogTimeline(hooks):
+    """
+    Record a timeline of the run in the Chrome trace format, which can be viewed in Perfetto or `chrome://tracing`.
+
+    The stages of the controller, i.e. run, predictor, steps and iterations, are placed on one track per step and the
+    sweeps, communication, transfers, evaluations of the right hand side and implicit solves on one track per level of
+    the step. In the MPI controller, the steps correspond to the ranks. The problems and transfers are traced by
+    wrapping the `eval_f` and `solve_system` methods of the problems and the `transfer` method of the steps at the
+    beginning of the run, which is undone at the end. Note that work done in worker processes of the `processes`
+    execution backend of the non-MPI controller is not traced beyond the sweeps and transfers as a whole.
+
+    Set the `trace_path` parameter of the controller to write the timeline to `<trace_path>/<prefix>timeline.json` at
+    the end of the run. The files of different MPI ranks can be combined with `pySDC.helpers.chrome_trace.merge_traces`.
+    Alternatively, access the events via the `trace` attribute.
+
+    Attributes:
+        trace (ChromeTrace): The recorded events
+        path (str): Name of the file to write the timeline to at the end of the run, or None
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.trace = ChromeTrace()
+        self.path = None
+        self.__starts = {}
+        self.__t0_setup = None
+        self.__running = []
+        self.__wrapped = []
+
+    def trace_to(self, path, prefix=''):
+        """
+        Write the timeline to a file at the end of the run
+
+        Args:
+            path (str): Directory to write the file to
+            prefix (str): Prefix of the file name, which needs to be unique for all processes writing to the directory
+
+        Returns:
+            None
+        """
+        self.path = os.path.join(path, f'{prefix}timeline.json')
+
+    def reset_stats(self):
+        """
+        Remove the events of previous runs along with the stats
+        """
+        super().reset_stats()
+        self.trace.reset()
+
+    def __track(self, step, level_number=None):
+        """
+        Get the ids of the track for a step and optionally a level and make sure that the track is named
+
+        Args:
+            step (pySDC.Step.step): the current step
+            level_number (int): the current level number or None for the track of the step
+
+        Returns:
+            tuple: process id and thread id
+        """
+        pid = step.status.slot
+        tid = 0 if level_number is None else level_number + 1
+        self.trace.name_track(
+            pid, tid, f'step {pid}', 'controller' if level_number is None else f'level {level_number}'
+        )
+        return pid, tid
+
+    def __begin(self, name, step, level_number=None):
+        self.__starts[(name, id(step), level_number)] = self.trace.now()
+
+    def __end(self, name, step, level_number=None, args=None):
+        start = self.__starts.pop((name, id(step), level_number), None)
+        if start is not None:
+            pid, tid = self.__track(step, level_number)
+            self.trace.add_event(name, 'controller' if level_number is None else 'level', start, pid, tid, args)
+
+    def __wrap(self, obj, name, category, step, get_level_number, get_name=None):
+        """
+        Replace a method of an object by one that records an event for every call
+
+        Args:
+            obj: The object
+            name (str): Name of the method
+            category (str): Category of the events
+            step (pySDC.Step.step): The step the object belongs to
+            get_level_number (callable): Get the level number from the arguments of the call
+            get_name (callable): Get the name of the event from the arguments of the call, defaults to the method name
+
+        Returns:
+            None
+        """
+        if any(me[0] is obj and me[1] == name for me in self.__wrapped):
+            return
+
+        method = getattr(obj, name)
+        trace = self.trace
+
+        def traced(*args, **kwargs):
+            start = trace.now()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                pid, tid = self.__track(step, get_level_number(*args, **kwargs))
+                trace.add_event(name if get_name is None else get_name(*args, **kwargs), category, start, pid, tid)
+
+        self.__wrapped.append((obj, name, vars(obj).get(name, None)))
+        setattr(obj, name, traced)
+
+    def __unwrap(self):
+        """
+        Restore the methods that have been replaced
+        """
+        for obj, name, original in self.__wrapped:
+            if original is None:
+                delattr(obj, name)
+            else:
+                setattr(obj, name, original)
+        self.__wrapped = []
+
+    def pre_setup(self, step, level_number):
+        super().pre_setup(step, level_number)
+        self.__t0_setup = self.trace.now()
+
+    def pre_run(self, step, level_number):
+        """
+        Start recording the run and wrap the methods of problems and transfers of the step
+
+        Args:
+            step (pySDC.Step.step): the current step
+            level_number (int): the current level number
+
+        Returns:
+            None
+        """
+        super().pre_run(step, level_number)
+
+        if self.__t0_setup is not None:
+            # the setup happens before any step is known, so it is placed on the track of the first step
+            pid, tid = self.__track(step)
+            self.trace.add_event('setup', 'controller', self.__t0_setup, pid, tid)
+            self.__t0_setup = None
+
+        for i, L in enumerate(step.levels):
+            for method in ['eval_f', 'solve_system']:
+                self.__wrap(L.prob, method, 'problem', step, lambda *args, _i=i, **kwargs: _i)
+
+        def get_transfer_name(source, target):
+            return 'restrict' if target.level_index > source.level_index else 'prolong'
+
+        self.__wrap(step, 'transfer', 'transfer', step, lambda source, target: source.level_index, get_transfer_name)
+
+        self.__running.append(step)
+        self.__begin('run', step)
+
+    def post_run(self, step, level_number):
+        """
+        Finish recording the run and write the timeline to disk once all steps are done
+
+        Args:
+            step (pySDC.Step.step): the current step
+            level_number (int): the current level number
+
+        Returns:
+            None
+        """
+        super().post_run(step, level_number)
+        self.__end('run', step)
+
+        self.__running = [me for me in self.__running if me is not step]
+        if len(self.__running) == 0:
+            self.__unwrap()
+            if self.path is not None:
+                self.trace.write(self.path)
+
+    def pre_predict(self, step, level_number):
+        super().pre_predict(step, level_number)
+        self.__begin('predict', step)
+
+    def post_predict(self, step, level_number):
+        super().post_predict(step, level_number)
+        self.__end('predict', step, args={'time': step.time})
+
+    def pre_step(self, step, level_number):
+        super().pre_step(step, level_number)
+        self.__begin('step', step)
+
+    def post_step(self, step, level_number):
+        super().post_step(step, level_number)
+        self.__end('step', step, args={'time': step.time, 'niter': step.status.iter, 'restart': step.status.restart})
+
+    def pre_iteration(self, step, level_number):
+        super().pre_iteration(step, level_number)
+        self.__begin('iteration', step)
+
+    def post_iteration(self, step, level_number):
+        super().post_iteration(step, level_number)
+        self.__end('iteration', step, args={'time': step.time, 'iter': step.status.iter})
+
+    def pre_sweep(self, step, level_number):
+        super().pre_sweep(step, level_number)
+        self.__begin('sweep', step, level_number)
+
+    def post_sweep(self, step, level_number):
+        super().post_sweep(step, level_number)
+        L = step.levels[level_number]
+        self.__end(
+            'sweep',
+            step,
+            level_number,
+            args={'time': step.time, 'iter': step.status.iter, 'sweep': L.status.sweep, 'residual': L.status.residual},
+        )
+
+    def pre_comm(self, step, level_number):
+        super().pre_comm(step, level_number)
+        self.__begin('comm', step, level_number)
+
+    def post_comm(self, step, level_number, add_to_stats=False):
+        super().post_comm(step, level_number, add_to_stats)
+        self.__end('comm', step, level_number, args={'time': step.time, 'iter': step.status.iter})
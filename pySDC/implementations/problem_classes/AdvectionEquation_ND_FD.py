@@ -34,7 +34,8 @@ class advectionNd(GenericNDimFinDiff):
     liniter : int, optional
         Max. iterations number for GMRES.
     solver_type : str, optional
-        Solve the linear system directly or using GMRES or CG
+        Solve the linear system directly, using GMRES or CG, with the FFT ("fft") or with geometric multigrid
+        ("multigrid")
     bc : str, optional
         Boundary conditions, either "periodic" or "dirichlet".
     sigma : float, optional
@@ -48,10 +49,19 @@ class advectionNd(GenericNDimFinDiff):
                 \right)^2
                 }
 
+    matrix_free : bool, optional
+        Apply the finite difference stencil instead of assembling the matrix, which requires an iterative solver.
+    preconditioner : str, optional
+        Use "multigrid" to precondition GMRES or CG with geometric multigrid.
+    mg_cycle : str, optional
+        Type of the multigrid cycle, either "V" or "W".
+    mg_smoothing_steps : int, optional
+        Number of pre- and post-smoothing steps of the multigrid cycles.
+
     Attributes
     ----------
     A: sparse matrix (CSC)
-        FD discretization matrix of the ND grad operator.
+        FD discretization matrix of the ND grad operator, or a FiniteDifferenceOperator in matrix-free mode.
     Id: sparse matrix (CSC)
         Identity matrix of the same dimension as A
 
@@ -73,8 +83,27 @@ class advectionNd(GenericNDimFinDiff):
         solver_type='direct',
         bc='periodic',
         sigma=6e-2,
+        matrix_free=False,
+        preconditioner=None,
+        mg_cycle='V',
+        mg_smoothing_steps=2,
     ):
-        super().__init__(nvars, -c, 1, freq, stencil_type, order, lintol, liniter, solver_type, bc)
+        super().__init__(
+            nvars,
+            -c,
+            1,
+            freq,
+            stencil_type,
+            order,
+            lintol,
+            liniter,
+            solver_type,
+            bc,
+            matrix_free,
+            preconditioner,
+            mg_cycle,
+            mg_smoothing_steps,
+        )
 
         if solver_type == 'CG':  # pragma: no cover
             self.logger.warn('CG is not usually used for advection equation')
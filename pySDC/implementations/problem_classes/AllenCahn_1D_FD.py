@@ -1,9 +1,9 @@
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve
+from scipy.sparse.linalg import splu
 
 from pySDC.core.Errors import ProblemError
-from pySDC.core.Problem import ptype
+from pySDC.core.Problem import ptype, NewtonSolver
 from pySDC.helpers import problem_helper
 from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh, comp2_mesh
 
@@ -21,7 +21,7 @@ class allencahn_front_fullyimplicit(ptype):
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, nvars, dw, eps, newton_maxiter, newton_tol, interval, stop_at_nan=True):
+    def __init__(self, nvars, dw, eps, newton_maxiter, newton_tol, interval, stop_at_nan=True, newton_update='full'):
         # we assert that nvars looks very particular here.. this will be necessary for coarsening in space later on
         if (nvars + 1) % 2 != 0:
             raise ProblemError('setup requires nvars = 2^p - 1')
@@ -36,9 +36,11 @@ class allencahn_front_fullyimplicit(ptype):
             'newton_tol',
             'interval',
             'stop_at_nan',
+            'newton_update',
             localVars=locals(),
             readOnly=True,
         )
+        self.newton = NewtonSolver(update=newton_update, work_counters=self.work_counters)
 
         # compute dx and get discretization matrix A
         self.dx = (self.interval[1] - self.interval[0]) / (self.nvars + 1)
@@ -47,7 +49,7 @@ class allencahn_front_fullyimplicit(ptype):
         self.A = problem_helper.get_finite_difference_matrix(
             derivative=2,
             order=2,
-            type='center',
+            stencil_type='center',
             dx=self.dx,
             size=self.nvars + 2,
             dim=1,
@@ -85,14 +87,11 @@ class allencahn_front_fullyimplicit(ptype):
         self.uext[-1] = 0.5 * (1 + np.tanh((self.interval[1] - v * t) / (np.sqrt(2) * self.eps)))
 
         A = self.A[1:-1, 1:-1]
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.newton_maxiter:
-            # print(n)
+
+        def residual(u):
             # form the function g with g(u) = 0
             self.uext[1:-1] = u[:]
-            g = (
+            return (
                 u
                 - rhs
                 - factor
@@ -103,12 +102,7 @@ class allencahn_front_fullyimplicit(ptype):
                 )
             )
 
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.newton_tol:
-                break
-
+        def get_linear_solver(u):
             # assemble dg
             dg = Id - factor * (
                 A
@@ -117,12 +111,10 @@ class allencahn_front_fullyimplicit(ptype):
                 * sp.diags((1.0 - u) * (1.0 - 2.0 * u) - u * ((1.0 - 2.0 * u) + 2.0 * (1.0 - u)), offsets=0)
                 - 6.0 * dw * sp.diags((1.0 - u) - u, offsets=0)
             )
+            return splu(dg.tocsc()).solve
 
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
-            # u -= gmres(dg, g, x0=z, tol=self.lin_tol)[0]
-            # increase iteration count
-            n += 1
+        # start newton iteration
+        u, n, res = self.newton.solve(residual, get_linear_solver, u, self.newton_tol, self.newton_maxiter, key=factor)
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
@@ -236,7 +228,10 @@ class allencahn_front_semiimplicit(allencahn_front_fullyimplicit):
         self.uext[0] = 0.0
         self.uext[-1] = 0.0
         self.uext[1:-1] = rhs[:]
-        me[:] = spsolve(sp.eye(self.nvars + 2, format='csc') - factor * self.A, self.uext)[1:-1]
+        LU = self.factorizations.get(
+            factor, lambda: splu((sp.eye(self.nvars + 2, format='csc') - factor * self.A).tocsc())
+        )
+        me[:] = LU.solve(self.uext)[1:-1]
         return me
 
 
@@ -272,22 +267,14 @@ class allencahn_front_finel(allencahn_front_fullyimplicit):
         self.uext[-1] = 0.5 * (1 + np.tanh((self.interval[1] - v * t) / (np.sqrt(2) * self.eps)))
 
         A = self.A[1:-1, 1:-1]
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.newton_maxiter:
-            # print(n)
+
+        def residual(u):
             # form the function g with g(u) = 0
             self.uext[1:-1] = u[:]
             gprim = 1.0 / self.dx**2 * ((1.0 - a2) / (1.0 - a2 * (2.0 * u - 1.0) ** 2) - 1.0) * (2.0 * u - 1.0)
-            g = u - rhs - factor * (self.A.dot(self.uext)[1:-1] - 1.0 * gprim - 6.0 * dw * u * (1.0 - u))
-
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.newton_tol:
-                break
+            return u - rhs - factor * (self.A.dot(self.uext)[1:-1] - 1.0 * gprim - 6.0 * dw * u * (1.0 - u))
 
+        def get_linear_solver(u):
             # assemble dg
             dgprim = (
                 1.0
@@ -299,13 +286,11 @@ class allencahn_front_finel(allencahn_front_fullyimplicit):
             )
 
             dg = Id - factor * (A - 1.0 * sp.diags(dgprim, offsets=0) - 6.0 * dw * sp.diags((1.0 - u) - u, offsets=0))
-
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
             # For some reason, doing cg or gmres does not work so well here...
-            # u -= cg(dg, g, x0=z, tol=self.lin_tol)[0]
-            # increase iteration count
-            n += 1
+            return splu(dg.tocsc()).solve
+
+        # start newton iteration
+        u, n, res = self.newton.solve(residual, get_linear_solver, u, self.newton_tol, self.newton_maxiter, key=factor)
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
@@ -361,7 +346,9 @@ class allencahn_periodic_fullyimplicit(ptype):
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, nvars, dw, eps, newton_maxiter, newton_tol, interval, radius, stop_at_nan=True):
+    def __init__(
+        self, nvars, dw, eps, newton_maxiter, newton_tol, interval, radius, stop_at_nan=True, newton_update='full'
+    ):
         # we assert that nvars looks very particular here.. this will be necessary for coarsening in space later on
         if (nvars) % 2 != 0:
             raise ProblemError('setup requires nvars = 2^p')
@@ -377,9 +364,11 @@ class allencahn_periodic_fullyimplicit(ptype):
             'interval',
             'radius',
             'stop_at_nan',
+            'newton_update',
             localVars=locals(),
             readOnly=True,
         )
+        self.newton = NewtonSolver(update=newton_update, work_counters=self.work_counters)
 
         # compute dx and get discretization matrix A
         self.dx = (self.interval[1] - self.interval[0]) / self.nvars
@@ -388,7 +377,7 @@ class allencahn_periodic_fullyimplicit(ptype):
         self.A = problem_helper.get_finite_difference_matrix(
             derivative=2,
             order=2,
-            type='center',
+            stencil_type='center',
             dx=self.dx,
             size=self.nvars,
             dim=1,
@@ -420,24 +409,15 @@ class allencahn_periodic_fullyimplicit(ptype):
 
         Id = sp.eye(self.nvars)
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.newton_maxiter:
-            # print(n)
+        def residual(u):
             # form the function g with g(u) = 0
-            g = (
+            return (
                 u
                 - rhs
                 - factor * (self.A.dot(u) - 2.0 / eps2 * u * (1.0 - u) * (1.0 - 2.0 * u) - 6.0 * dw * u * (1.0 - u))
             )
 
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.newton_tol:
-                break
-
+        def get_linear_solver(u):
             # assemble dg
             dg = Id - factor * (
                 self.A
@@ -446,12 +426,10 @@ class allencahn_periodic_fullyimplicit(ptype):
                 * sp.diags((1.0 - u) * (1.0 - 2.0 * u) - u * ((1.0 - 2.0 * u) + 2.0 * (1.0 - u)), offsets=0)
                 - 6.0 * dw * sp.diags((1.0 - u) - u, offsets=0)
             )
+            return splu(dg.tocsc()).solve
 
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
-            # u -= gmres(dg, g, x0=z, tol=self.lin_tol)[0]
-            # increase iteration count
-            n += 1
+        # start newton iteration
+        u, n, res = self.newton.solve(residual, get_linear_solver, u, self.newton_tol, self.newton_maxiter, key=factor)
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
@@ -528,7 +506,10 @@ class allencahn_periodic_semiimplicit(allencahn_periodic_fullyimplicit):
         """
 
         me = self.dtype_u(u0)
-        me[:] = spsolve(sp.eye(self.nvars, format='csc') - factor * self.A, rhs)
+        LU = self.factorizations.get(
+            factor, lambda: splu((sp.eye(self.nvars, format='csc') - factor * self.A).tocsc())
+        )
+        me[:] = LU.solve(rhs)
         return me
 
     def eval_f(self, u, t):
@@ -560,8 +541,10 @@ class allencahn_periodic_multiimplicit(allencahn_periodic_fullyimplicit):
 
     dtype_f = comp2_mesh
 
-    def __init__(self, nvars, dw, eps, newton_maxiter, newton_tol, interval, radius, stop_at_nan=True):
-        super().__init__(nvars, dw, eps, newton_maxiter, newton_tol, interval, radius, stop_at_nan)
+    def __init__(
+        self, nvars, dw, eps, newton_maxiter, newton_tol, interval, radius, stop_at_nan=True, newton_update='full'
+    ):
+        super().__init__(nvars, dw, eps, newton_maxiter, newton_tol, interval, radius, stop_at_nan, newton_update)
         self.A -= sp.eye(self.init) * 0.0 / self.eps**2
 
     def solve_system_1(self, rhs, factor, u0, t):
@@ -579,7 +562,10 @@ class allencahn_periodic_multiimplicit(allencahn_periodic_fullyimplicit):
         """
 
         me = self.dtype_u(u0)
-        me[:] = spsolve(sp.eye(self.nvars, format='csc') - factor * self.A, rhs)
+        LU = self.factorizations.get(
+            factor, lambda: splu((sp.eye(self.nvars, format='csc') - factor * self.A).tocsc())
+        )
+        me[:] = LU.solve(rhs)
         return me
 
     def eval_f(self, u, t):
@@ -622,37 +608,26 @@ class allencahn_periodic_multiimplicit(allencahn_periodic_fullyimplicit):
 
         Id = sp.eye(self.nvars)
 
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.newton_maxiter:
-            # print(n)
+        def residual(u):
             # form the function g with g(u) = 0
-            g = (
+            return (
                 u
                 - rhs
                 - factor
                 * (-2.0 / eps2 * u * (1.0 - u) * (1.0 - 2.0 * u) - 6.0 * dw * u * (1.0 - u) + 0.0 / self.eps**2 * u)
             )
 
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-
-            if res < self.newton_tol:
-                break
-
+        def get_linear_solver(u):
             # assemble dg
             dg = Id - factor * (
                 -2.0 / eps2 * sp.diags((1.0 - u) * (1.0 - 2.0 * u) - u * ((1.0 - 2.0 * u) + 2.0 * (1.0 - u)), offsets=0)
                 - 6.0 * dw * sp.diags((1.0 - u) - u, offsets=0)
                 + 0.0 / self.eps**2 * Id
             )
+            return splu(dg.tocsc()).solve
 
-            # newton update: u1 = u0 - g/dg
-            u -= spsolve(dg, g)
-            # u -= gmres(dg, g, x0=z, tol=self.lin_tol)[0]
-            # increase iteration count
-            n += 1
+        # start newton iteration
+        u, n, res = self.newton.solve(residual, get_linear_solver, u, self.newton_tol, self.newton_maxiter, key=factor)
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
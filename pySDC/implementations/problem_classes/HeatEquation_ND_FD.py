@@ -17,8 +17,27 @@ class heatNd_unforced(GenericNDimFinDiff):
         solver_type='direct',
         bc='periodic',
         sigma=6e-2,
+        matrix_free=False,
+        preconditioner=None,
+        mg_cycle='V',
+        mg_smoothing_steps=2,
     ):
-        super().__init__(nvars, nu, 2, freq, stencil_type, order, lintol, liniter, solver_type, bc)
+        super().__init__(
+            nvars,
+            nu,
+            2,
+            freq,
+            stencil_type,
+            order,
+            lintol,
+            liniter,
+            solver_type,
+            bc,
+            matrix_free,
+            preconditioner,
+            mg_cycle,
+            mg_smoothing_steps,
+        )
         if solver_type == 'GMRES':
             self.logger.warn('GMRES is not usually used for heat equation')
         self._makeAttributeAndRegister('nu', localVars=locals(), readOnly=True)
@@ -78,20 +97,21 @@ class heatNd_forced(heatNd_unforced):
 
     dtype_f = imex_mesh
 
-    def eval_f(self, u, t):
+    def eval_f(self, u, t, out=None):
         """
         Routine to evaluate the RHS
 
         Args:
             u (dtype_u): current values
             t (float): current time
+            out (dtype_f): optional data object to write the RHS to instead of creating a new one
 
         Returns:
             dtype_f: the RHS
         """
 
-        f = self.f_init
-        f.impl[:] = self.A.dot(u.flatten()).reshape(self.nvars)
+        f = self.f_init if out is None else out
+        self.apply_A(u, f.impl)
 
         ndim, freq, nu = self.ndim, self.freq, self.nu
         if ndim == 1:
@@ -1,5 +1,5 @@
 import numpy as np
-from pySDC.core.Problem import ptype, WorkCounter
+from pySDC.core.Problem import ptype, WorkCounter, NewtonSolver
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
@@ -11,7 +11,8 @@ class LorenzAttractor(ptype):
     It is well known for the "Butterfly Effect", because the solution looks like a butterfly (solve to Tend = 100 or
     so to see this with these initial conditions) and because of the chaotic nature.
 
-    Since the problem is non-linear, we need to use a Newton solver.
+    Since the problem is non-linear, we need to use a Newton solver, see `NewtonSolver` for the choices of
+    `newton_update`.
 
     Problem and initial conditions do not originate from,
     but were taken from doi.org/10.2140/camcos.2015.10.1
@@ -22,7 +23,7 @@ class LorenzAttractor(ptype):
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, sigma=10.0, rho=28.0, beta=8.0 / 3.0, newton_tol=1e-9, newton_maxiter=99):
+    def __init__(self, sigma=10.0, rho=28.0, beta=8.0 / 3.0, newton_tol=1e-9, newton_maxiter=99, newton_update='full'):
         """
         Initialization routine
 
@@ -34,9 +35,9 @@ class LorenzAttractor(ptype):
         super().__init__(init=(nvars, None, np.dtype('float64')))
         self._makeAttributeAndRegister('nvars', localVars=locals(), readOnly=True)
         self._makeAttributeAndRegister(
-            'sigma', 'rho', 'beta', 'newton_tol', 'newton_maxiter', localVars=locals(), readOnly=True
+            'sigma', 'rho', 'beta', 'newton_tol', 'newton_maxiter', 'newton_update', localVars=locals(), readOnly=True
         )
-        self.work_counters['newton'] = WorkCounter()
+        self.newton = NewtonSolver(update=newton_update, work_counters=self.work_counters)
         self.work_counters['rhs'] = WorkCounter()
 
     def eval_f(self, u, t):
@@ -83,12 +84,9 @@ class LorenzAttractor(ptype):
         rho = self.rho
         beta = self.beta
 
-        # start Newton iterations
-        u = self.dtype_u(u0)
-        res = np.inf
-        for _n in range(0, self.newton_maxiter):
+        def residual(u):
             # assemble G such that G(u) = 0 at the solution to the step
-            G = np.array(
+            return np.array(
                 [
                     u[0] - dt * sigma * (u[1] - u[0]) - rhs[0],
                     u[1] - dt * (rho * u[0] - u[1] - u[0] * u[2]) - rhs[1],
@@ -96,11 +94,7 @@ class LorenzAttractor(ptype):
                 ]
             )
 
-            # compute the residual and determine if we are done
-            res = np.linalg.norm(G, np.inf)
-            if res <= self.newton_tol or np.isnan(res):
-                break
-
+        def get_linear_solver(u):
             # assemble inverse of Jacobian J of G
             prefactor = 1.0 / (
                 dt**3 * sigma * (u[0] ** 2 + u[0] * u[1] + beta * (-rho + u[2] + 1))
@@ -129,11 +123,12 @@ class LorenzAttractor(ptype):
             )
 
             # solve the linear system for the Newton correction J delta = G
-            delta = J_inv @ G
+            return lambda G: J_inv @ G
 
-            # update solution
-            u = u - delta
-            self.work_counters['newton']()
+        # start Newton iterations
+        u, _n, _res = self.newton.solve(
+            residual, get_linear_solver, self.dtype_u(u0), self.newton_tol, self.newton_maxiter, key=dt
+        )
 
         return u
 
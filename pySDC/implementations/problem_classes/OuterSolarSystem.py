@@ -22,6 +22,21 @@ class outer_solar_system(ptype):
         super().__init__(((3, 6), None, np.dtype('float64')))
         self._makeAttributeAndRegister('sun_only', localVars=locals())
 
+    @staticmethod
+    def get_distances(pos):
+        """
+        Compute the distance vectors and distances between all pairs of bodies at once
+
+        Args:
+            pos (numpy.ndarray): positions of the bodies with shape (3, N)
+        Returns:
+            numpy.ndarray: distance vectors pos[:, i] - pos[:, j] with shape (3, N, N)
+            numpy.ndarray: distances with shape (N, N)
+        """
+        dx = pos[:, :, None] - pos[:, None, :]
+        r = np.sqrt(np.einsum('kij,kij->ij', dx, dx))
+        return dx, r
+
     def eval_f(self, u, t):
         """
         Routine to compute the RHS
@@ -37,21 +52,15 @@ class outer_solar_system(ptype):
         # compute the acceleration due to gravitational forces
         # ... only with respect to the sun
         if self.sun_only:
-            for i in range(1, self.init[0][-1]):
-                dx = u.pos[:, i] - u.pos[:, 0]
-                r = np.sqrt(np.dot(dx, dx))
-                df = self.G * dx / (r**3)
-                me[:, i] -= u.m[0] * df
+            dx = u.pos[:, 1:] - u.pos[:, :1]
+            r = np.sqrt(np.einsum('ki,ki->i', dx, dx))
+            me[:, 1:] = -u.m[0] * self.G * dx / r**3
 
         # ... or with all planets involved
         else:
-            for i in range(self.init[0][-1]):
-                for j in range(i):
-                    dx = u.pos[:, i] - u.pos[:, j]
-                    r = np.sqrt(np.dot(dx, dx))
-                    df = self.G * dx / (r**3)
-                    me[:, i] -= u.m[j] * df
-                    me[:, j] += u.m[i] * df
+            dx, r = self.get_distances(u.pos)
+            np.fill_diagonal(r, np.inf)
+            me[:] = -self.G * np.einsum('kij,ij->ki', dx, u.m[None, :] / r**3)
 
         return me
 
@@ -100,15 +109,10 @@ class outer_solar_system(ptype):
             float: hamiltonian
         """
 
-        ham = 0
-
-        for i in range(self.init[0][-1]):
-            ham += 0.5 * u.m[i] * np.dot(u.vel[:, i], u.vel[:, i])
+        dx, r = self.get_distances(u.pos)
+        i, j = np.tril_indices(len(u.m), k=-1)
 
-        for i in range(self.init[0][-1]):
-            for j in range(i):
-                dx = u.pos[:, i] - u.pos[:, j]
-                r = np.sqrt(np.dot(dx, dx))
-                ham -= self.G * u.m[i] * u.m[j] / r
+        ham = 0.5 * np.dot(u.m, np.einsum('ki,ki->i', u.vel, u.vel))
+        ham -= self.G * np.sum(u.m[i] * u.m[j] / r[i, j])
 
         return ham
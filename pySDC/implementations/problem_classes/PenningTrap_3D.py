@@ -6,20 +6,254 @@ from pySDC.core.Problem import ptype
 from pySDC.implementations.datatype_classes.particles import particles, fields, acceleration
 
 
+@jit(nopython=True, nogil=True)
+def build_octree(pos, q, leaf_size, max_depth):
+    """
+    Build an octree over the particles for the Barnes-Hut approximation of the interactions
+
+    The nodes are created level by level, such that the children of a node are stored contiguously. Each node stores the
+    range of its particles in the permutation `perm` as well as the total charge and the center of charge of its positive
+    and of its negative charges, such that the monopoles do not cancel in the presence of both signs.
+
+    Args:
+        pos (numpy.ndarray): positions of the particles with shape (3, N)
+        q (numpy.ndarray): charges of the particles
+        leaf_size (int): maximal number of particles in a leaf
+        max_depth (int): maximal depth of the tree, nodes on this level are leaves regardless of their size
+
+    Returns:
+        tuple: permutation of the particles, start and end of the particles, first child, number of children, center
+               and half width of the box, total charges and centers of charge of the nodes with shapes (n, 2) and
+               (n, 2, 3) for positive and negative charges
+    """
+    N = pos.shape[1]
+    perm = np.arange(N)
+
+    capacity = 2 * N + 8
+    start = np.zeros(capacity, dtype=np.int64)
+    end = np.zeros(capacity, dtype=np.int64)
+    depth = np.zeros(capacity, dtype=np.int64)
+    first_child = np.zeros(capacity, dtype=np.int64)
+    n_children = np.zeros(capacity, dtype=np.int64)
+    center = np.zeros((capacity, 3))
+    half = np.zeros(capacity)
+    charge = np.zeros((capacity, 2))
+    com = np.zeros((capacity, 2, 3))
+
+    # bounding cube of all particles
+    lo = np.zeros(3)
+    hi = np.zeros(3)
+    for d in range(3):
+        lo[d] = pos[d].min()
+        hi[d] = pos[d].max()
+    center[0] = (lo + hi) / 2
+    half[0] = max((hi - lo).max() / 2 * (1 + 1e-10), 1e-300)
+    start[0] = 0
+    end[0] = N
+    n_nodes = 1
+
+    octant = np.zeros(N, dtype=np.int64)
+    counts = np.zeros(8, dtype=np.int64)
+    offsets = np.zeros(8, dtype=np.int64)
+    buffer = np.zeros(N, dtype=np.int64)
+
+    k = 0
+    while k < n_nodes:
+        # moments of the node
+        for i in range(start[k], end[k]):
+            p = perm[i]
+            sign = 0 if q[p] >= 0 else 1
+            charge[k, sign] += q[p]
+            com[k, sign] += q[p] * pos[:, p]
+        for sign in range(2):
+            if charge[k, sign] != 0:
+                com[k, sign] /= charge[k, sign]
+            else:
+                com[k, sign] = center[k]
+
+        if end[k] - start[k] > leaf_size and depth[k] < max_depth:
+            # sort the particles into the octants
+            counts[:] = 0
+            for i in range(start[k], end[k]):
+                p = perm[i]
+                o = 0
+                for d in range(3):
+                    if pos[d, p] >= center[k, d]:
+                        o += 2**d
+                octant[i] = o
+                counts[o] += 1
+
+            offsets[0] = start[k]
+            for o in range(1, 8):
+                offsets[o] = offsets[o - 1] + counts[o - 1]
+            for i in range(start[k], end[k]):
+                buffer[offsets[octant[i]]] = perm[i]
+                offsets[octant[i]] += 1
+            perm[start[k] : end[k]] = buffer[start[k] : end[k]]
+
+            # grow the storage if needed
+            if n_nodes + 8 > capacity:
+                capacity *= 2
+                start = _grow(start, capacity)
+                end = _grow(end, capacity)
+                depth = _grow(depth, capacity)
+                first_child = _grow(first_child, capacity)
+                n_children = _grow(n_children, capacity)
+                center = _grow(center, capacity)
+                half = _grow(half, capacity)
+                charge = _grow(charge, capacity)
+                com = _grow(com, capacity)
+
+            # add the non-empty octants as children
+            first_child[k] = n_nodes
+            lower = start[k]
+            for o in range(8):
+                if counts[o] > 0:
+                    start[n_nodes] = lower
+                    end[n_nodes] = lower + counts[o]
+                    depth[n_nodes] = depth[k] + 1
+                    half[n_nodes] = half[k] / 2
+                    for d in range(3):
+                        sign = 1.0 if (o >> d) & 1 else -1.0
+                        center[n_nodes, d] = center[k, d] + sign * half[n_nodes]
+                    n_children[k] += 1
+                    n_nodes += 1
+                lower += counts[o]
+        k += 1
+
+    return (
+        perm,
+        start[:n_nodes],
+        end[:n_nodes],
+        first_child[:n_nodes],
+        n_children[:n_nodes],
+        center[:n_nodes],
+        half[:n_nodes],
+        charge[:n_nodes],
+        com[:n_nodes],
+    )
+
+
+@jit(nopython=True, nogil=True)
+def _grow(array, capacity):
+    """
+    Copy an array into a larger one along the first axis
+    """
+    new = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+    new[: array.shape[0]] = array
+    return new
+
+
+@jit(nopython=True, nogil=True)
+def tree_interactions(N, pos, sig, q, theta, leaf_size, max_depth):
+    """
+    Barnes-Hut approximation of the particle-particle interactions
+
+    The tree is traversed for each particle and a node is replaced by its positive and negative total charges at their
+    centers of charge if the particle is outside of the box of the node and the ratio of the width of the box and the
+    distance to the centers of charge is smaller than the opening angle `theta`. With `theta = 0`, all interactions are
+    computed directly.
+
+    Args:
+        N (int): number of particles
+        pos (numpy.ndarray): positions of the particles with shape (3, N)
+        sig (float): smoothing parameter
+        q (numpy.ndarray): charges of the particles
+        theta (float): opening angle
+        leaf_size (int): maximal number of particles in a leaf
+        max_depth (int): maximal depth of the tree
+
+    Returns:
+        numpy.ndarray: the internal E field for each particle
+    """
+    perm, start, end, first_child, n_children, center, half, charge, com = build_octree(pos, q, leaf_size, max_depth)
+
+    Efield = np.zeros((3, N))
+    stack = np.zeros(8 * (max_depth + 1) + 1, dtype=np.int64)
+
+    for i in range(N):
+        ex = 0.0
+        ey = 0.0
+        ez = 0.0
+
+        stack[0] = 0
+        n_stack = 1
+        while n_stack > 0:
+            n_stack -= 1
+            k = stack[n_stack]
+
+            if n_children[k] == 0:
+                for m in range(start[k], end[k]):
+                    j = perm[m]
+                    dx = pos[0, i] - pos[0, j]
+                    dy = pos[1, i] - pos[1, j]
+                    dz = pos[2, i] - pos[2, j]
+                    fac = q[j] / (dx**2 + dy**2 + dz**2 + sig**2) ** 1.5
+                    ex += fac * dx
+                    ey += fac * dy
+                    ez += fac * dz
+                continue
+
+            outside = (
+                abs(pos[0, i] - center[k, 0]) > half[k]
+                or abs(pos[1, i] - center[k, 1]) > half[k]
+                or abs(pos[2, i] - center[k, 2]) > half[k]
+            )
+            accept = outside
+            for sign in range(2):
+                if charge[k, sign] != 0:
+                    dist2 = (
+                        (pos[0, i] - com[k, sign, 0]) ** 2
+                        + (pos[1, i] - com[k, sign, 1]) ** 2
+                        + (pos[2, i] - com[k, sign, 2]) ** 2
+                    )
+                    accept = accept and 4 * half[k] ** 2 < theta**2 * dist2
+
+            if accept:
+                for sign in range(2):
+                    if charge[k, sign] != 0:
+                        dx = pos[0, i] - com[k, sign, 0]
+                        dy = pos[1, i] - com[k, sign, 1]
+                        dz = pos[2, i] - com[k, sign, 2]
+                        fac = charge[k, sign] / (dx**2 + dy**2 + dz**2 + sig**2) ** 1.5
+                        ex += fac * dx
+                        ey += fac * dy
+                        ez += fac * dz
+            else:
+                for c in range(first_child[k], first_child[k] + n_children[k]):
+                    stack[n_stack] = c
+                    n_stack += 1
+
+        Efield[0, i] = ex
+        Efield[1, i] = ey
+        Efield[2, i] = ez
+
+    return Efield
+
+
 # noinspection PyUnusedLocal
 class penningtrap(ptype):
     """
     Example implementing particles in a penning trap
+
+    The particle-particle interactions are computed either by a direct sum with O(N^2) complexity or approximately by
+    the Barnes-Hut tree code with O(N log N) complexity, which is selected by `interactions='tree'`. The accuracy of
+    the latter is controlled by the opening angle `theta`, where smaller values are more accurate and more expensive.
     """
 
     dtype_u = particles
     dtype_f = fields
 
-    def __init__(self, omega_B, omega_E, u0, nparts, sig):
+    def __init__(self, omega_B, omega_E, u0, nparts, sig, interactions='direct', theta=0.5, leaf_size=8, max_depth=32):
+        if interactions not in ['direct', 'tree']:
+            raise ProblemError(f'Unknown method {interactions!r} for the interactions, choose from "direct" or "tree"')
+
         # invoke super init, passing nparts, dtype_u and dtype_f
         super().__init__(((3, nparts), None, np.dtype('float64')))
         self._makeAttributeAndRegister('nparts', localVars=locals(), readOnly=True)
-        self._makeAttributeAndRegister('omega_B', 'omega_E', 'u0', 'sig', localVars=locals())
+        self._makeAttributeAndRegister(
+            'omega_B', 'omega_E', 'u0', 'sig', 'interactions', 'theta', 'leaf_size', 'max_depth', localVars=locals()
+        )
 
     @staticmethod
     @jit(nopython=True, nogil=True)
@@ -56,7 +290,10 @@ class penningtrap(ptype):
 
         N = self.nparts
 
-        Efield = self.fast_interactions(N, part.pos, self.sig, part.q)
+        if self.interactions == 'tree':
+            Efield = tree_interactions(N, part.pos, self.sig, part.q, self.theta, self.leaf_size, self.max_depth)
+        else:
+            Efield = self.fast_interactions(N, part.pos, self.sig, part.q)
 
         return Efield
 
@@ -71,16 +308,13 @@ class penningtrap(ptype):
             dtype_f: Fields for the particles (internal and external)
         """
 
-        N = self.nparts
-
         Emat = np.diag([1, 1, -2])
         f = self.dtype_f(self.init)
 
         f.elec[:] = self.get_interactions(part)
 
-        for n in range(N):
-            f.elec[:, n] += self.omega_E**2 / (part.q[n] / part.m[n]) * np.dot(Emat, part.pos[:, n])
-            f.magn[:, n] = self.omega_B * np.array([0, 0, 1])
+        f.elec[:] += self.omega_E**2 / (part.q / part.m) * np.dot(Emat, part.pos)
+        f.magn[:] = self.omega_B * np.array([0, 0, 1])[:, None]
 
         return f
 
@@ -115,32 +349,13 @@ class penningtrap(ptype):
         # initialize random seed
         np.random.seed(N)
 
-        comx = u.pos[0, 0]
-        comy = u.pos[1, 0]
-        comz = u.pos[2, 0]
-
-        for n in range(1, N):
-            # draw 3 random variables in [-1,1] to shift positions
-            r = np.random.random_sample(3) - 1
-            u.pos[0, n] = r[0] + u0[0][0]
-            u.pos[1, n] = r[1] + u0[0][1]
-            u.pos[2, n] = r[2] + u0[0][2]
-
-            # draw 3 random variables in [-5,5] to shift velocities
-            r = np.random.random_sample(3) - 5
-            u.vel[0, n] = r[0] + u0[1][0]
-            u.vel[1, n] = r[1] + u0[1][1]
-            u.vel[2, n] = r[2] + u0[1][2]
-
-            u.q[n] = u0[2][0]
-            u.m[n] = u0[3][0]
-
-            # gather positions to check center
-            comx += u.pos[0, n]
-            comy += u.pos[1, n]
-            comz += u.pos[2, n]
+        # draw 3 random variables in [-1,1] to shift positions and 3 random variables in [-5,5] to shift velocities
+        r = np.random.random_sample((N - 1, 6))
+        u.pos[:, 1:] = (r[:, :3] - 1).T + np.array(u0[0])[:, None]
+        u.vel[:, 1:] = (r[:, 3:] - 5).T + np.array(u0[1])[:, None]
 
-        # print('Center of positions:',comx/N,comy/N,comz/N)
+        u.q[1:] = u0[2][0]
+        u.m[1:] = u0[3][0]
 
         return u
 
@@ -207,11 +422,8 @@ class penningtrap(ptype):
         if not isinstance(part, particles):
             raise ProblemError('something is wrong during build_f, got %s' % type(part))
 
-        N = self.nparts
-
         rhs = acceleration(self.init)
-        for n in range(N):
-            rhs[:, n] = part.q[n] / part.m[n] * (f.elec[:, n] + np.cross(part.vel[:, n], f.magn[:, n]))
+        rhs[:] = part.q / part.m * (f.elec + np.cross(part.vel, f.magn, axis=0))
 
         return rhs
 
@@ -230,23 +442,20 @@ class penningtrap(ptype):
             the velocities at the (m+1)th node
         """
 
-        N = self.nparts
         vel = particles.velocity(self.init)
 
         Emean = 0.5 * (old_fields.elec + new_fields.elec)
-
-        for n in range(N):
-            a = old_parts.q[n] / old_parts.m[n]
-
-            c[:, n] += dt / 2 * a * np.cross(old_parts.vel[:, n], old_fields.magn[:, n] - new_fields.magn[:, n])
-
-            # pre-velocity, separated by the electric forces (and the c term)
-            vm = old_parts.vel[:, n] + dt / 2 * a * Emean[:, n] + c[:, n] / 2
-            # rotation
-            t = dt / 2 * a * new_fields.magn[:, n]
-            s = 2 * t / (1 + np.linalg.norm(t, 2) ** 2)
-            vp = vm + np.cross(vm + np.cross(vm, t), s)
-            # post-velocity
-            vel[:, n] = vp + dt / 2 * a * Emean[:, n] + c[:, n] / 2
+        a = old_parts.q / old_parts.m
+
+        c[:] += dt / 2 * a * np.cross(old_parts.vel, old_fields.magn - new_fields.magn, axis=0)
+
+        # pre-velocity, separated by the electric forces (and the c term)
+        vm = old_parts.vel + dt / 2 * a * Emean + c / 2
+        # rotation
+        t = dt / 2 * a * new_fields.magn
+        s = 2 * t / (1 + np.linalg.norm(t, 2, axis=0) ** 2)
+        vp = vm + np.cross(vm + np.cross(vm, t, axis=0), s, axis=0)
+        # post-velocity
+        vel[:] = vp + dt / 2 * a * Emean + c / 2
 
         return vel
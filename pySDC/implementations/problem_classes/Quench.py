@@ -1,9 +1,9 @@
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve, gmres, inv
+from scipy.sparse.linalg import spsolve, splu, gmres, inv
 
 from pySDC.core.Errors import ProblemError
-from pySDC.core.Problem import ptype, WorkCounter
+from pySDC.core.Problem import ptype, WorkCounter, NewtonSolver
 from pySDC.helpers import problem_helper
 from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
 
@@ -20,6 +20,8 @@ class Quench(ptype):
     insulated from its environment except for the leak.
     We add a non-linear term that heats parts of the domain that exceed a certain temperature threshold as well as the
     leak itself.
+
+    The implicit systems are solved with the `NewtonSolver` using the update strategy `newton_update`.
     """
 
     dtype_u = mesh
@@ -45,6 +47,7 @@ class Quench(ptype):
         liniter=99,
         direct_solver=True,
         reference_sol_type='scipy',
+        newton_update='full',
     ):
         """
         Initialization routine
@@ -75,6 +78,7 @@ class Quench(ptype):
             'liniter',
             'direct_solver',
             'reference_sol_type',
+            'newton_update',
             localVars=locals(),
             readOnly=True,
         )
@@ -108,7 +112,7 @@ class Quench(ptype):
 
         self.leak = np.logical_and(self.xv > self.leak_range[0], self.xv < self.leak_range[1])
 
-        self.work_counters['newton'] = WorkCounter()
+        self.newton = NewtonSolver(update=newton_update, work_counters=self.work_counters)
         self.work_counters['rhs'] = WorkCounter()
         if not self.direct_solver:
             self.work_counters['linear'] = WorkCounter()
@@ -216,14 +220,13 @@ class Quench(ptype):
             dtype_u: solution as mesh
         """
         u = self.dtype_u(u0)
-        res = np.inf
         delta = np.zeros_like(u)
 
         # construct a preconditioner for the space solver
         if not self.direct_solver:
             M = inv(self.Id - factor * self.A)
 
-        for n in range(0, self.newton_iter):
+        def residual(u):
             # assemble G such that G(u) = 0 at the solution of the step
             G = u - factor * self.eval_f(u, t) - rhs
             self.work_counters[
@@ -231,19 +234,18 @@ class Quench(ptype):
             ].niter -= (
                 1  # Work regarding construction of the Jacobian etc. should count into the Newton iterations only
             )
+            return G
 
-            res = np.linalg.norm(G, np.inf)
-            if res <= self.newton_tol and n > 0:  # we want to make at least one Newton iteration
-                break
-
+        def get_linear_solver(u):
             # assemble Jacobian J of G
             J = self.Id - factor * (self.A + self.get_non_linear_Jacobian(u))
 
             # solve the linear system
             if self.direct_solver:
-                delta = spsolve(J, G)
-            else:
-                delta, info = gmres(
+                return splu(J.tocsc()).solve
+
+            def solve(G):
+                delta[:], info = gmres(
                     J,
                     G,
                     x0=delta,
@@ -253,14 +255,14 @@ class Quench(ptype):
                     atol=0,
                     callback=self.work_counters['linear'],
                 )
+                return delta.copy()
 
-            if not np.isfinite(delta).all():
-                break
+            return solve
 
-            # update solution
-            u = u - delta
-
-            self.work_counters['newton']()
+        # we want to make at least one Newton iteration
+        u, _n, _res = self.newton.solve(
+            residual, get_linear_solver, u, self.newton_tol, self.newton_iter, key=factor, min_iter=1
+        )
 
         return u
 
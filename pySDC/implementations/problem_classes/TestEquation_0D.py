@@ -54,23 +54,24 @@ class testequation0d(ptype):
         A = sp.diags(lambdas)
         return A
 
-    def eval_f(self, u, t):
+    def eval_f(self, u, t, out=None):
         """
         Routine to evaluate the RHS
 
         Args:
             u (dtype_u): current values
             t (float): current time
+            out (dtype_f): optional data object to write the RHS to instead of creating a new one
 
         Returns:
             dtype_f: the RHS
         """
 
-        f = self.dtype_f(self.init)
+        f = self.dtype_f(self.init) if out is None else out
         f[:] = self.A.dot(u)
         return f
 
-    def solve_system(self, rhs, factor, u0, t):
+    def solve_system(self, rhs, factor, u0, t, out=None):
         """
         Simple linear solver for (I-factor*A)u = rhs
 
@@ -79,13 +80,14 @@ class testequation0d(ptype):
             factor (float): abbrev. for the local stepsize (or any other factor required)
             u0 (dtype_u): initial guess for the iterative solver
             t (float): current time (e.g. for time-dependent BCs)
+            out (dtype_u): optional data object to write the solution to instead of creating a new one
 
         Returns:
             dtype_u: solution as mesh
         """
 
-        me = self.dtype_u(self.init)
-        L = splu(sp.eye(self.nvars, format='csc') - factor * self.A)
+        me = self.dtype_u(self.init) if out is None else out
+        L = self.factorizations.get(factor, lambda: splu(sp.eye(self.nvars, format='csc') - factor * self.A))
         me[:] = L.solve(rhs)
         return me
 
@@ -1,7 +1,7 @@
 import numpy as np
 
 from pySDC.core.Errors import ProblemError
-from pySDC.core.Problem import ptype, WorkCounter
+from pySDC.core.Problem import ptype, WorkCounter, NewtonSolver
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
@@ -10,13 +10,18 @@ class vanderpol(ptype):
     """
     Example implementing the van der pol oscillator
 
+    Newton's method for the implicit systems is provided by `NewtonSolver`, which reuses Jacobians as selected by
+    `newton_update`.
+
     TODO : doku
     """
 
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, u0, mu, newton_maxiter, newton_tol, stop_at_nan=True, crash_at_maxiter=True):
+    def __init__(
+        self, u0, mu, newton_maxiter, newton_tol, stop_at_nan=True, crash_at_maxiter=True, newton_update='full'
+    ):
         """
         Initialization routine
         """
@@ -26,7 +31,8 @@ class vanderpol(ptype):
         self._makeAttributeAndRegister(
             'mu', 'newton_maxiter', 'newton_tol', 'stop_at_nan', 'crash_at_maxiter', localVars=locals()
         )
-        self.work_counters['newton'] = WorkCounter()
+        self._makeAttributeAndRegister('newton_update', localVars=locals(), readOnly=True)
+        self.newton = NewtonSolver(update=newton_update, work_counters=self.work_counters)
         self.work_counters['rhs'] = WorkCounter()
 
     def u_exact(self, t, u_init=None, t_init=None):
@@ -89,36 +95,22 @@ class vanderpol(ptype):
 
         mu = self.mu
 
-        # create new mesh object from u0 and set initial values for iteration
-        u = self.dtype_u(u0)
-        x1 = u[0]
-        x2 = u[1]
-
-        # start newton iteration
-        n = 0
-        res = 99
-        while n < self.newton_maxiter:
+        def residual(u):
             # form the function g with g(u) = 0
-            g = np.array([x1 - dt * x2 - rhs[0], x2 - dt * (mu * (1 - x1**2) * x2 - x1) - rhs[1]])
+            x1, x2 = u[0], u[1]
+            return np.array([x1 - dt * x2 - rhs[0], x2 - dt * (mu * (1 - x1**2) * x2 - x1) - rhs[1]])
 
-            # if g is close to 0, then we are done
-            res = np.linalg.norm(g, np.inf)
-            if res < self.newton_tol or np.isnan(res):
-                break
-
-            # prefactor for dg/du
+        def get_linear_solver(u):
+            # assemble the inverse of dg/du
+            x1, x2 = u[0], u[1]
             c = 1.0 / (-2 * dt**2 * mu * x1 * x2 - dt**2 - 1 + dt * mu * (1 - x1**2))
-            # assemble dg/du
             dg = c * np.array([[dt * mu * (1 - x1**2) - 1, -dt], [2 * dt * mu * x1 * x2 + dt, -1]])
+            return lambda g: np.dot(dg, g)
 
-            # newton update: u1 = u0 - g/dg
-            u -= np.dot(dg, g)
-
-            # set new values and increase iteration count
-            x1 = u[0]
-            x2 = u[1]
-            n += 1
-            self.work_counters['newton']()
+        # create new mesh object from u0 and start newton iteration
+        u, n, res = self.newton.solve(
+            residual, get_linear_solver, self.dtype_u(u0), self.newton_tol, self.newton_maxiter, key=dt
+        )
 
         if np.isnan(res) and self.stop_at_nan:
             raise ProblemError('Newton got nan after %i iterations, aborting...' % n)
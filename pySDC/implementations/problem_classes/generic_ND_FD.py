@@ -5,14 +5,18 @@ Created on Sat Feb 11 22:39:30 2023
 
 @author: telu
 """
+
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import gmres, spsolve, cg
+from scipy.fft import rfftn, irfftn, dstn, idstn
+from scipy.sparse.linalg import gmres, splu, cg, LinearOperator
 
 from pySDC.core.Errors import ProblemError
 from pySDC.core.Problem import ptype, WorkCounter
 from pySDC.helpers import problem_helper
+from pySDC.helpers.multigrid import GeometricMultigrid
 from pySDC.implementations.datatype_classes.mesh import mesh
+from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
 
 
 class GenericNDimFinDiff(ptype):
@@ -31,6 +35,10 @@ class GenericNDimFinDiff(ptype):
         liniter=10000,
         solver_type='direct',
         bc='periodic',
+        matrix_free=False,
+        preconditioner=None,
+        mg_cycle='V',
+        mg_smoothing_steps=2,
     ):
         # make sure parameters have the correct types
         if not type(nvars) in [int, tuple]:
@@ -82,27 +90,94 @@ class GenericNDimFinDiff(ptype):
         else:
             raise ProblemError(f'Boundary conditions {bc} not implemented.')
 
-        self.A = problem_helper.get_finite_difference_matrix(
-            derivative=derivative,
-            order=order,
-            stencil_type=stencil_type,
-            dx=dx,
-            size=nvars[0],
-            dim=ndim,
-            bc=bc,
-        )
-        self.A *= coeff
+        if matrix_free:
+            # apply the stencil directly instead of assembling the matrix
+            if solver_type == 'direct':
+                raise ProblemError('The direct solver needs the assembled matrix, choose a different solver_type')
+            self.A = problem_helper.FiniteDifferenceOperator(
+                derivative=derivative,
+                order=order,
+                stencil_type=stencil_type,
+                dx=dx,
+                size=nvars[0],
+                dim=ndim,
+                bc=bc,
+                scale=coeff,
+            )
+            # the identity is not needed without assembled matrices and would take a lot of memory for large grids
+            self.Id = None
+        else:
+            self.A = problem_helper.get_finite_difference_matrix(
+                derivative=derivative,
+                order=order,
+                stencil_type=stencil_type,
+                dx=dx,
+                size=nvars[0],
+                dim=ndim,
+                bc=bc,
+            )
+            self.A *= coeff
+            self.Id = sp.eye(np.prod(nvars), format='csc')
 
         self.xvalues = xvalues
-        self.Id = sp.eye(np.prod(nvars), format='csc')
 
         # store attribute and register them as parameters
-        self._makeAttributeAndRegister('nvars', 'stencil_type', 'order', 'bc', localVars=locals(), readOnly=True)
+        self._makeAttributeAndRegister(
+            'nvars', 'stencil_type', 'order', 'bc', 'matrix_free', localVars=locals(), readOnly=True
+        )
         self._makeAttributeAndRegister('freq', 'lintol', 'liniter', 'solver_type', localVars=locals())
+        self._makeAttributeAndRegister(
+            'preconditioner', 'mg_cycle', 'mg_smoothing_steps', localVars=locals(), readOnly=True
+        )
 
-        if self.solver_type != 'direct':
+        if self.solver_type not in ['direct', 'fft']:
             self.work_counters[self.solver_type] = WorkCounter()
 
+        # eigenvalues of A for the fast solver, which uses the FFT or DST to diagonalize A
+        self.symbol = None
+        if self.solver_type == 'fft':
+            try:
+                self.symbol = coeff * problem_helper.get_finite_difference_symbol(
+                    derivative=derivative,
+                    order=order,
+                    stencil_type=stencil_type,
+                    dx=dx,
+                    size=nvars[0],
+                    dim=ndim,
+                    bc=bc,
+                )
+            except NotImplementedError as error:
+                raise ProblemError(f'Cannot use solver type "fft": {error}') from error
+
+        # geometric multigrid as solver or as preconditioner for the Krylov solvers
+        if preconditioner not in [None, 'multigrid']:
+            raise ProblemError(f'Preconditioner "{preconditioner}" not implemented, choose None or "multigrid"')
+        if preconditioner is not None and solver_type not in ['GMRES', 'CG']:
+            raise ProblemError(f'Preconditioners are only available for GMRES and CG, not for "{solver_type}"')
+        self.multigrid = None
+        if 'multigrid' in [solver_type, preconditioner]:
+            problems = [self]
+            n = nvars[0]
+            while True:
+                n = n // 2 if bc == 'periodic' else (n - 1) // 2
+                if n < 3 or (n % 2 != 0 if bc == 'periodic' else (n + 1) % 2 != 0):
+                    break
+                # the coarse levels use assembled matrices, which are small compared to the fine level
+                problems.append(
+                    GenericNDimFinDiff(
+                        (n,) * ndim, coeff, derivative, freq, stencil_type, order, lintol, liniter, 'direct', bc
+                    )
+                )
+            if len(problems) < 2:
+                raise ProblemError(f'Cannot coarsen {nvars} for multigrid')
+            self.multigrid = GeometricMultigrid(
+                problems,
+                mesh_to_mesh,
+                {'periodic': bc == 'periodic'},
+                cycle=mg_cycle,
+                smoothing_steps=mg_smoothing_steps,
+            )
+
     @property
     def ndim(self):
         """Number of dimensions of the spatial problem"""
@@ -124,7 +199,29 @@ class GenericNDimFinDiff(ptype):
         if self.ndim == 3:
             return x[None, :, None], x[:, None, None], x[None, None, :]
 
-    def eval_f(self, u, t):
+    def apply_A(self, u, out):
+        """
+        Apply the discretization matrix to data with the shape of the grid, using the stencil in matrix-free mode
+
+        Parameters
+        ----------
+        u : dtype_u
+            Values to apply the matrix to.
+        out : numpy.ndarray
+            Array to write the result to, must not be the same as u.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            The result.
+        """
+        if self.matrix_free:
+            self.A.apply(u, out=out)
+        else:
+            out[:] = self.A.dot(u.flatten()).reshape(self.nvars)
+        return out
+
+    def eval_f(self, u, t, out=None):
         """
         Routine to evaluate the RHS
 
@@ -134,19 +231,25 @@ class GenericNDimFinDiff(ptype):
             Current values.
         t : float
             Current time.
+        out : dtype_f, optional
+            Data object to write the RHS values to instead of creating a new one.
 
         Returns
         -------
         f : dtype_f
             The RHS values.
         """
-        f = self.f_init
-        f[:] = self.A.dot(u.flatten()).reshape(self.nvars)
+        f = self.f_init if out is None else out
+        self.apply_A(u, f)
         return f
 
-    def solve_system(self, rhs, factor, u0, t):
+    def solve_system(self, rhs, factor, u0, t, out=None):
         """
-        Simple linear solver for (I-factor*A)u = rhs.
+        Simple linear solver for (I-factor*A)u = rhs. The direct solver reuses LU factorizations for known factors.
+        The fft solver diagonalizes A with the FFT for periodic BCs and with the DST for Dirichlet-zero BCs, such that
+        the solution only requires O(N log N) operations. In matrix-free mode, the Krylov solvers apply the stencil.
+        The multigrid solver performs V- or W-cycles with damped Jacobi smoothing, which can also precondition GMRES
+        and CG.
 
         Parameters
         ----------
@@ -158,6 +261,8 @@ class GenericNDimFinDiff(ptype):
             Initial guess for the iterative solver.
         t : float
             Current time (e.g. for time-dependent BCs).
+        out : dtype_u, optional
+            Data object to write the solution to instead of creating a new one, can be the same as u0.
 
         Returns
         -------
@@ -171,30 +276,37 @@ class GenericNDimFinDiff(ptype):
             self.nvars,
             self.lintol,
             self.liniter,
-            self.u_init,
+            self.u_init if out is None else out,
         )
 
         if solver_type == 'direct':
-            sol[:] = spsolve(Id - factor * A, rhs.flatten()).reshape(nvars)
-        elif solver_type == 'GMRES':
-            sol[:] = gmres(
-                Id - factor * A,
+            LU = self.factorizations.get(factor, lambda: splu((Id - factor * A).tocsc()))
+            sol[:] = LU.solve(rhs.flatten()).reshape(nvars)
+        elif solver_type == 'fft':
+            inv_symbol = self.factorizations.get(('fft', factor), lambda: 1.0 / (1.0 - factor * self.symbol))
+            if self.bc == 'periodic':
+                sol[:] = irfftn(rfftn(np.asarray(rhs)) * inv_symbol, s=sol.shape)
+            else:
+                sol[:] = idstn(dstn(np.asarray(rhs), type=1) * inv_symbol, type=1)
+        elif solver_type in ['GMRES', 'CG']:
+            if self.matrix_free:
+                M = LinearOperator(A.shape, matvec=lambda x: x - factor * A.matvec(x), dtype=A.dtype)
+            else:
+                M = Id - factor * A
+            krylov = gmres if solver_type == 'GMRES' else cg
+            sol[:] = krylov(
+                M,
                 rhs.flatten(),
                 x0=u0.flatten(),
                 tol=lintol,
                 maxiter=liniter,
                 atol=0,
+                M=None if self.preconditioner is None else self.multigrid.get_preconditioner(factor),
                 callback=self.work_counters[solver_type],
             )[0].reshape(nvars)
-        elif solver_type == 'CG':
-            sol[:] = cg(
-                Id - factor * A,
-                rhs.flatten(),
-                x0=u0.flatten(),
-                tol=lintol,
-                maxiter=liniter,
-                atol=0,
-                callback=self.work_counters[solver_type],
+        elif solver_type == 'multigrid':
+            sol[:] = self.multigrid.solve(
+                rhs, factor, u0, tol=lintol, maxiter=liniter, callback=self.work_counters[solver_type]
             )[0].reshape(nvars)
         else:
             raise ValueError(f'solver type "{solver_type}" not known in generic advection-diffusion implementation!')
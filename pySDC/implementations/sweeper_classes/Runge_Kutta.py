@@ -282,7 +282,7 @@ class RungeKutta(sweeper):
         """
         In this Runge-Kutta implementation, the solution to the step is always stored in the last node
         """
-        self.level.uend = self.level.u[-1]
+        self.level.uend = self.level.prob.dtype_u(self.level.u[-1])
 
 
 class RK1(RungeKutta):
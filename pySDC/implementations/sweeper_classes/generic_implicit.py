@@ -1,3 +1,5 @@
+import numpy as np
+
 from pySDC.core.Sweeper import sweeper
 
 
@@ -38,6 +40,12 @@ class generic_implicit(sweeper):
         L = self.level
         P = L.prob
 
+        # use batched integration if possible, copy the result since it lives in a buffer reused by the next call
+        if self.params.batched_integration:
+            integral = self.integrate_stacked()
+            if integral is not None:
+                return self.as_dtype_u_list(integral.copy())
+
         me = []
 
         # integrate RHS over all collocation nodes
@@ -49,6 +57,28 @@ class generic_implicit(sweeper):
 
         return me
 
+    def integrate_stacked(self, Q=None):
+        """
+        Integrates the right-hand side at all nodes at once via a single matrix-matrix product with the stacked values
+
+        Args:
+            Q (numpy.ndarray): quadrature rule, defaults to the collocation matrix
+
+        Returns:
+            numpy.ndarray: integrals of shape (M, *shape) or None if the datatypes are not based on numpy arrays
+        """
+        L = self.level
+
+        if not issubclass(L.prob.dtype_u, np.ndarray):
+            return None
+
+        f = self.get_stacked_nodes(L.f, 'f')
+        if f is None:
+            return None
+
+        Q = self.coll.Qmat if Q is None else Q
+        return self.batched_matmul([L.dt * Q[1:, 1:]], [f], 'integral')
+
     def update_nodes(self):
         """
         Update the u- and f-values at the collocation nodes -> corresponds to a single sweep over all nodes
@@ -70,6 +100,18 @@ class generic_implicit(sweeper):
         # gather all terms which are known already (e.g. from the previous iteration)
         # this corresponds to u0 + QF(u^k) - QdF(u^k) + tau
 
+        # sweep with persistent buffers if possible
+        if self.params.inplace_sweeps:
+            known = self.integrate_stacked(Q=self.coll.Qmat - self.QI)
+            if known is not None:
+                known += np.asarray(L.u[0])
+
+                def implicit_part(rhs, m, j, tmp):
+                    np.multiply(np.asarray(L.f[j]), L.dt * self.QI[m, j], out=tmp)
+                    rhs += tmp
+
+                return self.update_nodes_inplace(known, implicit_part, L.dt * np.diag(self.QI)[1:])
+
         # get QF(u^k)
         integral = self.integrate()
         for m in range(M):
@@ -0,0 +1,241 @@
+import atexit
+import pickle
+import weakref
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+
+from pySDC.core.Errors import ParameterError
+from pySDC.core.Problem import WorkCounter
+from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+
+# pools are shared between all sweepers using the same configuration and are kept out of the sweepers, which get copied
+_pools = {}
+
+# copy of the problem in a worker process, which is sent once when the worker starts rather than with every task
+_worker_prob = None
+
+
+def get_pool(executor, num_workers, prob):
+    """
+    Get a pool from `concurrent.futures`, which is created on first use and then shared. Thread pools are shared between
+    all problems, whereas process pools are set up for one problem, which is copied to the workers when they start.
+    When parameters of the problem that are not read-only have changed since then, the process pool is replaced by a
+    new one with a fresh copy of the problem. Process pools are shut down once their problem is garbage collected.
+
+    Args:
+        executor (str): 'thread' or 'process'
+        num_workers (int): Number of workers, None lets `concurrent.futures` decide
+        prob (pySDC.Problem.ptype): The problem that is solved in the pool
+
+    Returns:
+        concurrent.futures.Executor: The pool
+    """
+    if executor == 'thread':
+        key = (executor, num_workers)
+        if key not in _pools:
+            _pools[key] = (ThreadPoolExecutor(max_workers=num_workers), None)
+    else:
+        key = (executor, num_workers, id(prob))
+        version = pickle.dumps({name: getattr(prob, name) for name in sorted(prob._parNames)})
+        if key in _pools and _pools[key][1] != version:
+            shutdown_pool(key)
+        if key not in _pools:
+            # the pool only holds a pickled copy of the problem, such that the problem can be garbage collected
+            pool = ProcessPoolExecutor(max_workers=num_workers, initializer=init_worker, initargs=(pickle.dumps(prob),))
+            _pools[key] = (pool, version)
+            weakref.finalize(prob, shutdown_pool, key, False)
+    return _pools[key][0]
+
+
+def shutdown_pool(key, wait=True):
+    """
+    Shut down a single pool if it exists
+
+    Args:
+        key (tuple): Key of the pool
+        wait (bool): Wait for pending tasks to finish
+
+    Returns:
+        None
+    """
+    if key in _pools:
+        _pools.pop(key)[0].shutdown(wait=wait)
+
+
+def shutdown_pools(wait=True):
+    """
+    Shut down all pools, which are created anew when the sweeper is used again. This is registered to run when the
+    interpreter exits.
+
+    Args:
+        wait (bool): Wait for pending tasks to finish
+
+    Returns:
+        None
+    """
+    for key in list(_pools.keys()):
+        shutdown_pool(key, wait=wait)
+
+
+atexit.register(shutdown_pools)
+
+
+def init_worker(prob):
+    """
+    Store the problem in a worker process of a process pool
+
+    Args:
+        prob (bytes): The pickled problem
+
+    Returns:
+        None
+    """
+    global _worker_prob
+    _worker_prob = pickle.loads(prob)
+
+
+def solve_and_eval(prob, rhs, factor, u0, t):
+    """
+    Solve the implicit system at a single node and evaluate the right hand side with the solution. This is a module
+    level function so that it can be sent to process pools.
+
+    Args:
+        prob (pySDC.Problem.ptype): The problem
+        rhs (dtype_u): Right hand side for the implicit solve
+        factor (float): Prefactor stemming from the diagonal of the preconditioner
+        u0 (dtype_u): Initial guess
+        t (float): Time of the node
+
+    Returns:
+        dtype_u: Solution at the node
+        dtype_f: Right hand side evaluated at the solution
+    """
+    u = prob.solve_system(rhs, factor, u0, t)
+    return u, prob.eval_f(u, t)
+
+
+def solve_and_eval_in_worker(rhs, factor, u0, t):
+    """
+    Solve the implicit system at a single node with the problem of the worker process and evaluate the right hand side.
+    Since the problem lives in the worker, its factorizations are reused across tasks, but its work counters are not
+    seen by the main process, so their increments are returned.
+
+    Args:
+        rhs (dtype_u): Right hand side for the implicit solve
+        factor (float): Prefactor stemming from the diagonal of the preconditioner
+        u0 (dtype_u): Initial guess
+        t (float): Time of the node
+
+    Returns:
+        dtype_u: Solution at the node
+        dtype_f: Right hand side evaluated at the solution
+        dict: Increments of the work counters of the problem
+    """
+    niter = {key: counter.niter for key, counter in _worker_prob.work_counters.items()}
+    u, f = solve_and_eval(_worker_prob, rhs, factor, u0, t)
+    increments = {key: counter.niter - niter.get(key, 0) for key, counter in _worker_prob.work_counters.items()}
+    return u, f, increments
+
+
+class generic_implicit_parallel(generic_implicit):
+    """
+    Generic implicit sweeper for diagonal preconditioners that solves at all collocation nodes concurrently in a pool
+    from `concurrent.futures`, which does not require MPI.
+
+    Additional parameters:
+        executor (str): 'thread' (default) or 'process'. Threads require a thread-safe problem class and give a speedup
+                        if the solvers release the GIL, processes require picklable problems and data. Each problem,
+                        i.e. each level of each step, gets its own pool of worker processes with a copy of the
+                        problem, which lives as long as the problem or until `shutdown_pools` is called. The copies
+                        are renewed when parameters of the problem change, but other changes to the state of the
+                        problem after the first sweep are not seen by the workers.
+        num_workers (int): Number of workers in the pool, defaults to the number of collocation nodes
+
+    Attributes:
+        QI: diagonal matrix
+    """
+
+    executors = {'thread': ThreadPoolExecutor, 'process': ProcessPoolExecutor}
+
+    def __init__(self, params):
+        """
+        Initialization routine for the custom sweeper
+
+        Args:
+            params: parameters for the sweeper
+        """
+
+        if 'QI' not in params:
+            params['QI'] = 'IEpar'
+        if 'executor' not in params:
+            params['executor'] = 'thread'
+        if 'num_workers' not in params:
+            params['num_workers'] = params['num_nodes']
+
+        # call parent's initialization routine
+        super(generic_implicit_parallel, self).__init__(params)
+
+        if self.params.executor not in self.executors.keys():
+            raise ParameterError(
+                f'Unknown executor \"{self.params.executor}\", choose from {list(self.executors.keys())}'
+            )
+
+        # the nodes can only be solved for concurrently if the preconditioner is diagonal
+        if not (self.parallelizable or np.allclose(self.QI - np.diag(np.diag(self.QI)), 0.0)):
+            raise ParameterError(f'Preconditioner \"{self.params.QI}\" is not diagonal and cannot be parallelized')
+
+    def update_nodes(self):
+        """
+        Update the u- and f-values at the collocation nodes -> corresponds to a single sweep over all nodes, which are
+        independent of each other and are processed concurrently
+
+        Returns:
+            None
+        """
+
+        # get current level and problem description
+        L = self.level
+        P = L.prob
+
+        # only if the level has been touched before
+        assert L.status.unlocked
+
+        # get number of collocation nodes for easier access
+        M = self.coll.num_nodes
+
+        # gather all terms which are known already (e.g. from the previous iteration)
+        # this corresponds to u0 + QF(u^k) - QdF(u^k) + tau, which is the full rhs since QI is diagonal
+
+        # get QF(u^k)
+        integral = self.integrate()
+        rhs = []
+        for m in range(M):
+            # get -QdF(u^k)_m and add the initial value
+            rhs.append(integral[m] - L.dt * self.QI[m + 1, m + 1] * L.f[m + 1] + L.u[0])
+            # add tau if associated
+            if L.tau[m] is not None:
+                rhs[m] += L.tau[m]
+
+        # do the sweep by submitting the implicit solves and function evaluations at all nodes to the pool
+        pool = get_pool(self.params.executor, self.params.num_workers, P)
+        args = [
+            (rhs[m], L.dt * self.QI[m + 1, m + 1], L.u[m + 1], L.time + L.dt * self.coll.nodes[m]) for m in range(M)
+        ]
+        if self.params.executor == 'thread':
+            futures = [pool.submit(solve_and_eval, P, *args[m]) for m in range(M)]
+            for m in range(M):
+                L.u[m + 1], L.f[m + 1] = futures[m].result()
+        else:
+            futures = [pool.submit(solve_and_eval_in_worker, *args[m]) for m in range(M)]
+            for m in range(M):
+                L.u[m + 1], L.f[m + 1], increments = futures[m].result()
+                for key, niter in increments.items():
+                    if key not in P.work_counters:
+                        P.work_counters[key] = WorkCounter()
+                    P.work_counters[key].niter += niter
+
+        # indicate presence of new values at this level
+        L.status.updated = True
+
+        return None
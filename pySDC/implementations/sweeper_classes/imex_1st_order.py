@@ -45,6 +45,12 @@ class imex_1st_order(sweeper):
         # get current level and problem description
         L = self.level
 
+        # use batched integration if possible, copy the result since it lives in a buffer reused by the next call
+        if self.params.batched_integration:
+            integral = self.integrate_stacked()
+            if integral is not None:
+                return self.as_dtype_u_list(integral.copy())
+
         me = []
 
         # integrate RHS over all collocation nodes
@@ -56,6 +62,40 @@ class imex_1st_order(sweeper):
 
         return me
 
+    def integrate_stacked(self, Q=None, QI=None, QE=None):
+        """
+        Integrates the right-hand side at all nodes at once via matrix-matrix products with the stacked values. If the
+        preconditioners are given, this computes (Q - QI) F_impl + (Q - QE) F_expl instead.
+
+        Args:
+            Q (numpy.ndarray): full quadrature rule, defaults to the collocation matrix
+            QI (numpy.ndarray): implicit preconditioner
+            QE (numpy.ndarray): explicit preconditioner
+
+        Returns:
+            numpy.ndarray: integrals of shape (M, *shape) or None if the datatypes are not based on numpy arrays
+        """
+        L = self.level
+
+        if not issubclass(L.prob.dtype_u, np.ndarray):
+            return None
+
+        Q = self.coll.Qmat if Q is None else Q
+
+        if QI is None and QE is None:
+            f = self.get_stacked_nodes(L.f, 'f', components=('impl', 'expl'))
+            if f is None:
+                return None
+            return self.batched_matmul([L.dt * Q[1:, 1:]], [f], 'integral')
+
+        QI = np.zeros_like(Q) if QI is None else QI
+        QE = np.zeros_like(Q) if QE is None else QE
+        f_impl = self.get_stacked_nodes(L.f, 'f', components=('impl',))
+        f_expl = self.get_stacked_nodes(L.f, 'f', components=('expl',))
+        if f_impl is None or f_expl is None:
+            return None
+        return self.batched_matmul([L.dt * (Q - QI)[1:, 1:], L.dt * (Q - QE)[1:, 1:]], [f_impl, f_expl], 'integral')
+
     def update_nodes(self):
         """
         Update the u- and f-values at the collocation nodes -> corresponds to a single sweep over all nodes
@@ -77,6 +117,20 @@ class imex_1st_order(sweeper):
         # gather all terms which are known already (e.g. from the previous iteration)
         # this corresponds to u0 + QF(u^k) - QIFI(u^k) - QEFE(u^k) + tau
 
+        # sweep with persistent buffers if possible
+        if self.params.inplace_sweeps:
+            known = self.integrate_stacked(Q=self.coll.Qmat, QI=self.QI, QE=self.QE)
+            if known is not None:
+                known += np.asarray(L.u[0])
+
+                def implicit_part(rhs, m, j, tmp):
+                    np.multiply(np.asarray(L.f[j].impl), L.dt * self.QI[m, j], out=tmp)
+                    rhs += tmp
+                    np.multiply(np.asarray(L.f[j].expl), L.dt * self.QE[m, j], out=tmp)
+                    rhs += tmp
+
+                return self.update_nodes_inplace(known, implicit_part, L.dt * np.diag(self.QI)[1:])
+
         # get QF(u^k)
         integral = self.integrate()
         for m in range(M):
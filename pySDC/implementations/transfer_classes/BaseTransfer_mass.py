@@ -44,6 +44,8 @@ class base_transfer_mass(base_transfer):
 
         # restrict collocation values
         G.u[0] = self.space_transfer.restrict(F.u[0])
+        G.status.u0_origin = None
+        G.status.uend_stale = True
         for n in range(1, SG.coll.num_nodes + 1):
             G.u[n] = self.Rcoll[n - 1, 0] * tmp_u[0]
             for m in range(1, SF.coll.num_nodes):
@@ -103,6 +105,7 @@ class base_transfer_mass(base_transfer):
         # This is somewhat ugly, but we have to apply the mass matrix on u0 only on the finest level
         if F.level_index == 0:
             G.u[0] = self.space_transfer.restrict(PF.apply_mass_matrix(F.u[0]))
+            G.status.u0_origin = None
 
         # works as a predictor
         G.status.unlocked = True
@@ -129,6 +132,7 @@ class base_transfer_mass(base_transfer):
         # only of the level is unlocked at least by prediction or restriction
         if not G.status.unlocked:
             raise UnlockError('coarse level is still locked, cannot use data from there')
+        F.status.uend_stale = True
 
         # build coarse correction
 
@@ -168,6 +172,7 @@ class base_transfer_mass(base_transfer):
         # only of the level is unlocked at least by prediction or restriction
         if not G.status.unlocked:
             raise UnlockError('coarse level is still locked, cannot use data from there')
+        F.status.uend_stale = True
 
         # build coarse correction
 
@@ -256,3 +256,51 @@ class mesh_to_mesh(space_transfer):
         else:
             raise TransferError('Wrong data type for prolongation, got %s' % type(G))
         return F
+
+    @staticmethod
+    def apply_stacked(A, values, nvars):
+        """
+        Apply a spatial operator to the values at all nodes at once via a single product of the sparse matrix with a
+        dense matrix, which holds the values at the nodes (and all components) in its columns
+
+        Args:
+            A (scipy.sparse matrix): spatial operator
+            values (numpy.ndarray): values of shape (M, *shape)
+            nvars: number of degrees of freedom of the result
+
+        Returns:
+            numpy.ndarray: values of shape (M, *nvars) or (M, *nvars, ncomp) if there are multiple components
+        """
+        M = values.shape[0]
+        N = A.shape[1]
+        ncomp = values[0].size // N
+
+        tmp = np.asarray(values).reshape(M, N, ncomp).transpose(1, 0, 2).reshape(N, M * ncomp)
+        result = A.dot(tmp).reshape(A.shape[0], M, ncomp).transpose(1, 0, 2)
+
+        shape = tuple(np.atleast_1d(nvars)) + ((ncomp,) if ncomp > 1 else ())
+        return result.reshape((M,) + shape)
+
+    def restrict_stacked(self, F):
+        """
+        Restriction of the values at many nodes at once
+
+        Args:
+            F (numpy.ndarray): fine values of shape (M, *shape)
+
+        Returns:
+            numpy.ndarray: coarse values of shape (M, *shape)
+        """
+        return self.apply_stacked(self.Rspace, F, self.coarse_prob.nvars)
+
+    def prolong_stacked(self, G):
+        """
+        Prolongation of the values at many nodes at once
+
+        Args:
+            G (numpy.ndarray): coarse values of shape (M, *shape)
+
+        Returns:
+            numpy.ndarray: fine values of shape (M, *shape)
+        """
+        return self.apply_stacked(self.Pspace, G, self.fine_prob.nvars)
@@ -1,18 +1,22 @@
 import numpy as np
 
-from pySDC.core.Problem import ptype
+from pySDC.core.Problem import ptype, NewtonSolver
 from pySDC.implementations.datatype_classes.mesh import mesh
 
 
 class ptype_dae(ptype):
     """
     Interface class for DAE problems. Ensures that all parameters are passed that are needed by DAE sweepers
+
+    The implicit systems in the sweepers are solved by the `NewtonSolver` of the problem with the update strategy
+    `newton_update`, using the Jacobians of the problem. Problems can provide analytic Jacobians by overriding
+    `eval_jacobian`, otherwise they are approximated by finite differences.
     """
 
     dtype_u = mesh
     dtype_f = mesh
 
-    def __init__(self, nvars, newton_tol):
+    def __init__(self, nvars, newton_tol, newton_maxiter=100, newton_update='full'):
         """
         Initialization routine
 
@@ -23,3 +27,35 @@ class ptype_dae(ptype):
         """
         super().__init__((nvars, None, np.dtype('float64')))
         self._makeAttributeAndRegister('nvars', 'newton_tol', localVars=locals(), readOnly=True)
+        self._makeAttributeAndRegister('newton_maxiter', 'newton_update', localVars=locals(), readOnly=True)
+        self.newton = NewtonSolver(update=newton_update, work_counters=self.work_counters)
+
+    def eval_jacobian(self, u, du, t):
+        """
+        Routine to evaluate the derivatives of the implicit representation F(u', u, t) of the problem with respect to
+        u and u'. This default implementation approximates them by forward differences, which requires as many
+        evaluations of F as there are components in u and u' combined.
+
+        Args:
+            u (dtype_u): the current values
+            du (dtype_u): the current derivatives
+            t (float): current time
+
+        Returns:
+            numpy.ndarray: dF/du
+            numpy.ndarray: dF/du'
+        """
+        F = self.eval_f(u, du, t)
+        jacobians = []
+        for x, get_F in [
+            (u, lambda x_eps: self.eval_f(x_eps, du, t)),
+            (du, lambda x_eps: self.eval_f(u, x_eps, t)),
+        ]:
+            jac = np.zeros((F.size, x.size))
+            for i in range(x.size):
+                eps = np.sqrt(np.finfo(float).eps) * max(1.0, abs(x.flat[i]))
+                x_eps = self.dtype_u(x)
+                x_eps.flat[i] += eps
+                jac[:, i] = (get_F(x_eps) - F).flatten() / eps
+            jacobians.append(jac)
+        return jacobians[0], jacobians[1]
@@ -11,11 +11,11 @@ class pendulum_2d(ptype_dae):
     The pendulum is used in most introductory literature on DAEs, for example on page 8 of "The numerical solution of differential-algebraic systems by Runge-Kutta methods" by Hairer et al.
     """
 
-    def __init__(self, nvars, newton_tol):
+    def __init__(self, nvars, newton_tol, newton_maxiter=100, newton_update='full'):
         """
         Initialization routine for the problem class
         """
-        super().__init__(nvars, newton_tol)
+        super().__init__(nvars, newton_tol, newton_maxiter, newton_update)
         # load reference solution
         # data file must be generated and stored under misc/data and self.t_end = t[-1]
         # data = np.load(r'pySDC/projects/DAE/misc/data/pendulum.npy')
@@ -40,6 +40,28 @@ class pendulum_2d(ptype_dae):
         f[:] = (du[0] - u[2], du[1] - u[3], du[2] + u[4] * u[0], du[3] + u[4] * u[1] + g, u[0] ** 2 + u[1] ** 2 - 1)
         return f
 
+    def eval_jacobian(self, u, du, t):
+        """
+        Routine to evaluate the derivatives of F(u', u, t) with respect to u and u'
+        Args:
+            u (dtype_u): the current values
+            du (dtype_u): the current derivatives
+            t (float): current time (not used here)
+        Returns:
+            dF/du and dF/du', 5x5 components each
+        """
+        jac_u = np.array(
+            [
+                [0, 0, -1, 0, 0],
+                [0, 0, 0, -1, 0],
+                [u[4], 0, 0, 0, u[0]],
+                [0, u[4], 0, 0, u[1]],
+                [2 * u[0], 2 * u[1], 0, 0, 0],
+            ]
+        )
+        jac_du = np.diag([1.0, 1.0, 1.0, 1.0, 0.0])
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Approximation of the exact solution generated by spline interpolation of an extremely accurate numerical reference solution.
@@ -85,6 +107,27 @@ class simple_dae_1(ptype_dae):
         )
         return f
 
+    def eval_jacobian(self, u, du, t):
+        """
+        Routine to evaluate the derivatives of F(u', u, t) with respect to u and u'
+        Args:
+            u (dtype_u): the current values
+            du (dtype_u): the current derivatives
+            t (float): current time
+        Returns:
+            dF/du and dF/du', 3x3 components each
+        """
+        a = 10.0
+        jac_u = np.array(
+            [
+                [a - 1 / (2 - t), 0, (2 - t) * a],
+                [(1 - a) / (t - 2), -1, a - 1],
+                [t + 2, t**2 - 4, 0],
+            ]
+        )
+        jac_du = np.diag([-1.0, -1.0, 0.0])
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Routine for the exact solution
@@ -105,11 +148,11 @@ class problematic_f(ptype_dae):
     See, for example, page 264 of "computer methods for ODEs and DAEs" by Ascher and Petzold
     """
 
-    def __init__(self, nvars, newton_tol, eta=1):
+    def __init__(self, nvars, newton_tol, eta=1, newton_maxiter=100, newton_update='full'):
         """
         Initialization routine for the problem class
         """
-        super().__init__(nvars, newton_tol)
+        super().__init__(nvars, newton_tol, newton_maxiter, newton_update)
         self._makeAttributeAndRegister('eta', localVars=locals())
 
     def eval_f(self, u, du, t):
@@ -128,6 +171,20 @@ class problematic_f(ptype_dae):
         )
         return f
 
+    def eval_jacobian(self, u, du, t):
+        """
+        Routine to evaluate the derivatives of F(u', u, t) with respect to u and u'
+        Args:
+            u (dtype_u): the current values
+            du (dtype_u): the current derivatives
+            t (float): current time
+        Returns:
+            dF/du and dF/du', 2x2 components each
+        """
+        jac_u = np.array([[1, self.eta * t], [0, 1 + self.eta]])
+        jac_du = np.array([[0, 0], [1, self.eta * t]])
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Routine to evaluate the implicit representation of the problem i.e. F(u', u, t)
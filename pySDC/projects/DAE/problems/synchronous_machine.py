@@ -12,8 +12,8 @@ class synchronous_machine_infinite_bus(ptype_dae):
     attached to infinite bus
     """
 
-    def __init__(self, nvars, newton_tol):
-        super(synchronous_machine_infinite_bus, self).__init__(nvars, newton_tol)
+    def __init__(self, nvars, newton_tol, newton_maxiter=100, newton_update='full'):
+        super(synchronous_machine_infinite_bus, self).__init__(nvars, newton_tol, newton_maxiter, newton_update)
         # load reference solution
         # data file must be generated and stored under misc/data and self.t_end = t[-1]
         # data = np.load(r'pySDC/projects/DAE/misc/data/synch_gen.npy')
@@ -113,6 +113,63 @@ class synchronous_machine_infinite_bus(ptype_dae):
         )
         return f
 
+    def eval_jacobian(self, u, du, t):
+        """
+        Routine to evaluate the derivatives of F(u', u, t) with respect to u and u'
+        Args:
+            u (dtype_u): the current values
+            du (dtype_u): the current derivatives
+            t (float): current time
+        Returns:
+            dF/du and dF/du', 14x14 components each
+        """
+        psi_d, psi_q = u[0], u[1]
+        i_d, i_q = u[6], u[7]
+        delta_r = u[12]
+        omega_m = u[13]
+
+        # In rotor coordinates, the terminal voltage is v_q - 1j * v_d = exp(-1j * delta_r) * V_comp with
+        # exp(-1j * delta_r) * (I_Re + 1j * I_Im) = i_q - 1j * i_d, such that the derivatives are simple to compute
+        dW = {
+            6: -1j * self.Z_line,
+            7: self.Z_line,
+            12: -1j * self.E_B * np.exp(-1j * delta_r),
+        }
+
+        jac_u = np.zeros((14, 14))
+        for j, dW_j in dW.items():
+            jac_u[0, j] = -self.omega_b * np.imag(dW_j)
+            jac_u[1, j] = self.omega_b * np.real(dW_j)
+
+        # differential generator
+        jac_u[0, 1] = self.omega_b * omega_m
+        jac_u[0, 6] -= self.omega_b * self.R_s
+        jac_u[0, 13] = self.omega_b * psi_q
+        jac_u[1, 0] = -self.omega_b * omega_m
+        jac_u[1, 7] -= self.omega_b * self.R_s
+        jac_u[1, 13] = -self.omega_b * psi_d
+        jac_u[2, 8] = -self.omega_b * self.R_F
+        jac_u[3, 9] = -self.omega_b * self.R_D
+        jac_u[4, 10] = -self.omega_b * self.R_Q1
+        jac_u[5, 11] = -self.omega_b * self.R_Q2
+        jac_u[6, 13] = self.omega_b
+        jac_u[7, [0, 1, 6, 7, 13]] = np.array([i_q, -i_d, -psi_q, psi_d, -self.K_D * self.omega_b]) / (2 * self.H_)
+
+        # algebraic generator
+        jac_u[8:14, 0:6] = -np.eye(6)
+        jac_u[8, [6, 8, 9]] = self.L_d, self.L_md, self.L_md
+        jac_u[9, [7, 10, 11]] = self.L_q, self.L_mq, self.L_mq
+        jac_u[10, [6, 8, 9]] = self.L_md, self.L_F, self.L_md
+        jac_u[11, [6, 8, 9]] = self.L_md, self.L_md, self.L_D
+        jac_u[12, [7, 10, 11]] = self.L_mq, self.L_Q1, self.L_mq
+        jac_u[13, [7, 10, 11]] = self.L_mq, self.L_mq, self.L_Q2
+
+        jac_du = np.zeros((14, 14))
+        jac_du[range(6), range(6)] = -1
+        jac_du[6, 12] = -1
+        jac_du[7, 13] = -1
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Approximation of the exact solution generated by spline interpolation of an extremely accurate numerical reference solution.
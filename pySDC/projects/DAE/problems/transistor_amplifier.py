@@ -10,14 +10,18 @@ def _transistor(u_in):
     return 1e-6 * (np.exp(u_in / 0.026) - 1)
 
 
+def _transistor_derivative(u_in):
+    return 1e-6 / 0.026 * np.exp(u_in / 0.026)
+
+
 class one_transistor_amplifier(ptype_dae):
     """
     The one transistor amplifier example from pg. 404 Solving ODE II by Hairer and Wanner
     The problem is an index-1 DAE
     """
 
-    def __init__(self, nvars, newton_tol):
-        super().__init__(nvars, newton_tol)
+    def __init__(self, nvars, newton_tol, newton_maxiter=100, newton_update='full'):
+        super().__init__(nvars, newton_tol, newton_maxiter, newton_update)
         # load reference solution
         # data file must be generated and stored under misc/data and self.t_end = t[-1]
         # data = np.load(r'pySDC/projects/DAE/misc/data/one_trans_amp.npy')
@@ -52,6 +56,41 @@ class one_transistor_amplifier(ptype_dae):
         )
         return f
 
+    def eval_jacobian(self, u, du, t):
+        """
+        Routine to evaluate the derivatives of F(u', u, t) with respect to u and u'
+        Args:
+            u (dtype_u): the current values
+            du (dtype_u): the current derivatives
+            t (float): current time
+        Returns:
+            dF/du and dF/du', 5x5 components each
+        """
+        alpha = 0.99
+        r_0 = 1000
+        r_k = 9000
+        c_1, c_2, c_3 = 1e-6, 2e-6, 3e-6
+        d = _transistor_derivative(u[1] - u[2])
+        jac_u = np.array(
+            [
+                [-1 / r_0, 0, 0, 0, 0],
+                [0, -2 / r_k - (1 - alpha) * d, (1 - alpha) * d, 0, 0],
+                [0, d, -d - 1 / r_k, 0, 0],
+                [0, -alpha * d, alpha * d, -1 / r_k, 0],
+                [0, 0, 0, 0, -1 / r_k],
+            ]
+        )
+        jac_du = np.array(
+            [
+                [-c_1, c_1, 0, 0, 0],
+                [c_1, -c_1, 0, 0, 0],
+                [0, 0, -c_2, 0, 0],
+                [0, 0, 0, -c_3, c_3],
+                [0, 0, 0, c_3, -c_3],
+            ]
+        )
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Approximation of the exact solution generated by spline interpolation of an extremely accurate numerical reference solution.
@@ -78,8 +117,8 @@ class two_transistor_amplifier(ptype_dae):
     The problem is an index-1 DAE
     """
 
-    def __init__(self, nvars, newton_tol):
-        super().__init__(nvars, newton_tol)
+    def __init__(self, nvars, newton_tol, newton_maxiter=100, newton_update='full'):
+        super().__init__(nvars, newton_tol, newton_maxiter, newton_update)
         # load reference solution
         # data file must be generated and stored under misc/data and self.t_end = t[-1]
         # data = np.load(r'pySDC/projects/DAE/misc/data/two_trans_amp.npy')
@@ -117,6 +156,41 @@ class two_transistor_amplifier(ptype_dae):
         )
         return f
 
+    def eval_jacobian(self, u, du, t):
+        """
+        Routine to evaluate the derivatives of F(u', u, t) with respect to u and u'
+        Args:
+            u (dtype_u): the current values
+            du (dtype_u): the current derivatives
+            t (float): current time
+        Returns:
+            dF/du and dF/du', 8x8 components each
+        """
+        alpha = 0.99
+        r_0 = 1000.0
+        r_k = 9000.0
+        c_1, c_2, c_3, c_4, c_5 = 1e-6, 2e-6, 3e-6, 4e-6, 5e-6
+        d_1 = _transistor_derivative(u[1] - u[2])
+        d_2 = _transistor_derivative(u[4] - u[5])
+
+        jac_u = np.zeros((8, 8))
+        jac_u[0, 0] = -1 / r_0
+        jac_u[1, 1:3] = -2 / r_k + (alpha - 1) * d_1, -(alpha - 1) * d_1
+        jac_u[2, 1:3] = d_1, -d_1 - 1 / r_k
+        jac_u[3, 1:4] = -alpha * d_1, alpha * d_1, -1 / r_k
+        jac_u[4, 4:6] = -2 / r_k + (alpha - 1) * d_2, -(alpha - 1) * d_2
+        jac_u[5, 4:6] = d_2, -d_2 - 1 / r_k
+        jac_u[6, 4:7] = -alpha * d_2, alpha * d_2, -1 / r_k
+        jac_u[7, 7] = -1 / r_k
+
+        jac_du = np.zeros((8, 8))
+        jac_du[0:2, 0:2] = [[-c_1, c_1], [c_1, -c_1]]
+        jac_du[2, 2] = -c_2
+        jac_du[3:5, 3:5] = [[-c_3, c_3], [c_3, -c_3]]
+        jac_du[5, 5] = -c_4
+        jac_du[6:8, 6:8] = [[-c_5, c_5], [c_5, -c_5]]
+        return jac_u, jac_du
+
     def u_exact(self, t):
         """
         Dummy exact solution that should only be used to get initial conditions for the problem
@@ -1,5 +1,8 @@
 import numpy as np
+import scipy.sparse as sp
 from scipy import optimize
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu
 
 from pySDC.core.Errors import ParameterError
 from pySDC.core.Sweeper import sweeper
@@ -13,6 +16,11 @@ class fully_implicit_DAE(sweeper):
     Primarily implemented to be used with differential algebraic equations
     Based on the concepts outlined in "Arbitrary order Krylov deferred correction methods for differential algebraic equations" by Huang et al.
 
+    The implicit systems at the nodes are solved by the Newton solver of the problem using the Jacobians provided by
+    `eval_jacobian`. Jacobians are evaluated in every Newton iteration by default and can be reused across nodes and
+    iterations by setting the problem parameter `newton_update` to `'chord'`. Set the sweeper parameter
+    `implicit_solver` to `'scipy'` to use `scipy.optimize.root` with finite difference Jacobians instead.
+
     Attributes:
         QI: implicit Euler integration matrix
     """
@@ -27,6 +35,12 @@ class fully_implicit_DAE(sweeper):
 
         if 'QI' not in params:
             params['QI'] = 'IE'
+        if 'implicit_solver' not in params:
+            params['implicit_solver'] = 'newton'
+        if params['implicit_solver'] not in ['newton', 'scipy']:
+            raise ParameterError(
+                f'implicit_solver {params["implicit_solver"]!r} not implemented, choose "newton" or "scipy" instead'
+            )
 
         # call parent's initialization routine
         super(fully_implicit_DAE, self).__init__(params)
@@ -99,33 +113,15 @@ class fully_implicit_DAE(sweeper):
             for j in range(1, m):
                 u_approx += L.dt * self.QI[m, j] * L.f[j]
 
-            # params contains U = u'
-            def impl_fn(params):
-                # make params into a mesh object
-                params_mesh = P.dtype_f(P.init)
-                params_mesh[:] = params
-                # build parameters to pass to implicit function
-                local_u_approx = u_approx
-                # note that derivatives of algebraic variables are taken into account here too
-                # these do not directly affect the output of eval_f but rather indirectly via QI
-                local_u_approx += L.dt * self.QI[m, m] * params_mesh
-                return P.eval_f(local_u_approx, params_mesh, L.time + L.dt * self.coll.nodes[m - 1])
-
-            # get U_k+1
-            # note: not using solve_system here because this solve step is the same for any problem
-            # See link for how different methods use the default tol parameter
-            # https://github.com/scipy/scipy/blob/8a6f1a0621542f059a532953661cd43b8167fce0/scipy/optimize/_root.py#L220
-            # options['xtol'] = P.params.newton_tol
-            # options['eps'] = 1e-16
-            opt = optimize.root(
-                impl_fn,
-                L.f[m],
-                method='hybr',
-                tol=P.newton_tol
-                # callback= lambda x, f: print("solution:", x, " residual: ", f)
-            )
             # update gradient (recall L.f is being used to store the gradient)
-            L.f[m][:] = opt.x
+            if self.params.implicit_solver == 'newton':
+                L.f[m][:] = self.solve_newton(
+                    u_approx, L.dt * self.QI[m, m], L.f[m], L.time + L.dt * self.coll.nodes[m - 1]
+                )
+            else:
+                L.f[m][:] = self.solve_scipy(
+                    u_approx, L.dt * self.QI[m, m], L.f[m], L.time + L.dt * self.coll.nodes[m - 1]
+                )
 
         # Update solution approximation
         integral = self.integrate()
@@ -136,6 +132,86 @@ class fully_implicit_DAE(sweeper):
 
         return None
 
+    def solve_newton(self, u_approx, factor, du0, t):
+        """
+        Solve the implicit system F(u_approx + factor * U, U, t) = 0 for the derivative U at a node with the Newton
+        solver of the problem. The Jacobian factor * dF/du + dF/du' is assembled from the Jacobians of the problem and
+        may be reused for all nodes and iterations with the same factor.
+
+        Args:
+            u_approx (dtype_u): known part of the solution at the node
+            factor (float): the factor in front of the unknown derivative
+            du0 (dtype_f): initial guess for the derivative
+            t (float): time of the node
+
+        Returns:
+            dtype_f: the derivative at the node
+        """
+        P = self.level.prob
+
+        def residual(du):
+            return P.eval_f(u_approx + factor * du, du, t)
+
+        def get_linear_solver(du):
+            jac_u, jac_du = P.eval_jacobian(u_approx + factor * du, du, t)
+            jac = factor * jac_u + jac_du
+            if sp.issparse(jac):
+                return splu(sp.csc_matrix(jac)).solve
+            lu = lu_factor(jac)
+            return lambda rhs: lu_solve(lu, rhs)
+
+        du, n, res = P.newton.solve(
+            residual, get_linear_solver, P.dtype_f(du0), 0.0, P.newton_maxiter, key=factor, xtol=P.newton_tol
+        )
+
+        if np.isnan(res):
+            self.logger.warning(f'Newton got nan after {n} iterations at t={t}')
+        elif n == P.newton_maxiter:
+            self.logger.warning(f'Newton did not converge after {n} iterations at t={t}, residual is {res:.2e}')
+        return du
+
+    def solve_scipy(self, u_approx, factor, du0, t):
+        """
+        Solve the implicit system F(u_approx + factor * U, U, t) = 0 for the derivative U at a node with
+        `scipy.optimize.root`, which uses finite difference Jacobians
+
+        Args:
+            u_approx (dtype_u): known part of the solution at the node
+            factor (float): the factor in front of the unknown derivative
+            du0 (dtype_f): initial guess for the derivative
+            t (float): time of the node
+
+        Returns:
+            numpy.ndarray: the derivative at the node
+        """
+        P = self.level.prob
+
+        # params contains U = u'
+        def impl_fn(params):
+            # make params into a mesh object
+            params_mesh = P.dtype_f(P.init)
+            params_mesh[:] = params
+            # build parameters to pass to implicit function
+            local_u_approx = u_approx
+            # note that derivatives of algebraic variables are taken into account here too
+            # these do not directly affect the output of eval_f but rather indirectly via QI
+            local_u_approx += factor * params_mesh
+            return P.eval_f(local_u_approx, params_mesh, t)
+
+        # note: not using solve_system here because this solve step is the same for any problem
+        # See link for how different methods use the default tol parameter
+        # https://github.com/scipy/scipy/blob/8a6f1a0621542f059a532953661cd43b8167fce0/scipy/optimize/_root.py#L220
+        # options['xtol'] = P.params.newton_tol
+        # options['eps'] = 1e-16
+        opt = optimize.root(
+            impl_fn,
+            du0,
+            method='hybr',
+            tol=P.newton_tol,
+            # callback= lambda x, f: print("solution:", x, " residual: ", f)
+        )
+        return opt.x
+
     def predict(self):
         """
         Predictor to fill values at nodes before first sweep
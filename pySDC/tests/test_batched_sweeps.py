@@ -0,0 +1,109 @@
+import pytest
+
+
+def run_heat(sweeper, nlevels=1, num_procs=1, **kwargs):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced, heatNd_forced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    level_params = {'dt': 0.1, 'restol': 1e-10, 'contiguous_storage': kwargs.pop('contiguous_storage', False)}
+    sweeper_params = {'quad_type': 'RADAU-RIGHT', 'num_nodes': [4, 3][:nlevels], 'QI': 'LU', **kwargs}
+    problem_params = {'nu': 0.1, 'freq': 2, 'nvars': [(31, 31), (15, 15)][:nlevels], 'bc': 'dirichlet-zero'}
+
+    description = {
+        'problem_class': heatNd_forced if sweeper == 'imex' else heatNd_unforced,
+        'problem_params': problem_params,
+        'sweeper_class': imex_1st_order if sweeper == 'imex' else generic_implicit,
+        'sweeper_params': sweeper_params,
+        'level_params': level_params,
+        'step_params': {'maxiter': 20},
+    }
+    if nlevels > 1:
+        description['space_transfer_class'] = mesh_to_mesh
+    controller_params = {'logger_level': 30, 'predict_type': 'pfasst_burnin' if nlevels > 1 else None}
+    controller = controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.3)
+    return uend, stats, controller
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('sweeper', ['imex', 'implicit'])
+def test_integrate_stacked(sweeper):
+    import numpy as np
+
+    _, _, controller = run_heat(sweeper, batched_integration=False)
+    S = controller.MS[0]
+    L = S.levels[0]
+
+    reference = [np.array(me) for me in L.sweep.integrate()]
+
+    L.sweep.params.batched_integration = True
+    assert L.sweep.integrate_stacked() is not None, 'Batched integration not available for mesh datatypes'
+    integral = L.sweep.integrate()
+    assert len(integral) == len(reference)
+    assert all(type(me) is L.prob.dtype_u for me in integral)
+    assert np.allclose(integral, reference, atol=1e-14)
+
+    # the result must not be overwritten by later calls
+    L.sweep.integrate()[0][:] = 0.0
+    assert np.allclose(integral, reference, atol=1e-14)
+
+    # compute the residual in both ways
+    L.sweep.compute_residual()
+    residual_batched = L.status.residual
+    L.sweep.params.batched_integration = False
+    L.sweep.compute_residual()
+    assert np.isclose(residual_batched, L.status.residual, atol=1e-14)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('sweeper', ['imex', 'implicit'])
+@pytest.mark.parametrize('nlevels', [1, 2])
+@pytest.mark.parametrize('contiguous_storage', [False, True])
+def test_batched_integration(sweeper, nlevels, contiguous_storage):
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+
+    results = {}
+    for batched in [False, True]:
+        uend, stats, _ = run_heat(
+            sweeper,
+            nlevels=nlevels,
+            num_procs=2,
+            batched_integration=batched,
+            contiguous_storage=contiguous_storage,
+        )
+        results[batched] = (uend, [me[1] for me in get_sorted(stats, type='niter')])
+
+    assert np.allclose(results[True][0], results[False][0], atol=1e-12)
+    assert results[True][1] == results[False][1], 'Batched integration changed the number of iterations'
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('sweeper', ['imex', 'implicit'])
+@pytest.mark.parametrize('nlevels', [1, 2])
+@pytest.mark.parametrize('contiguous_storage', [False, True])
+def test_inplace_sweeps(sweeper, nlevels, contiguous_storage):
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+
+    results = {}
+    for inplace in [False, True]:
+        uend, stats, controller = run_heat(
+            sweeper,
+            nlevels=nlevels,
+            num_procs=2,
+            inplace_sweeps=inplace,
+            contiguous_storage=contiguous_storage,
+        )
+        results[inplace] = (uend, [me[1] for me in get_sorted(stats, type='niter')])
+
+    L = controller.MS[0].levels[0]
+    assert L.sweep.problem_accepts_out('solve_system') and L.sweep.problem_accepts_out('eval_f')
+
+    assert np.allclose(results[True][0], results[False][0], atol=1e-12)
+    assert results[True][1] == results[False][1], 'In-place sweeps changed the number of iterations'
@@ -25,6 +25,13 @@ def test_benchmark_collocation(benchmark):
     benchmark(wrapper)
 
 
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_nodes", [3, 5, 9])
+@pytest.mark.parametrize("quad_type", quad_types)
+def test_benchmark_collocation_setup(benchmark, num_nodes, quad_type):
+    benchmark(CollBase, num_nodes, 0, 1, node_type='LEGENDRE', quad_type=quad_type)
+
+
 @pytest.mark.parametrize("node_type", node_types)
 @pytest.mark.parametrize("quad_type", quad_types)
 def test_canintegratepolynomials(node_type, quad_type):
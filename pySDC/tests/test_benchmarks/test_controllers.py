@@ -0,0 +1,48 @@
+import pytest
+
+
+def get_controller(variant, nvars, num_nodes):
+    """
+    Get a controller for running SDC, MLSDC or PFASST on the heat equation
+
+    Args:
+        variant (str): SDC, MLSDC or PFASST
+        nvars (int): Number of degrees of freedom on the finest level
+        num_nodes (int): Number of collocation nodes on the finest level
+
+    Returns:
+        pySDC.Controller.controller: The controller
+    """
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_forced
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    if variant == 'SDC':
+        nvars, num_nodes = [(nvars,)], [num_nodes]
+    else:
+        nvars, num_nodes = [(nvars,), ((nvars + 1) // 2 - 1,)], [num_nodes, max(num_nodes - 2, 2)]
+
+    description = {
+        'problem_class': heatNd_forced,
+        'problem_params': {'nu': 0.1, 'freq': 2, 'nvars': nvars, 'bc': 'dirichlet-zero'},
+        'sweeper_class': imex_1st_order,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': num_nodes, 'QI': 'LU'},
+        'level_params': {'dt': 0.125, 'restol': 5e-10},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+    }
+    controller_params = {'logger_level': 30, 'predict_type': 'pfasst_burnin'}
+    num_procs = 4 if variant == 'PFASST' else 1
+    return controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('variant', ['SDC', 'MLSDC', 'PFASST'])
+@pytest.mark.parametrize('nvars', [127, 1023])
+@pytest.mark.parametrize('num_nodes', [3, 5])
+def test_benchmark_run(benchmark, variant, nvars, num_nodes):
+    controller = get_controller(variant, nvars, num_nodes)
+    P = controller.MS[0].levels[0].prob
+    uend, _ = benchmark(controller.run, u0=P.u_exact(0.0), t0=0.0, Tend=1.0)
+    assert abs(uend - P.u_exact(1.0)) < 1e-3
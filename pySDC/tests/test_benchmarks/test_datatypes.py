@@ -0,0 +1,72 @@
+import pytest
+
+OPERATIONS = ['add', 'scale', 'axpy', 'abs', 'copy']
+
+
+def get_operation(operation, a, b):
+    """
+    Get a function that performs an arithmetic operation on two instances of a datatype as it is done in the sweepers
+
+    Args:
+        operation (str): Name of the operation
+        a: First instance of the datatype
+        b: Second instance of the datatype
+
+    Returns:
+        callable: The operation
+    """
+    if operation == 'add':
+        return lambda: a + b
+    elif operation == 'scale':
+        return lambda: 0.1 * a
+    elif operation == 'axpy':
+        return lambda: a + 0.1 * b
+    elif operation == 'abs':
+        return lambda: abs(a)
+    elif operation == 'copy':
+        return lambda: type(a)(a)
+    else:
+        raise NotImplementedError(f'Unknown operation {operation!r}')
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('size', [10**3, 10**6])
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_benchmark_mesh(benchmark, size, operation):
+    import numpy as np
+    from pySDC.implementations.datatype_classes.mesh import mesh
+
+    init = (size, None, np.dtype('float64'))
+    a = mesh(init, val=1.0)
+    b = mesh(init, val=2.0)
+    benchmark(get_operation(operation, a, b))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('size', [10**3, 10**6])
+@pytest.mark.parametrize('operation', ['sum', 'copy'])
+def test_benchmark_imex_mesh(benchmark, size, operation):
+    import numpy as np
+    from pySDC.implementations.datatype_classes.mesh import imex_mesh
+
+    init = (size, None, np.dtype('float64'))
+    f = imex_mesh(init, val=1.0)
+
+    # the sweepers only add up the components or copy the whole object
+    if operation == 'sum':
+        benchmark(lambda: f.impl + f.expl)
+    else:
+        benchmark(imex_mesh, f)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('size', [10, 10**4])
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_benchmark_particles(benchmark, size, operation):
+    import numpy as np
+    from pySDC.implementations.datatype_classes.particles import particles
+
+    init = ((3, size), None, np.dtype('float64'))
+    a = particles(init, val=1.0)
+    b = particles(init, val=2.0)
+    benchmark(get_operation(operation, a, b))
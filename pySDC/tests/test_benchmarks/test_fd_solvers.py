@@ -0,0 +1,54 @@
+import pytest
+
+
+def get_problem_and_rhs(bc, nvars, solver_type):
+    """
+    Get a heat equation problem and a right hand side for the implicit solves
+
+    Args:
+        bc (str): Boundary conditions
+        nvars (tuple): Number of degrees of freedom
+        solver_type (str): Type of the linear solver
+
+    Returns:
+        pySDC.implementations.problem_classes.HeatEquation_ND_FD.heatNd_unforced: The problem
+        dtype_u: The right hand side
+    """
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+
+    P = heatNd_unforced(nvars=nvars, nu=0.1, freq=2, bc=bc, solver_type=solver_type)
+    return P, P.u_exact(0.0)
+
+
+PARAMS = [
+    ('periodic', (128, 128), 'direct'),
+    ('periodic', (128, 128), 'fft'),
+    ('periodic', (64, 64, 64), 'fft'),
+    ('periodic', (128, 128), 'multigrid'),
+    ('periodic', (32, 32, 32), 'multigrid'),
+    ('dirichlet-zero', (127, 127), 'direct'),
+    ('dirichlet-zero', (127, 127), 'fft'),
+    ('dirichlet-zero', (63, 63, 63), 'fft'),
+    ('dirichlet-zero', (127, 127), 'multigrid'),
+    ('dirichlet-zero', (31, 31, 31), 'multigrid'),
+]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('bc, nvars, solver_type', PARAMS)
+def test_benchmark_solve_system(benchmark, bc, nvars, solver_type):
+    P, rhs = get_problem_and_rhs(bc, nvars, solver_type)
+    P.solve_system(rhs, 0.1, rhs, 0.0)  # make sure the factorization is reused in the benchmark
+    benchmark(P.solve_system, rhs, 0.1, rhs, 0.0)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nvars', [(4096,), (256, 256), (64, 64, 64)])
+@pytest.mark.parametrize('matrix_free', [False, True])
+def test_benchmark_eval_f(benchmark, nvars, matrix_free):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+
+    P = heatNd_unforced(nvars=nvars, nu=0.1, freq=2, bc='periodic', solver_type='CG', matrix_free=matrix_free)
+    u = P.u_exact(0.0)
+    f = P.f_init
+    benchmark(P.eval_f, u, 0.0, out=f)
@@ -0,0 +1,78 @@
+import pytest
+
+
+def get_level(inplace_sweeps, nvars=(127, 127), num_nodes=5):
+    from pySDC.core.Step import step
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_forced
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+
+    description = {
+        'problem_class': heatNd_forced,
+        'problem_params': {'nu': 0.1, 'freq': 2, 'nvars': nvars, 'bc': 'dirichlet-zero'},
+        'sweeper_class': imex_1st_order,
+        'sweeper_params': {
+            'quad_type': 'RADAU-RIGHT',
+            'num_nodes': num_nodes,
+            'QI': 'LU',
+            'inplace_sweeps': inplace_sweeps,
+        },
+        'level_params': {'dt': 0.1, 'contiguous_storage': inplace_sweeps},
+    }
+    S = step(description)
+    L = S.levels[0]
+    L.status.time = 0.0
+    S.init_step(L.prob.u_exact(0.0))
+    L.sweep.predict()
+
+    # sweep once to allocate all buffers
+    L.sweep.update_nodes()
+    return L
+
+
+def measure_allocations(L, nsweeps=3):
+    """
+    Measure the memory allocated during sweeps in units of the size of the solution at a single node
+
+    Args:
+        L (pySDC.Level.level): the level to sweep on
+        nsweeps (int): number of sweeps
+
+    Returns:
+        float: allocated memory per sweep
+        float: peak of additional memory during the sweeps
+    """
+    import tracemalloc
+
+    size = L.u[0].nbytes
+    allocated = 0
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(nsweeps):
+        snapshot = tracemalloc.take_snapshot()
+        L.sweep.update_nodes()
+        stats = tracemalloc.take_snapshot().compare_to(snapshot, 'lineno')
+        allocated += sum(max(me.size_diff, 0) for me in stats)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return allocated / nsweeps / size, (peak - start) / size
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('inplace_sweeps', [False, True])
+def test_benchmark_sweep(benchmark, inplace_sweeps):
+    L = get_level(inplace_sweeps)
+    benchmark(L.sweep.update_nodes)
+
+
+@pytest.mark.benchmark
+def test_allocations_per_sweep():
+    allocations = {}
+    peaks = {}
+    for inplace_sweeps in [False, True]:
+        allocations[inplace_sweeps], peaks[inplace_sweeps] = measure_allocations(get_level(inplace_sweeps))
+
+    assert allocations[True] < 1.0, 'In-place sweeps should not allocate new data objects'
+    assert peaks[True] < peaks[False], 'In-place sweeps should need less temporary memory'
@@ -0,0 +1,49 @@
+import pytest
+
+
+def get_problem_and_particles(nparts):
+    import numpy as np
+    from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+
+    P = penningtrap(
+        omega_B=25.0,
+        omega_E=4.9,
+        u0=np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object),
+        nparts=nparts,
+        sig=0.1,
+    )
+    return P, P.u_init()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nparts', [10, 100, 1000])
+def test_benchmark_eval_f(benchmark, nparts):
+    P, part = get_problem_and_particles(nparts)
+    benchmark(P.eval_f, part, 0.0)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nparts', [10, 1000, 100000])
+def test_benchmark_build_f(benchmark, nparts):
+    P, part = get_problem_and_particles(nparts)
+    f = P.dtype_f(P.init, val=1.0)
+    benchmark(P.build_f, f, part, 0.0)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nparts', [10, 1000, 100000])
+def test_benchmark_boris_solver(benchmark, nparts):
+    P, part = get_problem_and_particles(nparts)
+    f = P.dtype_f(P.init, val=1.0)
+    c = P.dtype_u(P.init, val=0.0).vel
+    benchmark(P.boris_solver, c, 0.1, f, f, part)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nparts', [1000, 10000])
+@pytest.mark.parametrize('theta', [0.3, 0.5, 1.0])
+def test_benchmark_tree_interactions(benchmark, nparts, theta):
+    P, part = get_problem_and_particles(nparts)
+    P.interactions = 'tree'
+    P.theta = theta
+    benchmark(P.get_interactions, part)
@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nbodies', [6, 100, 500])
+def test_benchmark_eval_f(benchmark, nbodies):
+    from pySDC.tests.test_solar_system import get_problem_and_bodies
+
+    P, u = get_problem_and_bodies(nbodies)
+    benchmark(P.eval_f, u, 0.0)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nbodies', [6, 100, 500])
+def test_benchmark_eval_hamiltonian(benchmark, nbodies):
+    from pySDC.tests.test_solar_system import get_problem_and_bodies
+
+    P, u = get_problem_and_bodies(nbodies)
+    benchmark(P.eval_hamiltonian, u)
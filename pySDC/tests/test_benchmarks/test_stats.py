@@ -0,0 +1,58 @@
+import pytest
+
+
+def get_stats(num_steps, num_types=10, num_iter=10):
+    """
+    Fill a hook with entries as they are recorded during a run
+
+    Args:
+        num_steps (int): Number of steps
+        num_types (int): Number of different types of entries per iteration
+        num_iter (int): Number of iterations per step
+
+    Returns:
+        dict: The stats
+    """
+    from pySDC.core.Hooks import hooks
+
+    hook = hooks()
+    for step in range(num_steps):
+        for iter in range(num_iter):
+            for i in range(num_types):
+                hook.add_to_stats(
+                    process=step % 4, time=step * 0.1, level=0, iter=iter, sweep=1, type=f'type_{i}', value=1.0
+                )
+    return hook.return_stats()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('num_steps', [10, 1000])
+def test_benchmark_add_to_stats(benchmark, num_steps):
+    benchmark(get_stats, num_steps)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('num_steps', [10, 1000])
+def test_benchmark_filter_stats(benchmark, num_steps):
+    from pySDC.helpers.stats_helper import filter_stats
+
+    stats = get_stats(num_steps)
+    benchmark(filter_stats, stats, type='type_0', iter=-1)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('num_steps', [10, 1000])
+def test_benchmark_get_sorted(benchmark, num_steps):
+    from pySDC.helpers.stats_helper import get_sorted
+
+    stats = get_stats(num_steps)
+    benchmark(get_sorted, stats, type='type_0', sortby='time')
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('num_steps', [10, 1000])
+def test_benchmark_filter_recomputed(benchmark, num_steps):
+    from pySDC.helpers.stats_helper import filter_recomputed
+
+    stats = get_stats(num_steps)
+    benchmark(lambda: filter_recomputed(stats.copy()))
@@ -0,0 +1,145 @@
+import pytest
+
+SWEEPERS = ['generic_implicit', 'imex_1st_order', 'explicit', 'multi_implicit', 'boris_2nd_order', 'verlet']
+
+
+def get_description(sweeper_name, size, num_nodes):
+    """
+    Get a description for a step with a problem that fits the sweeper
+
+    Args:
+        sweeper_name (str): Name of the sweeper
+        size (int): Number of degrees of freedom per dimension or number of particles
+        num_nodes (int): Number of collocation nodes
+
+    Returns:
+        dict: The description
+    """
+    import numpy as np
+
+    sweeper_params = {'quad_type': 'RADAU-RIGHT', 'num_nodes': num_nodes, 'QI': 'LU'}
+
+    if sweeper_name in ['generic_implicit', 'imex_1st_order', 'explicit']:
+        from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced, heatNd_forced
+
+        problem_class = heatNd_forced if sweeper_name == 'imex_1st_order' else heatNd_unforced
+        problem_params = {'nu': 0.1, 'freq': 2, 'nvars': (size,), 'bc': 'dirichlet-zero'}
+
+        if sweeper_name == 'generic_implicit':
+            from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit as sweeper_class
+        elif sweeper_name == 'imex_1st_order':
+            from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order as sweeper_class
+        else:
+            from pySDC.implementations.sweeper_classes.explicit import explicit as sweeper_class
+
+    elif sweeper_name == 'multi_implicit':
+        from pySDC.implementations.problem_classes.AllenCahn_2D_FD import allencahn_multiimplicit
+        from pySDC.implementations.sweeper_classes.multi_implicit import multi_implicit as sweeper_class
+
+        problem_class = allencahn_multiimplicit
+        problem_params = {
+            'nvars': (size, size),
+            'nu': 2,
+            'eps': 0.04,
+            'newton_maxiter': 100,
+            'newton_tol': 1e-8,
+            'lin_tol': 1e-8,
+            'lin_maxiter': 100,
+            'radius': 0.25,
+        }
+        sweeper_params['Q1'] = 'LU'
+        sweeper_params['Q2'] = 'LU'
+
+    elif sweeper_name == 'boris_2nd_order':
+        from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+        from pySDC.implementations.sweeper_classes.boris_2nd_order import boris_2nd_order as sweeper_class
+
+        problem_class = penningtrap
+        problem_params = {
+            'omega_E': 4.9,
+            'omega_B': 25.0,
+            'u0': np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object),
+            'nparts': size,
+            'sig': 0.1,
+        }
+        sweeper_params = {'quad_type': 'RADAU-RIGHT', 'num_nodes': num_nodes}
+
+    elif sweeper_name == 'verlet':
+        from pySDC.implementations.problem_classes.FermiPastaUlamTsingou import fermi_pasta_ulam_tsingou
+        from pySDC.implementations.sweeper_classes.verlet import verlet as sweeper_class
+
+        problem_class = fermi_pasta_ulam_tsingou
+        problem_params = {'npart': size, 'alpha': 0.25, 'k': 1.0, 'energy_modes': [[1, 2, 3, 4]]}
+        sweeper_params = {'quad_type': 'LOBATTO', 'num_nodes': num_nodes, 'initial_guess': 'zero'}
+
+    else:
+        raise NotImplementedError(f'No benchmark configuration for sweeper {sweeper_name!r}')
+
+    return {
+        'problem_class': problem_class,
+        'problem_params': problem_params,
+        'sweeper_class': sweeper_class,
+        'sweeper_params': sweeper_params,
+        'level_params': {'dt': 1e-2},
+    }
+
+
+def get_level(sweeper_name, size, num_nodes):
+    """
+    Get a level that has been swept once, such that all values at the nodes are available
+
+    Args:
+        sweeper_name (str): Name of the sweeper
+        size (int): Number of degrees of freedom or particles
+        num_nodes (int): Number of collocation nodes
+
+    Returns:
+        pySDC.Level.level: The level
+    """
+    from pySDC.core.Step import step
+
+    S = step(get_description(sweeper_name, size, num_nodes))
+    L = S.levels[0]
+    L.status.time = 0.0
+    S.init_step(L.prob.u_init() if sweeper_name == 'boris_2nd_order' else L.prob.u_exact(0.0))
+    L.sweep.predict()
+    L.sweep.update_nodes()
+    return L
+
+
+SIZES = {'multi_implicit': [16, 32], 'boris_2nd_order': [10, 100], 'verlet': [64, 1024]}
+
+
+def get_params():
+    params = []
+    for sweeper_name in SWEEPERS:
+        for size in SIZES.get(sweeper_name, [127, 4095]):
+            for num_nodes in [3, 5]:
+                params.append((sweeper_name, size, num_nodes))
+    return params
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('sweeper_name, size, num_nodes', get_params())
+def test_benchmark_update_nodes(benchmark, sweeper_name, size, num_nodes):
+    L = get_level(sweeper_name, size, num_nodes)
+    benchmark(L.sweep.update_nodes)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('sweeper_name, size, num_nodes', get_params())
+def test_benchmark_integrate(benchmark, sweeper_name, size, num_nodes):
+    L = get_level(sweeper_name, size, num_nodes)
+    benchmark(L.sweep.integrate)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('sweeper_name, size, num_nodes', get_params())
+def test_benchmark_compute_residual(benchmark, sweeper_name, size, num_nodes):
+    L = get_level(sweeper_name, size, num_nodes)
+
+    def compute_residual():
+        L.status.updated = True
+        L.sweep.compute_residual()
+
+    benchmark(compute_residual)
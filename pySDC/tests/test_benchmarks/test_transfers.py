@@ -0,0 +1,60 @@
+import pytest
+
+
+def get_step(nvars, num_nodes, fused):
+    """
+    Get a step with two levels and values at all nodes of both levels
+
+    Args:
+        nvars (tuple): Number of degrees of freedom on the fine level
+        num_nodes (list): Number of collocation nodes on the fine and coarse level
+        fused (bool): Transfer all nodes at once
+
+    Returns:
+        pySDC.Step.step: The step
+    """
+    from pySDC.core.Step import step
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_forced
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+
+    description = {
+        'problem_class': heatNd_forced,
+        'problem_params': {
+            'nu': 0.1,
+            'freq': 2,
+            'nvars': [nvars, tuple((me + 1) // 2 - 1 for me in nvars)],
+            'bc': 'dirichlet-zero',
+        },
+        'sweeper_class': imex_1st_order,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': num_nodes, 'QI': 'LU'},
+        'level_params': {'dt': 0.1, 'contiguous_storage': fused},
+        'space_transfer_class': mesh_to_mesh,
+        'base_transfer_params': {'fused': fused},
+    }
+    S = step(description)
+    for L in S.levels:
+        L.status.time = 0.0
+    S.init_step(S.levels[0].prob.u_exact(0.0))
+    S.levels[0].sweep.predict()
+    S.transfer(source=S.levels[0], target=S.levels[1])
+    return S
+
+
+PARAMS = [((255,), [5, 3]), ((255,), [5, 5]), ((4095,), [5, 3]), ((127, 127), [5, 3])]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nvars, num_nodes', PARAMS)
+@pytest.mark.parametrize('fused', [False, True])
+def test_benchmark_restrict(benchmark, nvars, num_nodes, fused):
+    S = get_step(nvars, num_nodes, fused)
+    benchmark(S.base_transfer.restrict)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('nvars, num_nodes', PARAMS)
+@pytest.mark.parametrize('fused', [False, True])
+def test_benchmark_prolong(benchmark, nvars, num_nodes, fused):
+    S = get_step(nvars, num_nodes, fused)
+    benchmark(S.base_transfer.prolong)
@@ -0,0 +1,102 @@
+import pytest
+
+from pySDC.core.Hooks import hooks
+
+
+class Interrupt(Exception):
+    pass
+
+
+class InterruptRun(hooks):
+    """
+    Stop the run after some time as if the job was killed
+    """
+
+    t_interrupt = 1.0
+
+    def post_step(self, step, level_number):
+        super().post_step(step, level_number)
+        if step.time > self.t_interrupt:
+            raise Interrupt
+
+
+def get_controller(num_procs, hook_class=None, **kwargs):
+    import numpy as np
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.convergence_controller_classes.adaptivity import Adaptivity
+
+    description = {
+        'problem_class': testequation0d,
+        'problem_params': {'lambdas': np.array([-1.0 + 0j, -10.0 + 1j]), 'u0': 1.0},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'dt': 0.5, 'restol': -1},
+        'step_params': {'maxiter': 4},
+        'convergence_controllers': {Adaptivity: {'e_tol': 1e-6}},
+    }
+    controller_params = {'logger_level': 30, 'mssdc_jac': False, **kwargs}
+    if hook_class is not None:
+        controller_params['hook_class'] = hook_class
+    return controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_procs', [1, 3])
+@pytest.mark.parametrize('checkpoint_interval', [1, 2])
+def test_resume(num_procs, checkpoint_interval, tmp_path):
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+
+    Tend = 2.0
+    controller = get_controller(num_procs)
+    P = controller.MS[0].levels[0].prob
+    uend_expected, stats_expected = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=Tend)
+
+    params = {'checkpoint_path': str(tmp_path), 'checkpoint_interval': checkpoint_interval}
+    controller = get_controller(num_procs, hook_class=InterruptRun, **params)
+    with pytest.raises(Interrupt):
+        controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=Tend)
+
+    uend, stats = get_controller(num_procs, **params).resume()
+    assert np.array_equal(uend, uend_expected)
+
+    # the resumed part of the run needs to be identical to the uninterrupted run
+    dt = get_sorted(stats, type='dt', recomputed=False)
+    dt_expected = get_sorted(stats_expected, type='dt', recomputed=False)
+    assert 0 < len(dt) < len(dt_expected)
+    assert dt == dt_expected[-len(dt) :]
+
+
+@pytest.mark.base
+def test_checkpoint(tmp_path):
+    import numpy as np
+    from pySDC.helpers.checkpoint import Checkpoint
+
+    checkpoint = Checkpoint(path=str(tmp_path), prefix='test_')
+    assert not checkpoint.exists()
+
+    for i in range(3):
+        checkpoint.write(np.arange(4.0) * i, {'i': i})
+        solution, state = Checkpoint(path=str(tmp_path), prefix='test_').read()
+        assert np.array_equal(solution, np.arange(4.0) * i) and state == {'i': i}
+
+    # the solution files are written alternately and the last one stays intact when writing the next checkpoint
+    assert sorted(me.name for me in tmp_path.iterdir()) == ['test_checkpoint.pkl'] + [
+        f'test_checkpoint_{i}.npy' for i in range(2)
+    ]
+    solution, _ = checkpoint.read()
+    checkpoint.write(np.zeros(4), {})
+    assert np.array_equal(solution, np.arange(4.0) * 2)
+
+    checkpoint.write([1, 2], {})
+    assert checkpoint.read() == ([1, 2], {})
+
+
+@pytest.mark.base
+def test_no_checkpoint(tmp_path):
+    from pySDC.core.Errors import ControllerError
+
+    with pytest.raises(ControllerError):
+        get_controller(1, checkpoint_path=str(tmp_path)).resume()
@@ -115,3 +115,36 @@ def test_partialquadraturewithS(node_type, quad_type):
                 + ", partial quadrature rule from Smat failed to integrate polynomial of degree M-1 exactly for M = "
                 + str(M)
             )
+
+
+@pytest.mark.base
+@pytest.mark.parametrize("quad_type", quad_types)
+def test_cache(quad_type):
+    from pySDC.core.Collocation import clear_cache
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+
+    clear_cache()
+    coll = CollBase(4, 0, 1, node_type='LEGENDRE', quad_type=quad_type)
+    coll_cached = CollBase(4, 0, 1, node_type='LEGENDRE', quad_type=quad_type)
+    assert coll_cached.Qmat is coll.Qmat and coll_cached.nodes is coll.nodes
+    assert not coll.Qmat.flags.writeable
+
+    # the cached matrices are the same as the ones computed from scratch
+    coll_uncached = CollBase(4, np.array([0.0]), np.array([1.0]), node_type='LEGENDRE', quad_type=quad_type)
+    assert coll_uncached.cache_key is None
+    for key in ['nodes', 'weights', 'Qmat', 'Smat', 'delta_m']:
+        assert np.allclose(getattr(coll, key), getattr(coll_uncached, key)), key
+    assert CollBase(4, 0, 2, node_type='LEGENDRE', quad_type=quad_type).Qmat is not coll.Qmat
+
+    # preconditioners are shared between sweepers, including whether they can be parallelized
+    params = {'num_nodes': 4, 'node_type': 'LEGENDRE', 'quad_type': quad_type}
+    for QI, parallelizable in [('LU', False), ('MIN', True)]:
+        sweepers = [generic_implicit({**params, 'QI': QI}), imex_1st_order({**params, 'QI': QI})]
+        assert sweepers[0].QI is sweepers[1].QI
+        assert not sweepers[0].QI.flags.writeable
+        assert all(me.parallelizable == parallelizable for me in sweepers)
+
+        sweeper_uncached = generic_implicit({**params, 'QI': QI, 'collocation_class': type('Coll', (CollBase,), {})})
+        assert np.allclose(sweeper_uncached.QI, sweepers[0].QI)
+    assert sweepers[1].QE is imex_1st_order(params).QE
@@ -0,0 +1,144 @@
+import pytest
+
+
+class LoopbackComm(object):
+    """
+    Minimal stand-in for an MPI communicator that delivers buffer messages to itself
+    """
+
+    rank = 0
+
+    def __init__(self):
+        self.messages = []
+
+    def Send(self, buf, dest, tag):
+        self.messages.append((tag, buf.copy()))
+
+    def Isend(self, buf, dest, tag):
+        self.Send(buf, dest, tag)
+        return LoopbackRequest()
+
+    def Recv(self, buf, source, tag):
+        index = next(i for i, me in enumerate(self.messages) if me[0] == tag)
+        buf[...] = self.messages.pop(index)[1]
+
+
+class LoopbackRequest(object):
+    def Wait(self):
+        pass
+
+
+@pytest.mark.base
+def test_typed_messages():
+    import numpy as np
+    import dill
+    from pySDC.core.ConvergenceController import ConvergenceController
+
+    controller = ConvergenceController(None, {}, {})
+    controller.add_message('restart', restart=bool, max_restart_reached=bool)
+    controller.add_message('dt', dt=(float, (3,)), iter=np.int64)
+    comm = LoopbackComm()
+
+    assert controller.messages['restart'].tag != controller.messages['dt'].tag
+    assert controller.messages['restart'].fields == ('restart', 'max_restart_reached')
+
+    req = controller.send_buffer(comm, dest=0, name='dt', dt=[0.1, 0.2, 0.3], iter=4)
+    controller.send_buffer(comm, dest=0, name='restart', blocking=True, restart=True, max_restart_reached=False)
+    assert req is not None
+
+    # messages are matched by their tags rather than the order in which they have been sent
+    restart, max_restart_reached = controller.recv_buffer(comm, source=0, name='restart')
+    assert restart is True and max_restart_reached is False
+
+    dt, niter = controller.recv_buffer(comm, source=0, name='dt')
+    assert np.allclose(dt, [0.1, 0.2, 0.3]) and niter == 4 and type(niter) is int
+
+    # fields that are not given keep their values
+    controller.send_buffer(comm, dest=0, name='dt', iter=5)
+    dt_again, niter = controller.recv_buffer(comm, source=0, name='dt')
+    assert np.allclose(dt_again, dt) and niter == 5
+
+    # received arrays are copies, which are not changed by receiving the next message
+    controller.send_buffer(comm, dest=0, name='dt', dt=[1.0, 2.0, 3.0])
+    controller.recv_buffer(comm, source=0, name='dt')
+    assert np.allclose(dt, [0.1, 0.2, 0.3])
+
+    copy = dill.copy(controller)
+    assert copy.messages['dt'].request is None
+    assert copy.messages['dt'].tag == controller.messages['dt'].tag
+
+
+def run_adaptivity(comm=None, num_procs=1):
+    import numpy as np
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.convergence_controller_classes.adaptivity import Adaptivity
+    from pySDC.helpers.stats_helper import get_sorted
+
+    description = {
+        'problem_class': testequation0d,
+        'problem_params': {'lambdas': np.array([-1.0 + 0j, -10.0 + 1j]), 'u0': 1.0},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'dt': 0.5, 'restol': -1},
+        'step_params': {'maxiter': 4},
+        'convergence_controllers': {Adaptivity: {'e_tol': 1e-6}},
+    }
+    controller_params = {'logger_level': 30, 'mssdc_jac': False}
+
+    if comm is None:
+        from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+        controller = controller_nonMPI(
+            num_procs=num_procs, controller_params=controller_params, description=description
+        )
+        P = controller.MS[0].levels[0].prob
+    else:
+        from pySDC.implementations.controller_classes.controller_MPI import controller_MPI
+
+        controller = controller_MPI(controller_params=controller_params, description=description, comm=comm)
+        P = controller.S.levels[0].prob
+
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=2.0)
+    dt = get_sorted(stats, type='dt', recomputed=False, comm=comm)
+    restarts = get_sorted(stats, type='restart', comm=comm)
+    return uend, dt, restarts
+
+
+def check_adaptivity_MPI(comm):
+    import numpy as np
+
+    uend, dt, restarts = run_adaptivity(comm=comm)
+    uend_nonMPI, dt_nonMPI, restarts_nonMPI = run_adaptivity(num_procs=comm.size)
+
+    assert any(me[1] for me in restarts_nonMPI), 'Test requires restarts'
+    assert np.allclose(uend, uend_nonMPI)
+    assert np.allclose(dt, dt_nonMPI)
+    assert restarts == restarts_nonMPI
+
+
+@pytest.mark.mpi4py
+@pytest.mark.parametrize('num_procs', [1, 3])
+def test_typed_messages_MPI(num_procs):
+    import os
+    import subprocess
+
+    # Setup environment
+    my_env = os.environ.copy()
+    my_env['PYTHONPATH'] = '../../..:.'
+    cwd = '.'
+
+    cmd = f'mpirun -np {num_procs} python {__file__}'.split()
+
+    p = subprocess.Popen(cmd, env=my_env, cwd=cwd)
+    p.wait()
+    assert p.returncode == 0, 'ERROR: did not get return code 0, got %s with %2i processes' % (
+        p.returncode,
+        num_procs,
+    )
+
+
+if __name__ == '__main__':
+    from mpi4py import MPI
+
+    check_adaptivity_MPI(MPI.COMM_WORLD)
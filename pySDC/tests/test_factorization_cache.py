@@ -0,0 +1,118 @@
+import pytest
+
+
+@pytest.mark.base
+def test_cache_semantics():
+    import numpy as np
+    from pySDC.core.Problem import FactorizationCache
+
+    cache = FactorizationCache(max_entries=2)
+    calls = []
+
+    def factorize(key):
+        calls.append(key)
+        return np.ones(10) * key
+
+    for key in [1.0, 2.0, 1.0, 3.0]:
+        cache.get(key, lambda: factorize(key))
+
+    assert calls == [1.0, 2.0, 3.0]
+    assert cache.hits == 1 and cache.misses == 3
+    assert 2.0 not in cache, 'Least recently used entry was not evicted'
+    assert 1.0 in cache and 3.0 in cache
+    assert cache.nbytes == 2 * np.ones(10).nbytes
+
+    # entries exceeding the memory cap are returned, but not stored
+    cache.max_memory = np.ones(10).nbytes
+    cache.get(4.0, lambda: factorize(4.0))
+    assert len(cache) == 1 and 4.0 in cache
+    assert np.allclose(cache.get(5.0, lambda: np.ones(20)), 1.0)
+    assert 5.0 not in cache
+
+    cache.remove(4.0)
+    assert len(cache) == 0
+    cache.remove(4.0)
+
+    cache.get(6.0, lambda: factorize(6.0))
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+@pytest.mark.base
+def test_solver_size():
+    """
+    Check that the memory footprint is estimated for solvers that wrap factorizations
+    """
+    import numpy as np
+    import scipy.sparse as sp
+    from scipy.linalg import lu_factor, lu_solve
+    from scipy.sparse.linalg import splu
+    from pySDC.core.Problem import FactorizationCache
+
+    LU = splu(sp.eye(10, format='csc') * 2.0)
+    assert FactorizationCache.get_nbytes(LU.solve) == FactorizationCache.get_nbytes(LU) > 0
+
+    lu = lu_factor(np.eye(10) * 2.0)
+    assert FactorizationCache.get_nbytes(lambda b: lu_solve(lu, b)) == lu[0].nbytes + lu[1].nbytes
+
+    # the memory limit applies to solvers as well
+    cache = FactorizationCache(max_memory=lu[0].nbytes)
+    cache.get(1.0, lambda: lambda b: lu_solve(lu, b))
+    assert len(cache) == 0
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('ndim', [1, 2])
+def test_heat_solves(ndim):
+    import numpy as np
+    import pickle
+    from scipy.sparse.linalg import spsolve
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+
+    P = heatNd_unforced(nvars=(31,) * ndim, bc='dirichlet-zero')
+    rhs = P.u_exact(0.1)
+
+    for factor in [0.1, 0.2, 0.1, 0.1]:
+        sol = P.solve_system(rhs, factor, rhs, 0.1)
+        ref = spsolve(P.Id - factor * P.A, rhs.flatten()).reshape(P.nvars)
+        assert np.allclose(sol, ref, atol=1e-14)
+
+    assert P.factorizations.misses == 2 and P.factorizations.hits == 2
+    assert P.factorizations.nbytes > 0
+
+    # the factorizations are not part of copies of the problem
+    P_copy = pickle.loads(pickle.dumps(P))
+    assert len(P_copy.factorizations) == 0
+    assert np.allclose(P_copy.solve_system(rhs, 0.1, rhs, 0.1), P.solve_system(rhs, 0.1, rhs, 0.1))
+
+
+@pytest.mark.base
+def test_invalidation_with_adaptivity():
+    import numpy as np
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.convergence_controller_classes.adaptivity import Adaptivity
+    from pySDC.helpers.stats_helper import get_sorted
+
+    num_nodes = 3
+    description = {
+        'problem_class': testequation0d,
+        'problem_params': {'lambdas': np.array([-1.0 + 0j, -10.0 + 1j]), 'u0': 1.0},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': num_nodes, 'QI': 'LU'},
+        'level_params': {'dt': 0.05, 'restol': -1},
+        'step_params': {'maxiter': 5},
+        'convergence_controllers': {Adaptivity: {'e_tol': 1e-7}},
+    }
+    controller = controller_nonMPI(
+        num_procs=1, controller_params={'logger_level': 30, 'mssdc_jac': False}, description=description
+    )
+    P = controller.MS[0].levels[0].prob
+    _, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=1.0)
+
+    step_sizes = set(me[1] for me in get_sorted(stats, type='dt'))
+    assert len(step_sizes) > 1, 'Adaptivity did not change the step size'
+    assert len(P.factorizations) <= num_nodes, 'Factorizations for old step sizes were not discarded'
+    assert P.factorizations.misses >= len(step_sizes) * num_nodes
+    assert P.factorizations.hits > P.factorizations.misses
@@ -0,0 +1,75 @@
+import pytest
+
+
+def get_problem(problem_name, bc, ndim, order, stencil_type):
+    """
+    Get a finite difference problem with the fft solver
+
+    Args:
+        problem_name (str): Name of the problem, either "heat" or "advection"
+        bc (str): Boundary conditions
+        ndim (int): Number of dimensions
+        order (int): Order of the finite difference discretization
+        stencil_type (str): Type of the stencil
+
+    Returns:
+        pySDC.implementations.problem_classes.generic_ND_FD.GenericNDimFinDiff: The problem
+    """
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.problem_classes.AdvectionEquation_ND_FD import advectionNd
+
+    if problem_name == 'heat':
+        problem_class, problem_params = heatNd_unforced, {'nu': 0.3}
+    else:
+        problem_class, problem_params = advectionNd, {'c': 1.3}
+    problem_params['nvars'] = (16 if bc == 'periodic' else 15,) * ndim
+    problem_params['bc'] = bc
+    problem_params['order'] = order
+    problem_params['stencil_type'] = stencil_type
+
+    return problem_class(**problem_params, solver_type='fft')
+
+
+def check_solves(P):
+    """
+    Check that the fft solver solves (I - factor * A) u = rhs for a random right hand side
+
+    Args:
+        P (pySDC.implementations.problem_classes.generic_ND_FD.GenericNDimFinDiff): The problem
+
+    Returns:
+        None
+    """
+    import numpy as np
+
+    rhs = P.u_init
+    rhs[:] = np.random.default_rng(0).random(rhs.shape)
+    for factor in [0.1, 0.2, 0.1]:
+        sol = P.solve_system(rhs, factor, rhs, 0.0)
+        res = sol.flatten() - factor * P.A.dot(sol.flatten()) - rhs.flatten()
+        assert np.allclose(res, 0, atol=1e-12)
+    assert P.factorizations.hits == 1
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('problem_name', ['heat', 'advection'])
+@pytest.mark.parametrize('ndim', [1, 2, 3])
+@pytest.mark.parametrize('order, stencil_type', [(2, 'center'), (4, 'center'), (3, 'upwind')])
+def test_fft_solver_periodic(problem_name, ndim, order, stencil_type):
+    check_solves(get_problem(problem_name, 'periodic', ndim, order, stencil_type))
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('ndim', [1, 2, 3])
+def test_fft_solver_dirichlet(ndim):
+    check_solves(get_problem('heat', 'dirichlet-zero', ndim, 2, 'center'))
+
+
+@pytest.mark.base
+def test_fft_solver_not_applicable():
+    from pySDC.core.Errors import ProblemError
+
+    # the DST does not diagonalize non-symmetric stencils
+    for problem_name, order, stencil_type in [('advection', 2, 'center'), ('heat', 1, 'upwind')]:
+        with pytest.raises(ProblemError):
+            get_problem(problem_name, 'dirichlet-zero', 1, order, stencil_type)
@@ -0,0 +1,50 @@
+import pytest
+
+
+def run_heat(num_procs, nvars, predict_type, **kwargs):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.helpers.stats_helper import get_sorted
+
+    description = {
+        'problem_class': heatNd_unforced,
+        'problem_params': {'nu': 0.1, 'freq': 2, 'nvars': nvars, 'bc': 'dirichlet-zero'},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': [5, 3], 'QI': 'LU'},
+        'level_params': {'dt': 0.1, 'restol': 1e-10},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+    }
+    controller_params = {'logger_level': 30, 'predict_type': predict_type, **kwargs}
+    controller = controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    try:
+        uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=1.6)
+    finally:
+        controller.close()
+    niter = [me[1] for me in get_sorted(stats, type='niter', sortby='time')]
+    return uend, niter, abs(uend - P.u_exact(1.6))
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_procs', [1, 8])
+@pytest.mark.parametrize('nvars', [[(63,), (31,)], [(127,), (63,), (31,)]])
+def test_fmg_predictor(num_procs, nvars):
+    import numpy as np
+
+    uend, niter, error = run_heat(num_procs, nvars, 'fmg')
+    _, niter_burnin, error_burnin = run_heat(num_procs, nvars, 'pfasst_burnin')
+
+    assert error < 1e-11
+    assert error < 2 * error_burnin or error < 1e-12
+
+    if num_procs > 1:
+        # the coarse solution is passed through the whole block, which gives a better initial guess than the burn-in
+        assert np.mean(niter) <= np.mean(niter_burnin)
+
+        uend_processes, niter_processes, _ = run_heat(num_procs, nvars, 'fmg', execution_backend='processes')
+        assert np.allclose(uend, uend_processes, rtol=0, atol=1e-14)
+        assert niter == niter_processes
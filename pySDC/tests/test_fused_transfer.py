@@ -0,0 +1,94 @@
+import pytest
+
+
+def get_controller(sweeper, num_procs=1, **kwargs):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced, heatNd_forced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    description = {
+        'problem_class': heatNd_forced if sweeper == 'imex' else heatNd_unforced,
+        'problem_params': {'nu': 0.1, 'freq': 2, 'nvars': [(31, 31), (15, 15)], 'bc': 'dirichlet-zero'},
+        'sweeper_class': imex_1st_order if sweeper == 'imex' else generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': [4, 3], 'QI': 'LU'},
+        'level_params': {'dt': 0.1, 'restol': 1e-10, 'contiguous_storage': kwargs.pop('contiguous_storage', False)},
+        'step_params': {'maxiter': 20},
+        'space_transfer_class': mesh_to_mesh,
+        'base_transfer_params': kwargs,
+    }
+    controller_params = {'logger_level': 30, 'predict_type': 'pfasst_burnin'}
+    return controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('sweeper', ['imex', 'implicit'])
+@pytest.mark.parametrize('contiguous_storage', [True, False])
+def test_fused_same_as_loops(sweeper, contiguous_storage):
+    import dill
+    import numpy as np
+
+    controller = get_controller(sweeper, contiguous_storage=contiguous_storage)
+    P = controller.MS[0].levels[0].prob
+    controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.1)
+
+    def as_array(values):
+        return np.array([me if isinstance(me, np.ndarray) else [me.impl, me.expl] for me in values])
+
+    results = {}
+    for fused in [False, True]:
+        # start from the same values
+        S = dill.copy(controller.MS[0])
+        F, G = S.levels
+        S.base_transfer.params.fused = fused
+
+        F.u[2] = F.u[2] * 1.01
+        F.f[2] = F.prob.eval_f(F.u[2], F.time + F.dt * F.sweep.coll.nodes[1])
+        S.base_transfer.restrict()
+        results[fused] = [as_array(G.u), as_array(G.f), as_array(G.tau)]
+
+        G.u[1] = G.u[1] * 1.01
+        G.f[1] = G.prob.eval_f(G.u[1], G.time + G.dt * G.sweep.coll.nodes[0])
+        S.base_transfer.prolong()
+        results[fused] += [as_array(F.u), as_array(F.f)]
+
+        # the imex datatype does not support the arithmetic needed for interpolating f
+        if sweeper == 'implicit':
+            S.base_transfer.prolong_f()
+            results[fused] += [as_array(F.u), as_array(F.f)]
+
+    for expected, actual in zip(results[False], results[True]):
+        assert np.allclose(expected, actual, rtol=1e-13, atol=1e-13)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('sweeper', ['imex', 'implicit'])
+def test_fused_run(sweeper):
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+
+    results = {}
+    for fused in [False, True]:
+        controller = get_controller(sweeper, num_procs=3, contiguous_storage=True, fused=fused)
+        P = controller.MS[0].levels[0].prob
+        results[fused] = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.6)
+
+    assert np.allclose(results[True][0], results[False][0], rtol=1e-12, atol=1e-12)
+    assert get_sorted(results[True][1], type='niter') == get_sorted(results[False][1], type='niter')
+
+
+@pytest.mark.base
+def test_apply_stacked_components():
+    import numpy as np
+    import scipy.sparse as sp
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+
+    A = sp.random(5, 8, density=0.5, format='csr', random_state=0)
+    values = np.random.default_rng(0).random((3, 2, 4, 2))
+
+    result = mesh_to_mesh.apply_stacked(A, values, (5,))
+    assert result.shape == (3, 5, 2)
+    for m in range(3):
+        for i in range(2):
+            assert np.allclose(result[m, :, i], A.dot(values[m, ..., i].flatten()))
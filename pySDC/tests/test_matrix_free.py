@@ -0,0 +1,66 @@
+import pytest
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('bc', ['periodic', 'dirichlet-zero'])
+@pytest.mark.parametrize('dim', [1, 2, 3])
+@pytest.mark.parametrize(
+    'derivative, order, stencil_type', [(2, 2, 'center'), (1, 2, 'center'), (1, 1, 'upwind'), (2, 4, 'center')]
+)
+def test_stencil_operator(bc, dim, derivative, order, stencil_type):
+    import numpy as np
+    from pySDC.helpers.problem_helper import FiniteDifferenceOperator, get_finite_difference_matrix
+
+    if order > 2 and bc != 'periodic':
+        pytest.skip('Higher order allowed only for periodic boundary conditions')
+
+    args = {
+        'derivative': derivative,
+        'order': order,
+        'stencil_type': stencil_type,
+        'dx': 0.1,
+        'size': 10,
+        'dim': dim,
+        'bc': bc,
+    }
+    A = 3.0 * get_finite_difference_matrix(**args)
+    op = FiniteDifferenceOperator(**args, scale=3.0)
+
+    u = np.random.default_rng(0).random((10,) * dim)
+    ref = A.dot(u.flatten())
+    assert np.allclose(op.apply(u).flatten(), ref, rtol=1e-14, atol=1e-12)
+    assert np.allclose(op.matvec(u.flatten()), ref, rtol=1e-14, atol=1e-12)
+
+    out = np.zeros_like(u)
+    assert op.apply(u, out=out) is out
+    assert np.allclose(out.flatten(), ref, rtol=1e-14, atol=1e-12)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('solver_type', ['GMRES', 'CG', 'fft'])
+@pytest.mark.parametrize('bc', ['periodic', 'dirichlet-zero'])
+def test_matrix_free_heat(solver_type, bc):
+    import numpy as np
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_forced
+
+    problem_params = {'nvars': (16, 16) if bc == 'periodic' else (15, 15), 'bc': bc, 'solver_type': solver_type}
+    P = heatNd_forced(**problem_params, matrix_free=True)
+    P_ref = heatNd_forced(**problem_params)
+    assert P.Id is None, 'Matrix-free problems should not assemble the identity'
+
+    u = P.u_exact(0.1)
+    f, f_ref = P.eval_f(u, 0.1), P_ref.eval_f(u, 0.1)
+    assert np.allclose(f.impl, f_ref.impl, rtol=1e-14, atol=1e-10)
+    assert np.allclose(f.expl, f_ref.expl)
+
+    sol, sol_ref = P.solve_system(u, 0.1, u, 0.1), P_ref.solve_system(u, 0.1, u, 0.1)
+    assert np.allclose(sol, sol_ref, rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.base
+def test_matrix_free_direct():
+    from pySDC.core.Errors import ProblemError
+    from pySDC.implementations.problem_classes.AdvectionEquation_ND_FD import advectionNd
+
+    with pytest.raises(ProblemError):
+        advectionNd(nvars=(16, 16), solver_type='direct', matrix_free=True)
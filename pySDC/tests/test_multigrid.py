@@ -0,0 +1,63 @@
+import pytest
+
+
+def get_problem(bc, ndim, **kwargs):
+    """
+    Get a heat equation problem
+
+    Args:
+        bc (str): Boundary conditions
+        ndim (int): Number of dimensions
+
+    Returns:
+        pySDC.implementations.problem_classes.HeatEquation_ND_FD.heatNd_unforced: The problem
+    """
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+
+    nvars = {1: 128, 2: 32, 3: 16}[ndim] - (1 if bc == 'dirichlet-zero' else 0)
+    return heatNd_unforced(nvars=(nvars,) * ndim, nu=1.0, bc=bc, lintol=1e-10, **kwargs)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('bc', ['periodic', 'dirichlet-zero'])
+@pytest.mark.parametrize('ndim', [1, 2, 3])
+@pytest.mark.parametrize(
+    'params',
+    [
+        {'solver_type': 'multigrid'},
+        {'solver_type': 'multigrid', 'mg_cycle': 'W'},
+        {'solver_type': 'multigrid', 'matrix_free': True},
+        {'solver_type': 'CG', 'preconditioner': 'multigrid'},
+        {'solver_type': 'GMRES', 'preconditioner': 'multigrid'},
+    ],
+)
+def test_multigrid(bc, ndim, params):
+    import numpy as np
+
+    P = get_problem(bc, ndim, **params)
+    P_ref = get_problem(bc, ndim)
+    assert len(P.multigrid.problems) > 2
+
+    rhs = P.u_init
+    rhs[:] = np.random.default_rng(0).random(rhs.shape)
+    for factor in [0.1, 0.2, 0.1]:
+        sol = P.solve_system(rhs, factor, P.u_init, 0.0)
+        ref = P_ref.solve_system(rhs, factor, P.u_init, 0.0)
+        assert np.allclose(sol, ref, rtol=0, atol=1e-8)
+    assert P.multigrid.operators.hits == 1
+
+    # every solve converges within a few cycles or preconditioned iterations
+    niter = P.work_counters[params['solver_type']].niter
+    assert 0 < niter <= 3 * 20
+
+
+@pytest.mark.base
+def test_multigrid_errors():
+    from pySDC.core.Errors import ProblemError
+
+    with pytest.raises(ProblemError):
+        get_problem('periodic', 1, solver_type='direct', preconditioner='multigrid')
+    with pytest.raises(ProblemError):
+        get_problem('periodic', 1, solver_type='CG', preconditioner='ILU')
+    with pytest.raises(ValueError):
+        get_problem('periodic', 1, solver_type='multigrid', mg_cycle='F')
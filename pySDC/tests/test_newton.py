@@ -0,0 +1,141 @@
+import pytest
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('update', ['full', 'simplified', 'chord'])
+def test_newton_solver(update):
+    """
+    Solve `u + factor * u^3 = rhs` componentwise for a few factors and right hand sides and check the reuse of Jacobians
+    """
+    import numpy as np
+    from pySDC.core.Problem import NewtonSolver
+
+    newton = NewtonSolver(update=update)
+    evaluations = []
+
+    for factor in [0.1, 0.2, 0.1, 0.1]:
+        rhs = np.linspace(0.5, 1.5, 5) * (1 + factor)
+
+        def residual(u):
+            return u + factor * u**3 - rhs
+
+        def get_linear_solver(u):
+            evaluations.append(factor)
+            J = np.diag(1 + 3 * factor * u**2)
+            return lambda G: np.linalg.solve(J, G)
+
+        u, n, res = newton.solve(residual, get_linear_solver, rhs.copy(), tol=1e-12, maxiter=50, key=factor)
+        assert res <= 1e-12 and n < 50
+        assert np.allclose(u + factor * u**3, rhs, rtol=0, atol=1e-12)
+
+    assert newton.work_counters['jacobian'].niter == len(evaluations)
+    if update == 'full':
+        assert len(evaluations) == newton.work_counters['newton'].niter
+    elif update == 'simplified':
+        assert len(evaluations) >= 4
+    else:
+        assert evaluations[:2] == [0.1, 0.2], 'Jacobians are not reused across solves with the same key'
+        assert len(evaluations) < 4 + newton.work_counters['newton'].niter // 2
+
+
+@pytest.mark.base
+def test_newton_refresh():
+    """
+    Check that frozen Jacobians are evaluated anew when the convergence slows down and that break downs are reported
+    """
+    import numpy as np
+    from pySDC.core.Problem import NewtonSolver
+
+    newton = NewtonSolver(update='chord', max_contraction=0.1)
+
+    def residual(u):
+        return np.exp(u) - 5.0
+
+    def get_linear_solver(u):
+        J = np.exp(u)
+        return lambda G: G / J
+
+    # the Jacobian at the initial guess is far off, such that the frozen Jacobian would converge very slowly
+    u, n, res = newton.solve(residual, get_linear_solver, np.array([1.0]), tol=1e-12, maxiter=50, key=1)
+    assert np.isclose(u[0], np.log(5.0))
+    assert newton.work_counters['jacobian'].niter > 1
+    assert n < 10
+
+    # a nan in the Newton update stops the iteration and leaves the solution untouched
+    u, n, res = newton.solve(residual, lambda u: lambda G: G * np.nan, np.array([2.0]), tol=1e-12, maxiter=50, key=2)
+    assert np.isnan(res) and u[0] == 2.0 and n == 0
+
+    # refreshing the Jacobian for one key keeps the Jacobians for other keys
+    assert 1 in newton.jacobians
+    newton.solve(residual, get_linear_solver, np.array([1.0]), tol=1e-12, maxiter=50, key=3)
+    assert 1 in newton.jacobians and 3 in newton.jacobians
+
+    with pytest.raises(ValueError):
+        NewtonSolver(update='quasi')
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('update', ['simplified', 'chord'])
+def test_newton_problems(update):
+    """
+    Compare the solutions of the implicit systems of the problems using the shared Newton solver with reused Jacobians
+    to the ones with full Newton
+    """
+    import numpy as np
+    from pySDC.implementations.problem_classes.AllenCahn_1D_FD import allencahn_front_fullyimplicit
+    from pySDC.implementations.problem_classes.Quench import Quench
+    from pySDC.implementations.problem_classes.Van_der_Pol_implicit import vanderpol
+    from pySDC.implementations.problem_classes.Lorenz import LorenzAttractor
+
+    setups = [
+        (
+            allencahn_front_fullyimplicit,
+            {
+                'nvars': 127,
+                'dw': -0.04,
+                'eps': 0.04,
+                'newton_maxiter': 99,
+                'newton_tol': 1e-12,
+                'interval': (-0.5, 0.5),
+            },
+        ),
+        (Quench, {'newton_tol': 1e-12, 'newton_iter': 99, 'nvars': 2**6}),
+        (vanderpol, {'mu': 5.0, 'newton_tol': 1e-12, 'newton_maxiter': 99, 'u0': np.array([2.0, 0.0])}),
+        (LorenzAttractor, {'newton_tol': 1e-12}),
+    ]
+
+    for problem_class, problem_params in setups:
+        solutions = {}
+        for me in ['full', update]:
+            P = problem_class(**problem_params, newton_update=me)
+            u0 = P.u_exact(0.0)
+            if problem_class == Quench:
+                u0[:] += 0.015  # make sure the non-linear part is active
+            solutions[me] = [P.solve_system(u0, factor, u0, 0.0) for factor in [0.01, 0.02, 0.01]]
+
+        for u_full, u in zip(solutions['full'], solutions[update]):
+            assert np.allclose(u, u_full, rtol=1e-10, atol=1e-10), problem_class.__name__
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('update', ['full', 'chord'])
+def test_newton_stagnation(update):
+    """
+    Check that a residual that does not decrease after evaluating the Jacobian is only accepted at the level of rounding
+    errors when stopping based on the update
+    """
+    import numpy as np
+    from pySDC.core.Problem import NewtonSolver
+
+    newton = NewtonSolver(update=update)
+
+    def residual(u):
+        return u**2 - 2.0
+
+    def get_linear_solver(u):
+        return lambda G: G / (2 * u)
+
+    # the residual grows in the first iteration, which must not be mistaken for stagnation
+    u, n, res = newton.solve(residual, get_linear_solver, np.array([0.1]), tol=0.0, maxiter=50, key=1, xtol=1e-12)
+    assert np.isclose(u[0], np.sqrt(2.0), rtol=1e-12)
+    assert res < 1e-12 and n < 50
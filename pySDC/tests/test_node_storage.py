@@ -0,0 +1,125 @@
+import pytest
+
+
+def get_description(contiguous_storage, sweeper='imex', nlevels=2):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced, heatNd_forced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+
+    level_params = {'dt': 0.1, 'restol': 1e-10, 'contiguous_storage': contiguous_storage}
+    sweeper_params = {'quad_type': 'RADAU-RIGHT', 'num_nodes': [3, 2][:nlevels], 'QI': 'LU'}
+    problem_params = {'nu': 0.1, 'freq': 2, 'nvars': [63, 31][:nlevels], 'bc': 'dirichlet-zero'}
+
+    description = {
+        'problem_class': heatNd_forced if sweeper == 'imex' else heatNd_unforced,
+        'problem_params': problem_params,
+        'sweeper_class': imex_1st_order if sweeper == 'imex' else generic_implicit,
+        'sweeper_params': sweeper_params,
+        'level_params': level_params,
+        'step_params': {'maxiter': 20},
+    }
+    if nlevels > 1:
+        description['space_transfer_class'] = mesh_to_mesh
+    return description
+
+
+def run(contiguous_storage, num_procs=1, **kwargs):
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    controller_params = {'logger_level': 30, 'predict_type': 'pfasst_burnin'}
+    description = get_description(contiguous_storage, **kwargs)
+    controller = controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.4)
+    return uend, stats, controller
+
+
+@pytest.mark.base
+def test_storage_semantics():
+    import numpy as np
+    from pySDC.core.Level import NodeStorage
+    from pySDC.implementations.datatype_classes.mesh import mesh, imex_mesh
+
+    init = ((4,), None, np.dtype('float64'))
+    storage = NodeStorage(3)
+    assert storage[0] is None and not storage.allocated
+    assert storage.contiguous and storage.components == []
+
+    u = mesh(init, val=1.0)
+    storage[1] = u
+    assert storage.allocated and storage.contiguous and storage.components == [None]
+    assert storage[0] is None, 'Unassigned nodes should be empty'
+    assert storage[1] is not u, 'Assigning to the storage should copy the values'
+    assert isinstance(storage[1], mesh)
+    assert np.allclose(storage.stack()[1], 1.0)
+
+    # values at the nodes are views into the stacked array
+    storage[1] += u
+    storage[2] = storage[1] * 2.0
+    assert np.allclose(storage.stack()[1:], [[2.0] * 4, [4.0] * 4])
+    assert np.shares_memory(storage[2], storage.stack())
+
+    # slicing behaves like lists
+    other = NodeStorage(3)
+    other[:] = storage[:]
+    assert other[0] is None and np.allclose(other[2], 4.0)
+
+    # resetting keeps the memory
+    stack = storage.stack()
+    storage.reset()
+    assert all(me is None for me in storage)
+    storage[0] = u
+    assert storage.stack() is not None and np.shares_memory(storage.stack(), stack)
+
+    # composite datatypes are stacked per component
+    f_storage = NodeStorage(2)
+    f = imex_mesh(init, val=3.0)
+    f_storage[1] = f
+    assert sorted(f_storage.components) == ['expl', 'impl']
+    assert isinstance(f_storage[1], imex_mesh)
+    assert np.allclose(f_storage.stack('impl')[1], 3.0)
+    assert np.shares_memory(f_storage[1].expl, f_storage.stack('expl'))
+
+    # datatypes that cannot be stacked fall back to lists
+    s_storage = NodeStorage(2)
+    s_storage[0] = 1.0
+    assert not s_storage.contiguous and s_storage.components == [] and s_storage[0] == 1.0
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('sweeper', ['imex', 'implicit'])
+@pytest.mark.parametrize('num_procs', [1, 3])
+def test_same_results(sweeper, num_procs):
+    import numpy as np
+    from pySDC.core.Level import NodeStorage
+    from pySDC.helpers.stats_helper import get_sorted
+
+    results = {}
+    for contiguous_storage in [False, True]:
+        uend, stats, controller = run(contiguous_storage, num_procs=num_procs, sweeper=sweeper)
+        results[contiguous_storage] = (uend, get_sorted(stats, type='residual_post_iteration'))
+
+        L = controller.MS[0].levels[-1]
+        assert isinstance(L.u, NodeStorage) == contiguous_storage
+        if contiguous_storage:
+            assert L.u.stack().shape == (len(L.u), L.prob.init[0])
+
+    assert np.allclose(results[True][0], results[False][0], atol=1e-14, rtol=0)
+    assert results[True][1] == results[False][1], 'Residuals differ between storage modes'
+
+
+@pytest.mark.base
+def test_copy_step():
+    import dill
+    import numpy as np
+
+    _, _, controller = run(True, num_procs=1, nlevels=1)
+    L = controller.MS[0].levels[0]
+    L_copy = dill.copy(L)
+
+    assert np.allclose(L_copy.u.stack(), L.u.stack())
+    assert np.shares_memory(L_copy.u[-1], L_copy.u.stack()), 'Copied storage should consist of views'
+    assert not np.shares_memory(L_copy.u.stack(), L.u.stack())
+    assert L_copy.u[-1].comm is None
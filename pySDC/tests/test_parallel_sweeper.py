@@ -0,0 +1,110 @@
+import pytest
+
+
+def run_heat(sweeper_class, QI, solver_type='direct', return_problem=False, **kwargs):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    description = {
+        'problem_class': heatNd_unforced,
+        'problem_params': {'nu': 0.1, 'freq': 2, 'nvars': (15, 15), 'bc': 'dirichlet-zero', 'solver_type': solver_type},
+        'sweeper_class': sweeper_class,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': QI, **kwargs},
+        'level_params': {'dt': 0.1, 'restol': 1e-10},
+        'step_params': {'maxiter': 50},
+    }
+    controller = controller_nonMPI(num_procs=2, controller_params={'logger_level': 30}, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.4)
+    return (uend, stats, P) if return_problem else (uend, stats)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+@pytest.mark.parametrize('QI', ['IEpar', 'MIN'])
+def test_same_results(executor, QI):
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.generic_implicit_parallel import generic_implicit_parallel
+
+    uend_serial, stats_serial = run_heat(generic_implicit, QI)
+    uend, stats = run_heat(generic_implicit_parallel, QI, executor=executor)
+
+    assert np.allclose(uend, uend_serial, atol=1e-13)
+    assert get_sorted(stats, type='niter') == get_sorted(stats_serial, type='niter')
+
+
+@pytest.mark.base
+def test_parameters():
+    from pySDC.core.Errors import ParameterError
+    from pySDC.implementations.sweeper_classes.generic_implicit_parallel import generic_implicit_parallel
+
+    with pytest.raises(ParameterError):
+        generic_implicit_parallel({'num_nodes': 3, 'quad_type': 'RADAU-RIGHT', 'QI': 'LU'})
+    with pytest.raises(ParameterError):
+        generic_implicit_parallel({'num_nodes': 3, 'quad_type': 'RADAU-RIGHT', 'executor': 'MPI'})
+
+    sweeper = generic_implicit_parallel({'num_nodes': 3, 'quad_type': 'RADAU-RIGHT'})
+    assert sweeper.params.QI == 'IEpar' and sweeper.params.num_workers == 3
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_work_counters(executor):
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.generic_implicit_parallel import (
+        generic_implicit_parallel,
+        shutdown_pools,
+        _pools,
+    )
+
+    niter = {}
+    for sweeper_class in [generic_implicit, generic_implicit_parallel]:
+        _, _, P = run_heat(sweeper_class, 'IEpar', executor=executor, solver_type='CG', return_problem=True)
+        niter[sweeper_class] = P.work_counters['CG'].niter
+
+    # the work done in worker processes is counted in the main process as well
+    assert niter[generic_implicit] > 0
+    assert niter[generic_implicit_parallel] == niter[generic_implicit]
+
+    shutdown_pools()
+    assert len(_pools) == 0
+
+
+@pytest.mark.base
+def test_pickle_mesh():
+    import pickle
+    import numpy as np
+    from pySDC.implementations.datatype_classes.mesh import mesh
+
+    u = mesh(((4, 3), None, np.dtype('float64')), val=2.0)
+    u_copy = pickle.loads(pickle.dumps(u))
+
+    assert type(u_copy) == mesh and u_copy.comm is None
+    assert np.allclose(u_copy, u) and u_copy.shape == u.shape
+
+
+@pytest.mark.base
+def test_process_pool_lifetime():
+    import gc
+    import numpy as np
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.sweeper_classes.generic_implicit_parallel import get_pool, _pools
+
+    P = heatNd_unforced(nvars=(15,), bc='dirichlet-zero')
+    pool = get_pool('process', 2, P)
+    assert get_pool('process', 2, P) is pool
+
+    # changing a parameter sends a new copy of the problem to new workers
+    P.lintol = 1e-5
+    new_pool = get_pool('process', 2, P)
+    assert new_pool is not pool
+    assert new_pool.submit(np.sum, np.ones(3)).result() == 3
+
+    # the pool is shut down when the problem is discarded
+    num_pools = len(_pools)
+    del P
+    gc.collect()
+    assert len(_pools) == num_pools - 1
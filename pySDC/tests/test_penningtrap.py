@@ -0,0 +1,133 @@
+import pytest
+
+
+def get_problem(nparts):
+    import numpy as np
+    from pySDC.implementations.problem_classes.PenningTrap_3D import penningtrap
+
+    return penningtrap(
+        omega_B=25.0,
+        omega_E=4.9,
+        u0=np.array([[10, 0, 0], [100, 0, 100], [1], [1]], dtype=object),
+        nparts=nparts,
+        sig=0.1,
+    )
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('nparts', [1, 10, 100])
+def test_same_as_loops(nparts):
+    """
+    Compare the array-wide implementations with loops over the particles as they were implemented before
+    """
+    import numpy as np
+
+    P = get_problem(nparts)
+    rng = np.random.default_rng(nparts)
+
+    part = P.u_init()
+    part.q[:] = rng.random(nparts) + 0.5
+    part.m[:] = rng.random(nparts) + 0.5
+    f = P.eval_f(part, 0.0)
+
+    # external field
+    elec = P.get_interactions(part)
+    for n in range(nparts):
+        elec[:, n] += P.omega_E**2 / (part.q[n] / part.m[n]) * np.dot(np.diag([1, 1, -2]), part.pos[:, n])
+        assert np.array_equal(f.magn[:, n], P.omega_B * np.array([0, 0, 1]))
+    assert np.array_equal(f.elec, elec)
+
+    # right hand side
+    rhs = P.build_f(f, part, 0.0)
+    for n in range(nparts):
+        expect = part.q[n] / part.m[n] * (f.elec[:, n] + np.cross(part.vel[:, n], f.magn[:, n]))
+        assert np.array_equal(rhs[:, n], expect)
+
+    # Boris solver
+    new_fields = P.dtype_f(P.init)
+    new_fields.elec[:] = rng.random((3, nparts))
+    new_fields.magn[:] = rng.random((3, nparts))
+    c = P.dtype_u(P.init).vel
+    c[:] = rng.random((3, nparts))
+    c_expect = np.array(c)
+
+    vel = P.boris_solver(c, 0.1, f, new_fields, part)
+    for n in range(nparts):
+        dt, a = 0.1, part.q[n] / part.m[n]
+        Emean = 0.5 * (f.elec[:, n] + new_fields.elec[:, n])
+        c_expect[:, n] += dt / 2 * a * np.cross(part.vel[:, n], f.magn[:, n] - new_fields.magn[:, n])
+        vm = part.vel[:, n] + dt / 2 * a * Emean + c_expect[:, n] / 2
+        t = dt / 2 * a * new_fields.magn[:, n]
+        s = 2 * t / (1 + np.linalg.norm(t, 2) ** 2)
+        vp = vm + np.cross(vm + np.cross(vm, t), s)
+        assert np.allclose(vel[:, n], vp + dt / 2 * a * Emean + c_expect[:, n] / 2, rtol=1e-15, atol=0)
+    assert np.array_equal(c, c_expect), 'The c term is not updated in place'
+
+
+@pytest.mark.base
+def test_u_init():
+    import numpy as np
+
+    P = get_problem(10)
+    u = P.u_init()
+
+    np.random.seed(10)
+    for n in range(1, 10):
+        assert np.array_equal(u.pos[:, n], np.random.random_sample(3) - 1 + np.array([10, 0, 0]))
+        assert np.array_equal(u.vel[:, n], np.random.random_sample(3) - 5 + np.array([100, 0, 100]))
+    assert np.array_equal(u.pos[:, 0], [10, 0, 0]) and np.array_equal(u.vel[:, 0], [100, 0, 100])
+    assert np.all(u.q == 1) and np.all(u.m == 1)
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('leaf_size', [1, 8])
+def test_tree_interactions(leaf_size):
+    """
+    Compare the Barnes-Hut approximation with the direct sum for different opening angles
+    """
+    import numpy as np
+
+    P = get_problem(500)
+    part = P.u_init()
+    part.pos[:, ::2] += 3.0  # make the distribution less uniform
+    part.q[::3] = -1.0
+    direct = P.get_interactions(part)
+
+    P.interactions = 'tree'
+    P.leaf_size = leaf_size
+    errors = []
+    for theta in [0.0, 0.3, 0.6, 1.0]:
+        P.theta = theta
+        tree = P.get_interactions(part)
+        errors.append(np.linalg.norm(tree - direct) / np.linalg.norm(direct))
+
+    assert errors[0] < 1e-13, 'Opening all nodes should reproduce the direct sum'
+    assert all(errors[i] < errors[i + 1] for i in range(len(errors) - 1)), f'Error does not grow with theta: {errors}'
+    assert errors[1] < 1e-2, f'Too large error for theta = 0.3: {errors[1]}'
+    assert errors[2] < 5e-2, f'Too large error for theta = 0.6: {errors[2]}'
+
+
+@pytest.mark.base
+def test_tree_degenerate():
+    """
+    Test the tree with coincident particles and a single particle, which need to stop refining at `max_depth`
+    """
+    import numpy as np
+    from pySDC.core.Errors import ProblemError
+
+    for nparts in [1, 20]:
+        P = get_problem(nparts)
+        part = P.u_init()
+        part.pos[:, : nparts // 2] = 1.0
+        direct = P.get_interactions(part)
+
+        P.interactions = 'tree'
+        P.leaf_size = 1
+        P.max_depth = 4
+        P.theta = 0.0
+        assert np.allclose(P.get_interactions(part), direct, rtol=1e-12, atol=1e-12)
+
+    with pytest.raises(ProblemError):
+        get_problem(10).__class__(
+            omega_B=25.0, omega_E=4.9, u0=P.u0, nparts=10, sig=0.1, interactions='fast multipole method'
+        )
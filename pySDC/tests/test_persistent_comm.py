@@ -0,0 +1,79 @@
+import pytest
+
+
+def run_heat(comm=None, num_procs=1, persistent_comm=False, predict_type=None):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.helpers.stats_helper import get_sorted
+
+    description = {
+        'problem_class': heatNd_unforced,
+        'problem_params': {'nu': 0.1, 'freq': 2, 'nvars': [(63,), (31,)], 'bc': 'dirichlet-zero'},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': [5, 3], 'QI': 'LU'},
+        'level_params': {'dt': 0.1, 'restol': 1e-10},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+    }
+    controller_params = {'logger_level': 30, 'persistent_comm': persistent_comm, 'predict_type': predict_type}
+
+    if comm is None:
+        from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+        controller = controller_nonMPI(
+            num_procs=num_procs, controller_params=controller_params, description=description
+        )
+        P = controller.MS[0].levels[0].prob
+    else:
+        from pySDC.implementations.controller_classes.controller_MPI import controller_MPI
+
+        controller = controller_MPI(controller_params=controller_params, description=description, comm=comm)
+        P = controller.S.levels[0].prob
+
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=1.0)
+    niter = [me[1] for me in get_sorted(stats, type='niter', sortby='time', comm=comm)]
+    return uend, niter
+
+
+def check_persistent_comm(comm, predict_type):
+    import numpy as np
+
+    num_procs = comm.Get_size()
+    uend_nonMPI, niter_nonMPI = run_heat(num_procs=num_procs, predict_type=predict_type)
+
+    for persistent_comm in [False, True]:
+        uend, niter = run_heat(comm=comm, persistent_comm=persistent_comm, predict_type=predict_type)
+        assert np.allclose(
+            uend, uend_nonMPI, rtol=0, atol=1e-12
+        ), f'Got different solution with persistent_comm={persistent_comm}'
+        assert niter == niter_nonMPI, f'Got different iteration counts with persistent_comm={persistent_comm}'
+
+
+@pytest.mark.mpi4py
+@pytest.mark.parametrize('num_procs', [1, 3])
+@pytest.mark.parametrize('predict_type', ['pfasst_burnin', 'fmg'])
+def test_persistent_comm(num_procs, predict_type):
+    import os
+    import subprocess
+
+    # Setup environment
+    my_env = os.environ.copy()
+    my_env['PYTHONPATH'] = '../../..:.'
+    cwd = '.'
+
+    cmd = f'mpirun -np {num_procs} python {__file__} {predict_type}'.split()
+
+    p = subprocess.Popen(cmd, env=my_env, cwd=cwd)
+    p.wait()
+    assert p.returncode == 0, 'ERROR: did not get return code 0, got %s with %2i processes' % (
+        p.returncode,
+        num_procs,
+    )
+
+
+if __name__ == '__main__':
+    import sys
+    from mpi4py import MPI
+
+    check_persistent_comm(MPI.COMM_WORLD, predict_type=sys.argv[1])
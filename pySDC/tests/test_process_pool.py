@@ -0,0 +1,94 @@
+import pytest
+
+
+def run_heat(num_procs, nvars, sweeper, execution_backend, mssdc_jac=True):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced, heatNd_forced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.sweeper_classes.imex_1st_order import imex_1st_order
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    description = {
+        'problem_class': heatNd_unforced if sweeper == 'implicit' else heatNd_forced,
+        'problem_params': {
+            'nu': 0.1,
+            'freq': 2,
+            'nvars': nvars,
+            'bc': 'dirichlet-zero',
+            'solver_type': 'CG',
+            'lintol': 1e-12,
+        },
+        'sweeper_class': generic_implicit if sweeper == 'implicit' else imex_1st_order,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'dt': 0.1, 'restol': 1e-10},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+    }
+    controller_params = {
+        'logger_level': 30,
+        'mssdc_jac': mssdc_jac,
+        'execution_backend': execution_backend,
+    }
+    controller = controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    try:
+        uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.8)
+        work = [{key: me.niter for key, me in L.prob.work_counters.items()} for S in controller.MS for L in S.levels]
+    finally:
+        controller.close()
+    return uend, stats, work
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_procs', [1, 4])
+@pytest.mark.parametrize('nvars', [[(31,)], [(31,), (15,)], [(63,), (31,), (15,)]])
+@pytest.mark.parametrize('sweeper', ['implicit', 'imex'])
+def test_same_as_serial(num_procs, nvars, sweeper):
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+
+    uend, stats, work = run_heat(num_procs, nvars, sweeper, 'processes')
+    uend_serial, stats_serial, work_serial = run_heat(num_procs, nvars, sweeper, 'serial')
+
+    assert np.allclose(uend, uend_serial, rtol=0, atol=1e-14)
+    assert work == work_serial
+    for key in ['niter', 'residual_post_iteration']:
+        result = get_sorted(stats, type=key, sortby='time')
+        expected = get_sorted(stats_serial, type=key, sortby='time')
+        assert [me[0] for me in result] == [me[0] for me in expected]
+        assert np.allclose([me[1] for me in result], [me[1] for me in expected], rtol=0, atol=1e-14), key
+
+
+@pytest.mark.base
+def test_worker_error():
+    import numpy as np
+    from pySDC.core.Errors import ControllerError
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    with pytest.raises(ControllerError):
+        run_heat(2, [(31,)], 'implicit', 'threads')
+
+    description = {
+        'problem_class': testequation0d,
+        'problem_params': {'lambdas': np.array([-1.0 + 0j]), 'u0': 1.0},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'dt': 0.1, 'restol': 1e-12},
+        'step_params': {'maxiter': 20},
+    }
+    controller_params = {'logger_level': 30, 'execution_backend': 'processes'}
+    controller = controller_nonMPI(num_procs=2, controller_params=controller_params, description=description)
+    try:
+        # sweeping on a step that has not been initialized fails in the worker and is raised by the controller
+        with pytest.raises(AssertionError):
+            controller.process_pool.sweep(controller.MS, level=0, stage='IT_FINE')
+
+        # the workers are still usable afterwards
+        P = controller.MS[0].levels[0].prob
+        uend, _ = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.4)
+        assert np.isclose(uend[0], np.exp(-0.4), atol=1e-6)
+    finally:
+        controller.close()
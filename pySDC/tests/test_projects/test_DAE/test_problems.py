@@ -370,3 +370,31 @@ def test_synchgen_infinite_bus_main():
     # check error
     err = np.linalg.norm(uend - uend_ref, np.inf)
     assert np.isclose(err, 0.0, atol=1e-4), "Error too large."
+
+
+@pytest.mark.base
+def test_jacobians_main():
+    from pySDC.projects.DAE.misc.ProblemDAE import ptype_dae
+    from pySDC.projects.DAE.problems.simple_DAE import pendulum_2d, simple_dae_1, problematic_f
+    from pySDC.projects.DAE.problems.transistor_amplifier import one_transistor_amplifier, two_transistor_amplifier
+    from pySDC.projects.DAE.problems.synchronous_machine import synchronous_machine_infinite_bus
+
+    rng = np.random.default_rng(0)
+    problems = [
+        (pendulum_2d, 5),
+        (simple_dae_1, 3),
+        (problematic_f, 2),
+        (one_transistor_amplifier, 5),
+        (two_transistor_amplifier, 8),
+        (synchronous_machine_infinite_bus, 14),
+    ]
+    for problem_class, nvars in problems:
+        prob = problem_class(nvars=nvars, newton_tol=1e-12)
+        u = prob.u_exact(0.1) if problem_class == simple_dae_1 else prob.u_exact(0.0)
+        u[:] += 1e-2 * rng.random(nvars)
+        du = prob.dtype_u(prob.init)
+        du[:] = rng.random(nvars)
+
+        # compare the analytic Jacobians to the finite difference approximations of the base class
+        for jac, jac_fd in zip(prob.eval_jacobian(u, du, 0.1), ptype_dae.eval_jacobian(prob, u, du, 0.1)):
+            assert np.allclose(jac, jac_fd, rtol=1e-5, atol=1e-6 * np.max(abs(jac))), problem_class.__name__
@@ -192,3 +192,33 @@ def test_compute_end_point_main():
     L.sweep.compute_end_point()
 
     assert np.array_equal(L.uend, L.u[0]), "ERROR: end point not computed correctly"
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('newton_update', ['full', 'chord'])
+def test_implicit_solver_main(newton_update):
+    from pySDC.projects.DAE.problems.synchronous_machine import synchronous_machine_infinite_bus
+    from pySDC.projects.DAE.sweepers.fully_implicit_DAE import fully_implicit_DAE
+    from pySDC.core.Step import step
+
+    u = {}
+    for implicit_solver in ['scipy', 'newton']:
+        description = dict()
+        description['problem_class'] = synchronous_machine_infinite_bus
+        description['problem_params'] = {'newton_tol': 1e-12, 'nvars': 14, 'newton_update': newton_update}
+        description['sweeper_class'] = fully_implicit_DAE
+        description['sweeper_params'] = {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'implicit_solver': implicit_solver}
+        description['level_params'] = {'dt': 1e-3}
+
+        S = step(description=description)
+        L = S.levels[0]
+        L.status.time = 0.0
+        L.u[0] = L.prob.u_exact(L.time)
+        L.sweep.predict()
+        for _ in range(3):
+            L.sweep.update_nodes()
+        u[implicit_solver] = [me.copy() for me in L.u[1:]]
+
+    # the implicit systems are solved by Newton's method with analytic Jacobians instead of scipy
+    for u_newton, u_scipy in zip(u['newton'], u['scipy']):
+        assert np.allclose(u_newton, u_scipy, rtol=1e-9, atol=1e-9)
@@ -0,0 +1,55 @@
+import pytest
+
+
+def get_problem_and_bodies(nbodies, sun_only=False):
+    """
+    Get the outer solar system problem with a random set of bodies
+
+    Args:
+        nbodies (int): Number of bodies
+        sun_only (bool): Whether to compute the gravitational forces only with respect to the sun
+
+    Returns:
+        outer_solar_system: The problem
+        particles: The bodies
+    """
+    import numpy as np
+    from pySDC.implementations.problem_classes.OuterSolarSystem import outer_solar_system
+
+    P = outer_solar_system(sun_only=sun_only)
+    P.init = ((3, nbodies), None, np.dtype('float64'))
+
+    rng = np.random.default_rng(nbodies)
+    u = P.dtype_u(P.init)
+    u.pos[:] = rng.random((3, nbodies)) * 20 - 10
+    u.vel[:] = rng.random((3, nbodies)) * 1e-2
+    u.m[:] = rng.random(nbodies) * 1e-3
+    return P, u
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('nbodies', [2, 6, 50])
+@pytest.mark.parametrize('sun_only', [True, False])
+def test_same_as_loops(nbodies, sun_only):
+    """
+    Compare the broadcasted implementations with loops over all pairs of bodies
+    """
+    import numpy as np
+
+    P, u = get_problem_and_bodies(nbodies, sun_only)
+
+    acc = np.zeros((3, nbodies))
+    ham = 0.0
+    for i in range(nbodies):
+        ham += 0.5 * u.m[i] * np.dot(u.vel[:, i], u.vel[:, i])
+        for j in range(i):
+            dx = u.pos[:, i] - u.pos[:, j]
+            r = np.sqrt(np.dot(dx, dx))
+            ham -= P.G * u.m[i] * u.m[j] / r
+            if not sun_only or j == 0:
+                acc[:, i] -= u.m[j] * P.G * dx / r**3
+            if not sun_only:
+                acc[:, j] += u.m[i] * P.G * dx / r**3
+
+    assert np.allclose(P.eval_f(u, 0.0), acc, rtol=0, atol=1e-13 * np.abs(acc).max())
+    assert np.isclose(P.eval_hamiltonian(u), ham, rtol=1e-13, atol=0)
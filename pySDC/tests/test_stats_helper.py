@@ -0,0 +1,127 @@
+import pytest
+
+
+def run_with_restarts(num_procs, **kwargs):
+    import numpy as np
+    from pySDC.implementations.problem_classes.TestEquation_0D import testequation0d
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+    from pySDC.implementations.convergence_controller_classes.adaptivity import Adaptivity
+
+    description = {
+        'problem_class': testequation0d,
+        'problem_params': {'lambdas': np.array([-1.0 + 0j, -10.0 + 1j]), 'u0': 1.0},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'dt': 0.5, 'restol': -1},
+        'step_params': {'maxiter': 4},
+        'convergence_controllers': {Adaptivity: {'e_tol': 1e-6}},
+    }
+    controller_params = {'logger_level': 30, 'mssdc_jac': False, **kwargs}
+    controller = controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+    P = controller.MS[0].levels[0].prob
+    _, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=2.0)
+    return stats
+
+
+@pytest.mark.base
+def test_columnar_stats():
+    import dill
+    from collections import namedtuple
+    from pySDC.helpers.stats_helper import ColumnarStats, get_list_of_types
+
+    Entry = namedtuple('Entry', ['process', 'time', 'level', 'iter', 'sweep', 'type', 'num_restarts'])
+    stats = ColumnarStats()
+    for i in range(6):
+        stats[Entry(i % 2, i / 4, 0, i, 1, 'a' if i < 4 else 'b', 0)] = i
+
+    assert list(stats.select(type='a', process=1).keys()) == [
+        Entry(1, 0.25, 0, 1, 1, 'a', 0),
+        Entry(1, 0.75, 0, 3, 1, 'a', 0),
+    ]
+    assert len(stats.select(type='c')) == 0
+    assert stats.select(process='not a number') is None
+
+    # deleting and re-adding entries keeps the order of insertion
+    key = Entry(0, 0.0, 0, 0, 1, 'a', 0)
+    assert stats.pop(key) == 0
+    assert key not in stats and key not in stats.select(type='a')
+    stats[key] = 10
+    assert list(stats.select(type='a').keys())[-1] == key
+    assert get_list_of_types(stats) == get_list_of_types(dict(stats)) == ['a', 'b']
+    assert stats.sorted_items('time') == sorted((me.time, stats[me]) for me in stats.keys())
+
+    copies = [stats.copy(), dill.loads(dill.dumps(stats)), ColumnarStats(**{})]
+    copies[-1].update(stats)
+    for other in copies:
+        assert isinstance(other, ColumnarStats) and other == stats
+        assert list(other.select(type='a').items()) == list(stats.select(type='a').items())
+
+    # keys without the usual fields make queries fall back to loops
+    stats['irregular'] = None
+    assert stats.select() is None and stats.sorted_items('time') is None
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_procs', [1, 3])
+def test_same_as_dict(num_procs):
+    from pySDC.helpers.stats_helper import ColumnarStats, filter_stats, get_sorted, get_list_of_types, sort_stats
+
+    stats = run_with_restarts(num_procs)
+    assert isinstance(stats, ColumnarStats)
+    plain = dict(stats)
+
+    assert any(me.num_restarts > 0 for me in stats.keys()), 'Test requires restarts'
+    assert get_list_of_types(stats) == get_list_of_types(plain)
+
+    queries = [
+        {},
+        {'type': 'niter'},
+        {'type': 'residual_post_iteration', 'process': 0},
+        {'type': 'dt', 'recomputed': False},
+        {'type': 'e_global_post_step', 'recomputed': False},
+        {'time': 0.5},
+        {'level': 0, 'iter': 2},
+        {'type': 'niter', 'num_restarts': 1},
+        {'type': 'unknown'},
+    ]
+    for query in queries:
+        for sortby in ['time', 'iter', 'process']:
+            assert get_sorted(stats, sortby=sortby, **query) == get_sorted(plain, sortby=sortby, **query), query
+        assert list(filter_stats(stats, **query).items()) == list(filter_stats(plain, **query).items()), query
+    assert sort_stats(stats, sortby='type') == sort_stats(plain, sortby='type')
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_procs', [1, 3])
+def test_streaming(num_procs, tmp_path):
+    import os
+    import numpy as np
+    from pySDC.helpers.stats_helper import ColumnarStats, filter_stats, get_sorted, get_list_of_types
+    from pySDC.helpers.stats_sink import LazyStats, read_stats
+    from pySDC.implementations.hooks.log_solution import LogSolution
+
+    stats_memory = run_with_restarts(num_procs, hook_class=LogSolution)
+    stats = run_with_restarts(num_procs, hook_class=LogSolution, stats_path=str(tmp_path), stats_chunk_size=20)
+
+    assert isinstance(stats, LazyStats)
+    assert len([me for me in os.listdir(tmp_path) if 'index_' in me]) > 2, 'Stats were not written in chunks'
+    assert list(stats.keys()) == list(stats_memory.keys())
+    assert get_list_of_types(stats) == get_list_of_types(stats_memory)
+
+    for query in [{'type': 'u'}, {'type': 'dt', 'recomputed': False}, {'type': 'niter', 'process': 0}]:
+        filtered = filter_stats(stats, **query)
+        assert type(filtered) is ColumnarStats
+        assert list(filtered.keys()) == list(filter_stats(stats_memory, **query).keys())
+
+        result = get_sorted(stats, **query)
+        expected = get_sorted(stats_memory, **query)
+        assert [me[0] for me in result] == [me[0] for me in expected]
+        assert all(np.allclose(me[1], you[1]) for me, you in zip(result, expected))
+
+    # reading the stats again from disk
+    stats_read = read_stats(str(tmp_path))
+    assert sorted(stats_read.keys()) == sorted(stats.keys())
+    for key, value in stats_memory.items():
+        if not key.type.startswith('timing'):
+            assert np.allclose(stats_read[key], value), key
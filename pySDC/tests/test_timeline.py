@@ -0,0 +1,144 @@
+import pytest
+
+
+def run_heat(num_procs, trace_path=None, hook_class=None, comm=None):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+
+    description = {
+        'problem_class': heatNd_unforced,
+        'problem_params': {'nu': 0.1, 'freq': 2, 'nvars': [(31,), (15,)], 'bc': 'dirichlet-zero'},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'dt': 0.1, 'restol': 1e-10},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+    }
+    controller_params = {'logger_level': 30, 'trace_path': trace_path, 'hook_class': hook_class or []}
+
+    if comm is None:
+        from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+        controller = controller_nonMPI(
+            num_procs=num_procs, controller_params=controller_params, description=description
+        )
+        P = controller.MS[0].levels[0].prob
+    else:
+        from pySDC.implementations.controller_classes.controller_MPI import controller_MPI
+
+        controller = controller_MPI(controller_params=controller_params, description=description, comm=comm)
+        P = controller.S.levels[0].prob
+
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.4)
+    return uend, stats, controller
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_procs', [1, 4])
+def test_timeline(num_procs, tmpdir):
+    import json
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+    from pySDC.implementations.hooks.log_timeline import LogTimeline
+
+    uend, stats, controller = run_heat(num_procs, trace_path=str(tmpdir))
+    uend_ref, stats_ref, _ = run_heat(num_procs)
+    assert np.allclose(uend, uend_ref, rtol=0, atol=1e-14)
+
+    with open(f'{tmpdir}/timeline.json', 'r') as file:
+        events = json.load(file)['traceEvents']
+
+    complete = [me for me in events if me['ph'] == 'X']
+    for name in ['setup', 'run', 'predict', 'step', 'iteration', 'sweep', 'comm', 'restrict', 'prolong']:
+        assert name in [me['name'] for me in complete], f'No events recorded for {name!r}'
+    assert all(me['dur'] >= 0 for me in complete)
+
+    # the run is placed on the track of every step and contains all events of the step
+    runs = {me['pid']: me for me in complete if me['name'] == 'run'}
+    assert sorted(runs.keys()) == list(range(num_procs))
+    for me in complete:
+        if me['name'] != 'setup':
+            run = runs[me['pid']]
+            assert run['ts'] <= me['ts'] and me['ts'] + me['dur'] <= run['ts'] + run['dur'] + 1e-3
+
+    # evaluations and solves are recorded on the tracks of the levels
+    niter = sum(me[1] for me in get_sorted(stats_ref, type='niter'))
+    assert len([me for me in complete if me['name'] == 'iteration']) == niter
+    for name in ['eval_f', 'solve_system']:
+        tids = {me['tid'] for me in complete if me['name'] == name}
+        assert tids == {1, 2}, name
+
+    # the methods are restored after the run
+    for S in controller.MS:
+        assert 'transfer' not in vars(S)
+        for L in S.levels:
+            assert 'eval_f' not in vars(L.prob)
+
+    hook = next(me for me in controller.hooks if type(me) == LogTimeline)
+    assert hook.trace.events == events
+
+
+@pytest.mark.base
+def test_merge_traces(tmpdir):
+    import json
+    from pySDC.helpers.chrome_trace import ChromeTrace, merge_traces
+
+    paths = []
+    for pid in range(3):
+        trace = ChromeTrace()
+        trace.name_track(pid, 0, f'step {pid}', 'controller')
+        trace.name_track(pid, 0, f'step {pid}', 'controller')
+        trace.add_event('run', 'controller', trace.now(), pid, 0, args={'time': 0.0})
+        paths.append(f'{tmpdir}/rank{pid}_timeline.json')
+        trace.write(paths[-1])
+
+    merge_traces(paths, f'{tmpdir}/timeline.json')
+    with open(f'{tmpdir}/timeline.json', 'r') as file:
+        events = json.load(file)['traceEvents']
+
+    assert len(events) == 9
+    assert sorted(me['pid'] for me in events if me['ph'] == 'X') == [0, 1, 2]
+
+
+def check_timeline_MPI(comm, path):
+    from pySDC.helpers.chrome_trace import merge_traces
+
+    run_heat(comm.size, trace_path=path, comm=comm)
+    comm.Barrier()
+
+    if comm.rank == 0:
+        import json
+
+        merge_traces([f'{path}/rank{i}_timeline.json' for i in range(comm.size)], f'{path}/timeline.json')
+        with open(f'{path}/timeline.json', 'r') as file:
+            events = json.load(file)['traceEvents']
+        assert {me['pid'] for me in events if me['name'] == 'run'} == set(range(comm.size))
+
+
+@pytest.mark.mpi4py
+@pytest.mark.parametrize('num_procs', [1, 3])
+def test_timeline_MPI(num_procs, tmpdir):
+    import os
+    import subprocess
+
+    # Setup environment
+    my_env = os.environ.copy()
+    my_env['PYTHONPATH'] = '../../..:.'
+    cwd = '.'
+
+    cmd = f'mpirun -np {num_procs} python {__file__} {tmpdir}'.split()
+
+    p = subprocess.Popen(cmd, env=my_env, cwd=cwd)
+    p.wait()
+    assert p.returncode == 0, 'ERROR: did not get return code 0, got %s with %2i processes' % (
+        p.returncode,
+        num_procs,
+    )
+
+
+if __name__ == '__main__':
+    import sys
+    from mpi4py import MPI
+
+    check_timeline_MPI(MPI.COMM_WORLD, sys.argv[1])
@@ -0,0 +1,80 @@
+import pytest
+
+
+def run_heat(num_procs, nvars, zero_copy_comm, contiguous_storage):
+    from pySDC.implementations.problem_classes.HeatEquation_ND_FD import heatNd_unforced
+    from pySDC.implementations.sweeper_classes.generic_implicit import generic_implicit
+    from pySDC.implementations.transfer_classes.TransferMesh import mesh_to_mesh
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    description = {
+        'problem_class': heatNd_unforced,
+        'problem_params': {'nu': 0.1, 'freq': 2, 'nvars': nvars, 'bc': 'dirichlet-zero'},
+        'sweeper_class': generic_implicit,
+        'sweeper_params': {'quad_type': 'RADAU-RIGHT', 'num_nodes': 3, 'QI': 'LU'},
+        'level_params': {'dt': 0.1, 'restol': 1e-10, 'contiguous_storage': contiguous_storage},
+        'step_params': {'maxiter': 50},
+        'space_transfer_class': mesh_to_mesh,
+    }
+    controller_params = {'logger_level': 30, 'zero_copy_comm': zero_copy_comm}
+    controller = controller_nonMPI(num_procs=num_procs, controller_params=controller_params, description=description)
+
+    P = controller.MS[0].levels[0].prob
+    uend, stats = controller.run(u0=P.u_exact(0.0), t0=0.0, Tend=0.8)
+    return uend, stats, controller
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('num_procs', [1, 4])
+@pytest.mark.parametrize('nvars', [[(31,)], [(31,), (15,)]])
+@pytest.mark.parametrize('contiguous_storage', [True, False])
+def test_zero_copy_comm(num_procs, nvars, contiguous_storage):
+    import numpy as np
+    from pySDC.helpers.stats_helper import get_sorted
+
+    uend_expected, stats_expected, _ = run_heat(num_procs, nvars, False, contiguous_storage)
+    uend, stats, controller = run_heat(num_procs, nvars, True, contiguous_storage)
+
+    assert np.array_equal(uend, uend_expected)
+    for type in ['niter', 'residual_post_iteration']:
+        assert get_sorted(stats, type=type) == get_sorted(stats_expected, type=type)
+
+    counters = [L.prob.work_counters for S in controller.MS for L in S.levels]
+    copies = sum(me['comm_copies_avoided'].niter for me in counters)
+    rhs = sum(me['comm_rhs_avoided'].niter for me in counters)
+
+    if num_procs == 1:
+        # a single step never receives
+        assert copies == rhs == 0
+    elif len(nvars) == 1:
+        # in MSSDC, the values received before the sweep are the same as the ones received when checking convergence
+        assert rhs > 0
+        assert copies == rhs
+
+
+@pytest.mark.base
+@pytest.mark.parametrize('contiguous_storage', [True, False])
+def test_is_dirty(contiguous_storage):
+    import numpy as np
+    from pySDC.implementations.controller_classes.controller_nonMPI import controller_nonMPI
+
+    _, _, controller = run_heat(2, [(31,), (15,)], True, contiguous_storage)
+    source, target = controller.MS[0].levels[0], controller.MS[1].levels[0]
+    source.uend = source.prob.u_exact(0.0)
+
+    controller.recv_zero_copy(target, source)
+    assert not controller.is_dirty(target, source)
+    assert np.array_equal(target.u[0], source.uend)
+
+    # assigning the end point marks it as changed, also when done in place
+    source.uend += 1.0
+    assert controller.is_dirty(target, source)
+    controller.recv_zero_copy(target, source)
+    assert not controller.is_dirty(target, source)
+
+    # setting the initial conditions otherwise, e.g. by restriction, requires receiving them again
+    S = controller.MS[1]
+    S.transfer(source=S.levels[0], target=S.levels[1])
+    assert controller.is_dirty(S.levels[1], controller.MS[0].levels[1])
+    S.init_step(source.uend)
+    assert controller.is_dirty(target, source)